@@ -59,5 +59,7 @@ else:
 kwargs["threads"] = args.threads
 kwargs["path"] = args.path
 kwargs["jit" ] = args.jit
+kwargs["no_cache"] = args.no_cache
+kwargs["resume"] = args.resume
 
 run(**kwargs)
@@ -7,6 +7,7 @@ Create an EOS class from options taken from factory design pattern.
 # Add imports here
 from importlib import import_module
 import logging
+import copy
 
 class jit_stat:
     disable_jit = True
@@ -54,7 +55,11 @@ def eos(**kwargs):
         eos_module = import_module('.' + eos, package="despasito.equations_of_state." + eos_fam)
         class_name = "_".join([eos_fam, eos])
         eos_class = getattr(eos_module, class_name)
+        # Definition of the eos, used to identify stored results
+        eos_inputs = copy.deepcopy({key: value for key, value in kwargs.items() if key != 'jit'})
+        eos_inputs["eos"] = eos_type
         instance = eos_class(kwargs)
+        instance._eos_inputs = eos_inputs
     except (AttributeError):
         raise ImportError(
             "Based on your input, '{}', we expect the class, {}, in a module, {}, found in the package, {}, which indicates the EOS family.".format(eos_type, class_name, eos, eos_fam))
@@ -101,6 +101,9 @@ class cubic_peng_robinson(EOStemplate):
         self.aij = np.nan
         self.bij = np.nan
 
+        # Incremented whenever a parameter is changed, so that stored thermodynamic results may be identified as outdated
+        self._parameter_version = 0
+
     def _calc_temp_dependent_parameters(self,T):
         """
         Compute ai and alpha given temperature
@@ -245,6 +248,94 @@ class cubic_peng_robinson(EOStemplate):
 
         return phi
 
+    def fugacity_coefficient_batch(self, P, rho, xi, T):
+
+        """
+        Compute fugacity coefficients of a series of state points at the same temperature in one evaluation
+      
+        Parameters
+        ----------
+        P : numpy.ndarray
+            Pressure of each state point [Pa]
+        rho : numpy.ndarray
+            Molar density of each state point [mol/m^3]
+        xi : numpy.ndarray
+            Mole fractions of each state point, where each row sums to 1.0
+        T : float
+            Temperature of the system [K]
+    
+        Returns
+        -------
+        phi : numpy.ndarray
+            Array of fugacity coefficients, one row for each state point
+        """
+
+        if T != self.T:
+            self.T = T
+            self._calc_temp_dependent_parameters(T)
+
+        P = np.array(P, float)
+        rho = np.array(rho, float)
+        xi = np.array(xi, float)
+
+        sqrtai = np.sqrt(self.ai*self.alpha)
+        aij_matrix = np.outer(sqrtai, sqrtai)*(1.-self._kij)
+        aij = np.einsum("ni,ij,nj->n", xi, aij_matrix, xi)
+        bij = np.dot(xi, self.bi)
+
+        RT = self._R*T
+        Z = P/(RT*rho)
+        A = aij*P/RT**2
+        B = bij*P/RT
+        Bi = np.outer(P/RT, self.bi)
+        xAij = np.dot(xi, aij_matrix)*(P/RT**2)[:, np.newaxis]
+
+        sqrt2 = np.sqrt(2.0)
+        tmp1 = A/(2.0*sqrt2*B)*np.log((Z+(1+sqrt2)*B)/(Z+(1-sqrt2)*B))
+        tmp2 = Bi/B[:, np.newaxis] - 2*xAij/A[:, np.newaxis]
+        tmp3 = Bi*((Z-1)/B)[:, np.newaxis] - np.log(Z-B)[:, np.newaxis]
+        phi = np.exp(tmp1[:, np.newaxis]*tmp2+tmp3)
+
+        return phi
+
+    def residual_helmholtz_energy(self, rho, T, xi):
+        r"""
+        Compute residual Helmholtz energy, :math:`A^{res}/(N k_B T)`, given system information
+       
+        Parameters
+        ----------
+        rho : numpy.ndarray
+            Number density of system [mol/m^3]
+        T : float
+            Temperature of the system [K]
+        xi : list[float]
+            Mole fraction of each component
+       
+        Returns
+        -------
+        Ares : numpy.ndarray
+            Array of residual Helmholtz energy values associated with each density and so equal in length
+        """
+
+        #logger = logging.getLogger(__name__)
+
+        if T != self.T:
+            self.T = T
+            self._calc_temp_dependent_parameters(T)
+
+        self._calc_mixed_parameters(xi,T)
+
+        if np.isscalar(rho):
+            rho = np.array([rho])
+        elif type(rho) != np.ndarray:
+            rho = np.array(rho)
+
+        sqrt2 = np.sqrt(2.0)
+        B = self.bij*rho
+        Ares = -np.log(1-B) - self.aij/(2.0*sqrt2*self.bij*self._R*T)*np.log((1+(1+sqrt2)*B)/(1+(1-sqrt2)*B))
+
+        return Ares
+
     def density_max(self, xi, T, maxpack=0.9):
 
         """
@@ -424,6 +515,33 @@ class cubic_peng_robinson(EOStemplate):
         else:
             raise ValueError("The parameter name %s is not found in the allowed parameter types: %s" % (param_name,", ".join(param_types)))
 
+        self._parameter_version += 1
+
+    def __getstate__(self):
+        r"""
+        Reduce the object to its parameter tables and configuration when it's pickled (e.g. sent to another process). Temperature dependent variables and stored thermodynamic results are recomputed as they are needed once it's loaded.
+        """
+
+        state = {"beads": self._beads, "beadlibrary": self._beadlibrary, "ai": self.ai, "bi": self.bi, "kij": self._kij}
+        state["parameter_version"] = self._parameter_version
+        if hasattr(self, "_eos_inputs"):
+            state["eos_inputs"] = self._eos_inputs
+
+        return state
+
+    def __setstate__(self, state):
+        r"""
+        Rebuild the object from the parameter tables and configuration produced by __getstate__. Values of ai, bi, and kij are restored after initialization, since they may have been updated during parameter fitting.
+        """
+
+        self.__init__({"beads": state["beads"], "beadlibrary": state["beadlibrary"]})
+        self.ai = np.array(state["ai"])
+        self.bi = np.array(state["bi"])
+        self._kij = np.array(state["kij"])
+        self._parameter_version = state["parameter_version"]
+        if "eos_inputs" in state:
+            self._eos_inputs = state["eos_inputs"]
+
     def __str__(self):
 
         string = "Beads:" + str(self._beads) + "\n"
@@ -8,6 +8,7 @@
 # All folders in this directory refer back to this interface
 
 from abc import ABC, abstractmethod
+import numpy as np
 
 
 # __________________ EOS Interface _________________
@@ -33,6 +34,19 @@ class EOStemplate(ABC):
         """
         pass
 
+    def fugacity_coefficient_batch(self, P, rho, xi, T):
+        """
+        Output fugacity coefficients of a series of state points at the same temperature, one row per point. Unless an EOS offers a vectorized version, each point is evaluated with fugacity_coefficient.
+        """
+        return np.array([self.fugacity_coefficient(P[i], np.array([rho[i]]), xi[i], T) for i in range(len(P))])
+
+    @abstractmethod
+    def residual_helmholtz_energy(self, rho, T, xi):
+        """
+        Output residual Helmholtz energy, :math:`A^{res}/(N k_B T)`, predicted by EOS.
+        """
+        pass
+
     @abstractmethod
     def density_max(self, xi, T):
         """
@@ -110,6 +110,9 @@ class saft_gamma_mie(EOStemplate):
         # Initialize temperature attribute
         self.T = np.nan
 
+        # Incremented whenever a parameter is changed, so that stored thermodynamic results may be identified as outdated
+        self._parameter_version = 0
+
     def _temp_dependent_variables(self, T):
 
         """
@@ -200,6 +203,44 @@ class saft_gamma_mie(EOStemplate):
 
         return P_tmp
 
+    def residual_helmholtz_energy(self, rho, T, xi):
+        r"""
+        Compute residual Helmholtz energy, :math:`A^{res}/(N k_B T)`, given system information.
+       
+        Parameters
+        ----------
+        rho : numpy.ndarray
+            Number density of system [mol/m^3]
+        T : float
+            Temperature of the system [K]
+        xi : list[float]
+            Mole fraction of each component
+       
+        Returns
+        -------
+        Ares : numpy.ndarray
+            Array of residual Helmholtz energy values associated with each density and so equal in length
+        """
+
+        #logger = logging.getLogger(__name__)
+
+        if len(xi) != len(self._nui):
+            raise ValueError("Number of components in mole fraction list doesn't match components in nui. Check bead_config.")
+
+        if T != self.T:
+            self._temp_dependent_variables(T)
+
+        self._xi_dependent_variables(xi)
+
+        if np.isscalar(rho):
+            rho = np.array([rho])
+        elif type(rho) != np.ndarray:
+            rho = np.array(rho)
+
+        Ares = funcs.calc_Ares(rho * constants.Nav, xi, T, self._beads, self._beadlibrary, self._massi, self._nui, self._Cmol2seg, self._xsk, self._xskl, self._dkk, self._epsilonkl, self._sigmakl, self._dkl, self._l_akl, self._l_rkl, self._Ckl, self._x0kl, self._epsilonHB, self._Kklab, self._nk)
+
+        return Ares
+
     def fugacity_coefficient(self, P, rho, xi, T, dy=1e-4):
 
         """
@@ -693,6 +734,8 @@ class saft_gamma_mie(EOStemplate):
         else:
             raise ValueError("The parameter name {} is not found in the allowed parameter types: {}".format(param_name,", ".join(param_types)))
 
+        self._parameter_version += 1
+
     def parameter_refresh(self):
         r""" 
         To refresh dependent parameters
@@ -713,6 +756,28 @@ class saft_gamma_mie(EOStemplate):
             self._temp_dependent_variables(self.T)
 
 
+    def __getstate__(self):
+        r"""
+        Reduce the object to its parameter tables and configuration when it's pickled (e.g. sent to another process). Matrices of derived parameters are rebuilt when it's loaded, while temperature and composition dependent variables and stored thermodynamic results are recomputed as they are needed.
+        """
+
+        state = {"beads": self._beads, "nui": self._nui, "beadlibrary": self._beadlibrary, "crosslibrary": self._crosslibrary, "sitenames": self._sitenames}
+        state["parameter_version"] = self._parameter_version
+        if hasattr(self, "_eos_inputs"):
+            state["eos_inputs"] = self._eos_inputs
+
+        return state
+
+    def __setstate__(self, state):
+        r"""
+        Rebuild the object from the parameter tables and configuration produced by __getstate__.
+        """
+
+        self.__init__({key: state[key] for key in ["beads", "nui", "beadlibrary", "crosslibrary", "sitenames"]})
+        self._parameter_version = state["parameter_version"]
+        if "eos_inputs" in state:
+            self._eos_inputs = state["eos_inputs"]
+
     def __str__(self):
 
         string = "Beads:" + str(self._beads) + "\n"
@@ -52,8 +52,14 @@ def fit(eos, thermo_dict):
 
         - minimizer_dict (dict), Optional - Dictionary used to define minimization type and the associated options.
 
-            - method (str) - Method available to scipy.optimize.minimize
+            - method (str) - Method available to scipy.optimize.minimize, 'least_squares' to fit the residuals of each data set with scipy.optimize.least_squares (see :func:`~despasito.fit_parameters.fit_funcs.least_squares_minimizer`), or 'minimizer_jax' for a gradient based method with a finite difference gradient (see :func:`~despasito.fit_parameters.fit_funcs.gradient_minimizer`).
             - options (dict) - This dictionary contains the kwargs available to the chosen method
+
+        - threads (int), Optional - default: 1, Number of processes used to evaluate the objective of each data set concurrently. A value of -1 uses all available cores.
+        - objective_cache (bool/dict), Optional - default: True, Store objective values of evaluated parameter vectors. See :class:`~despasito.fit_parameters.fit_funcs.ObjectiveCache` for available options.
+        - fidelity (dict), Optional - Perform the global search at low fidelity, with subsampled data points and coarser density grids, then promote the best candidates to full fidelity. See :func:`~despasito.fit_parameters.fit_funcs.multifidelity_minimization` for available options.
+        - early_abort (bool/dict), Optional - default: False, Stop evaluating a parameter vector once its partial objective, from the cheapest data sets, exceeds the best found. Used by the global methods, differential_evolution and brute. See :class:`~despasito.fit_parameters.fit_funcs.ObjectiveBound` for available options.
+        - checkpoint (bool/dict), Optional - Periodically save evaluated objective values, the best parameters, and the progress of the global optimization method to a file, so that an interrupted fit may be resumed with the option, resume, or the command line flag, --resume. See :class:`~despasito.fit_parameters.fit_funcs.FitCheckpoint` for available options.
   
     Returns
     -------
@@ -79,6 +85,16 @@ def fit(eos, thermo_dict):
             dicts['minimizer_dict'] = value
         elif key == "global_dict":
             dicts['global_dict'] = value
+        elif key == "threads":
+            dicts['threads'] = value
+        elif key == "objective_cache":
+            dicts['objective_cache'] = value
+        elif key == "fidelity":
+            dicts['fidelity'] = value
+        elif key == "early_abort":
+            dicts['early_abort'] = value
+        elif key == "checkpoint":
+            dicts['checkpoint'] = value
         else:
             continue
         keys_del.append(key)
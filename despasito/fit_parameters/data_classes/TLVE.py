@@ -48,6 +48,14 @@ class Data(ExpDataTemplate):
     
     """
 
+    # Flags of the liquid and vapor phases that are accepted as a solution to warm start from
+    _valid_flags = {"flagl": [1, 2], "flagv": [0, 2, 4]}
+
+    _point_keys = ["Tlist", "xilist", "yilist", "Plist", "Pguess"]
+
+    # Each point is a bubble or dew point, found by iterating on pressure and composition
+    _relative_cost = 10.0
+
     def __init__(self, data_dict):
 
         logger = logging.getLogger(__name__)
@@ -128,11 +136,16 @@ class Data(ExpDataTemplate):
         else:
             self._thermodict["rhodict"] = {"minrhofrac":(1.0 / 300000.0), "rhoinc":10.0, "vspacemax":1.0E-4}
 
+        # Solution of each point from the last objective evaluation, used as the initial guess of the next
+        self._solution = None
+
     def _thermo_wrapper(self, eos):
 
         """
         Generate thermodynamic predictions from eos object
 
+        The pressure and incipient phase composition of each point are stored and used as the initial guesses in the next call, as parameters change little between iterations of a fit. Points that fail from a stored guess are recalculated without one, and their stored solution is removed.
+
         Parameters
         ----------
         eos : obj
@@ -144,21 +157,93 @@ class Data(ExpDataTemplate):
             A list of the predicted thermodynamic values estimated from thermo calculation. This list can be composed of lists or floats
         """
 
-        if self.calctype == "phase_xiT":
-            try:
-                output_dict = thermo(eos, self._thermodict)
-                output = [output_dict['P'],output_dict["yi"]]
-            except:
-                raise ValueError("Calculation of calc_xT_phase failed")
+        logger = logging.getLogger(__name__)
 
+        if self.calctype == "phase_xiT":
+            key, guesskey = "yi", "yiguess"
         elif self.calctype == "phase_yiT":
+            key, guesskey = "xi", "xiguess"
+        else:
+            raise ValueError("Calculation type, {}, is not supported for TLVE data".format(self.calctype))
+
+        thermodict = self._thermodict.copy()
+        if self._solution is not None:
+            thermodict["Pguess"] = self._solution["P"]
+            thermodict[guesskey] = self._solution[key]
+
+        try:
+            output_dict = thermo(eos, thermodict)
+        except:
+            raise ValueError("Calculation of {} failed".format(self.calctype))
+
+        failed = self._failed_points(output_dict)
+        if self._solution is not None and np.any(failed):
+            ind = np.where(failed)[0]
+            logger.info("Recalculating {} points of {} without a warm start".format(len(ind), self.name))
+            thermodict = self._thermodict.copy()
+            for tmp in ["Tlist", "xilist", "yilist", "Plist", "Pguess"]:
+                if tmp in thermodict:
+                    thermodict[tmp] = np.array(thermodict[tmp])[ind]
             try:
-                output_dict = thermo(eos, self._thermodict)
-                output = [output_dict['P'],output_dict["xi"]]
+                retry_dict = thermo(eos, thermodict)
+                output_dict["P"][ind] = retry_dict["P"]
+                output_dict[key][ind] = retry_dict[key]
+                output_dict["flagl"][ind] = retry_dict["flagl"]
+                output_dict["flagv"][ind] = retry_dict["flagv"]
+                failed = self._failed_points(output_dict)
             except:
-                raise ValueError("Calculation of calc_yT_phase failed")
+                logger.warning("Recalculation of failed points in {} was unsuccessful".format(self.name))
+
+        self._update_solution(output_dict["P"], output_dict[key], failed)
+
+        return [output_dict['P'], output_dict[key]]
+
+    def _failed_points(self, output_dict):
+
+        """
+        Identify points without a physical solution
+
+        Parameters
+        ----------
+        output_dict : dict
+            Output of :func:`~despasito.thermodynamics.thermo` for this data set
+
+        Returns
+        -------
+        failed : numpy.ndarray
+            Boolean array that is True for points that failed
+        """
+
+        failed = ~np.isfinite(np.array(output_dict["P"], float))
+        for key, flags in self._valid_flags.items():
+            failed = np.logical_or(failed, ~np.isin(output_dict[key], flags))
+
+        return failed
+
+    def _update_solution(self, P, zi, failed):
 
-        return output
+        """
+        Store the solution of each point as the initial guess of the next calculation. Failed points are reset to the experimental pressure, if available, and a composition estimated by the solver.
+
+        Parameters
+        ----------
+        P : numpy.ndarray
+            Pressure of each point
+        zi : numpy.ndarray
+            Mole fractions of the incipient phase of each point
+        failed : numpy.ndarray
+            Boolean array that is True for points that failed
+        """
+
+        P = np.array(P, float)
+        zi = np.array(zi, float)
+        if "Pguess" in self._thermodict:
+            P[failed] = np.array(self._thermodict["Pguess"], float)[failed]
+        else:
+            P[failed] = -1.0
+        zi[failed] = np.nan
+
+        self._solution = {"P": P, "yi" if self.calctype == "phase_xiT" else "xi": zi}
 
     def objective(self, eos):
 
@@ -206,6 +291,40 @@ class Data(ExpDataTemplate):
 
         return obj_total
 
+    def residuals(self, eos):
+
+        """
+        Generate the weighted relative deviation of each predicted value from this dataset, the sum of squares of which is the objective value
+
+        Parameters
+        ----------
+        eos : obj
+            EOS object with updated parameters
+
+        Returns
+        -------
+        residuals : numpy.ndarray
+            Deviations of pressure, where provided, and each mole fraction of the incipient phase for each point, in that order
+        """
+
+        phase_list = self._thermo_wrapper(eos)
+        phase_list, len_cluster = ff.reformat_ouput(phase_list)
+        phase_list = np.transpose(np.array(phase_list))
+
+        residuals = []
+        if "Plist" in self._thermodict:
+            residuals.append(((phase_list[0] - self._thermodict["Plist"]) / self._thermodict["Plist"])*np.sqrt(self.weights['Plist']))
+
+        if self.calctype == "phase_xiT":
+            key = "yilist"
+        elif self.calctype == "phase_yiT":
+            key = "xilist"
+        if key in self._thermodict:
+            zi = np.transpose(self._thermodict[key])
+            residuals.append(np.ravel(((phase_list[1:] - zi)/zi)*np.sqrt(self.weights[key])))
+
+        return np.concatenate(residuals)
+
     def __str__(self):
 
         string = "Data Set Object\nname: %s\ncalctype:%s\nNdatapts:%g" % {self.name, self.calctype, len(self._thermodict["Tlist"])}
@@ -43,6 +43,11 @@ class Data(ExpDataTemplate):
         List of liquid mole fractions, sum(xi) should equal 1
     """
 
+    _point_keys = ["Tlist", "xilist", "rhol", "Plist"]
+
+    # Each point is a single density root
+    _relative_cost = 1.0
+
     def __init__(self, data_dict):
 
         logger = logging.getLogger(__name__)
@@ -156,6 +161,30 @@ class Data(ExpDataTemplate):
 
         return obj_value
 
+    def residuals(self, eos):
+
+        """
+        Generate the weighted relative deviation of each predicted value from this dataset, the sum of squares of which is the objective value
+
+        Parameters
+        ----------
+        eos : obj
+            EOS object with updated parameters
+
+        Returns
+        -------
+        residuals : numpy.ndarray
+            Deviations of rhol for each point, in that order
+        """
+
+        phase_list = self._thermo_wrapper(eos)
+
+        # Reformat array of results
+        phase_list, len_list = ff.reformat_ouput(phase_list) 
+        phase_list = np.transpose(np.array(phase_list))
+
+        return ((phase_list[0] - self._thermodict["rhol"]) / self._thermodict["rhol"])*np.sqrt(self.weights['rhol'])
+
     def __str__(self):
 
         string = "Data Set Object\nname: %s\ncalctype:%s\nNdatapts:%g" % {self.name, self.calctype, len(self._thermodict["Tlist"])}
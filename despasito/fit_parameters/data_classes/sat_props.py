@@ -43,6 +43,11 @@ class Data(ExpDataTemplate):
         List of liquid mole fractions, only one should be equal to 1.
     """
 
+    _point_keys = ["Tlist", "xilist", "Psat", "rhol", "rhov"]
+
+    # Each point is a saturation pressure, found from a pressure curve
+    _relative_cost = 3.0
+
     def __init__(self, data_dict):
 
         logger = logging.getLogger(__name__)
@@ -188,6 +193,35 @@ class Data(ExpDataTemplate):
 
         return obj_total
 
+    def residuals(self, eos):
+
+        """
+        Generate the weighted relative deviation of each predicted value from this dataset, the sum of squares of which is the objective value
+
+        Parameters
+        ----------
+        eos : obj
+            EOS object with updated parameters
+
+        Returns
+        -------
+        residuals : numpy.ndarray
+            Deviations of Psat, rhol, and rhov, where provided, for each point, in that order
+        """
+
+        phase_list = self._thermo_wrapper(eos)
+
+        ## Reformat array of results
+        phase_list, len_list = ff.reformat_ouput(phase_list)
+        phase_list = np.transpose(np.array(phase_list))
+
+        residuals = []
+        for i, key in enumerate(["Psat", "rhol", "rhov"]):
+            if key in self._thermodict:
+                residuals.append(((phase_list[i] - self._thermodict[key]) / self._thermodict[key])*np.sqrt(self.weights[key]))
+
+        return np.concatenate(residuals)
+
     def __str__(self):
 
         string = "Data Set Object\nname: %s\ncalctype:%s\nNdatapts:%g" % {self.name, self.calctype, len(self._thermodict['T'])}
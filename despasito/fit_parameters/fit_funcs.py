@@ -1,8 +1,19 @@
 
+import os
+import json
+import time
+import inspect
+import collections
 import numpy as np
 import logging
 import scipy.optimize as spo
 
+from despasito.utils import parallelization
+from despasito.utils.result_cache import ResultCache
+
+# Parameters last applied to the eos object of a worker process
+_worker_parameters = None
+
 
 def initial_guess(opt_params, eos):
     r"""
@@ -247,7 +258,7 @@ class BasinBounds(object):
         return tmax and tmin
 
 
-def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict={}, minimizer_dict={}):
+def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict={}, minimizer_dict={}, threads=1, objective_cache=True, fidelity=None, early_abort=False, checkpoint=None):
     r"""
     Fit defined parameters for equation of state object with given experimental data. 
 
@@ -257,7 +268,7 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
     Parameters
     ----------
     global_method : str
-        Global optimization method used to fit parameters. Currently scipy.optimize methods 'basinhopping', 'differential_evolution', and 'brute' are supported.
+        Global optimization method used to fit parameters. Currently scipy.optimize methods 'basinhopping', 'differential_evolution', and 'brute' are supported. The option 'least_squares' performs a single local fit from beadparams0 with :func:`least_squares_minimizer`, where global_dict holds its options.
     beadparams0 : numpy.ndarray, 
         An array of initial guesses for parameters, these will be optimized throughout the process.
     bounds : list[tuple]
@@ -277,13 +288,25 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
         - T (float) - default: 0.5, Temperature parameter, should be comparable to separation between local minima (i.e. the “height” of the walls separating values).
         - niter_success (int) - default: 3, Stop run if minimum stays the same for this many iterations
         - stepsize (float) - default: 0.1, Maximum step size for use in the random displacement. We use this value to define an object for the `take_step` option that includes a custom routine that produces attribute stepsizes for each parameter.
+        - multistart (int) - Number of independent basin hopping chains, see :func:`multistart_basinhopping`. The options, agree_tol, nagree, and seed, are also passed to that function.
 
     minimizer_dict : dict, Optional
         Dictionary used to define minimization type and the associated options.
 
-        - method (str) - Method available to scipy.optimize.minimize
+        - method (str) - Method available to scipy.optimize.minimize, 'least_squares' to use :func:`least_squares_minimizer`, which fits the residuals of each data set, or 'minimizer_jax' to use the gradient based :func:`gradient_minimizer`.
         - options (dict) - This dictionary contains the kwargs available to the chosen method
 
+    threads : int, Optional, default: 1
+        Number of processes used to evaluate the objective of each experimental data set concurrently. A value of -1 uses all available cores. See :func:`compute_obj`. For differential_evolution, this is instead the default number of workers that evaluate members of the population concurrently, unless the option, workers, is given in global_dict.
+    objective_cache : bool or dict, Optional, default: True
+        If True, objective values are stored in an :class:`ObjectiveCache` so that repeated parameter vectors aren't recomputed. A dictionary of keyword arguments for :class:`ObjectiveCache`, or an :class:`ObjectiveCache` object, may be given instead (e.g. to store values on disk), or False to disable it. Workers of differential_evolution and multi-start chains in other processes share values through a multiprocessing manager, see :meth:`ObjectiveCache.share`.
+    fidelity : dict, Optional, default: None
+        If given, the global search is performed at low fidelity and its best candidates are promoted to full fidelity. See :func:`multifidelity_minimization` for the available options.
+    early_abort : bool or dict, Optional, default: False
+        If True, an evaluation stops once its partial objective exceeds the lowest value found so far, see :class:`ObjectiveBound`. A dictionary of keyword arguments for :class:`ObjectiveBound`, or an :class:`ObjectiveBound` object, may be given instead. This applies to the population of differential_evolution and the grid of brute, where values only need to be ranked against the best found, and is shared by the workers of differential_evolution. The polishing step and the finish function use complete values. Other methods are based on local minimization and ignore this option with a warning.
+    checkpoint : bool or dict, Optional, default: None
+        If True, evaluated objective values, the best parameters, and the progress of the global optimization method are periodically saved to a file, see :class:`FitCheckpoint`. A dictionary of keyword arguments for :class:`FitCheckpoint` (e.g. filename, interval, and resume), or a :class:`FitCheckpoint` object, may be given instead. The checkpoint replaces the objective cache and takes the options of objective_cache. With the option, resume, an interrupted basinhopping, differential_evolution, or brute fit is continued.
+
     Returns
     -------
     Objective : float
@@ -291,8 +314,150 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
         
     """
 
+    logger = logging.getLogger(__name__)
+
+    if threads == -1:
+        threads = parallelization.multiprocessing.cpu_count()
+
+    checkpoint = _fit_checkpoint(checkpoint, objective_cache)
+
+    if fidelity is not None:
+        if checkpoint is not None:
+            logger.warning("Checkpoints aren't supported for fits with multiple fidelities and won't be written")
+        return multifidelity_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, fidelity=fidelity, global_dict=global_dict, minimizer_dict=minimizer_dict, threads=threads, objective_cache=objective_cache, early_abort=early_abort)
+
+    if checkpoint is not None:
+        cache = checkpoint
+        cache.context = {"global_method": global_method, "fit_bead": fit_bead, "fit_params": list(fit_params)}
+        if cache.resume and cache.load():
+            beadparams0, global_dict = _resume_options(global_method, cache, beadparams0, bounds, global_dict)
+        if global_method in ["basinhopping", "differential_evolution"] and "multistart" not in global_dict:
+            global_dict = dict(global_dict)
+            # Basin hopping also passes the result of the initial minimization to the callback
+            cache._skip_callback = global_method == "basinhopping"
+            user_callback = global_dict.get("callback")
+            if user_callback is None:
+                global_dict["callback"] = cache.callback
+            else:
+                global_dict["callback"] = lambda *args, **kwargs: cache.callback(*args, **kwargs) or user_callback(*args, **kwargs)
+    else:
+        cache = _objective_cache(objective_cache)
+
+    if isinstance(early_abort, ObjectiveBound):
+        bound = early_abort
+    elif isinstance(early_abort, dict):
+        bound = ObjectiveBound(**early_abort)
+    elif early_abort:
+        bound = ObjectiveBound()
+    else:
+        bound = None
+    if bound is not None and global_method not in ["differential_evolution", "brute"]:
+        logger.warning("Early termination isn't used with {}, which compares complete objective values of local minima".format(global_method))
+        bound = None
+
+    # Independent basin hopping chains are each evaluated by one process
+    if global_method == "basinhopping" and "multistart" in global_dict:
+        global_dict = dict(global_dict)
+        multistart_opts = {key: global_dict.pop(key) for key in ["agree_tol", "nagree", "seed"] if key in global_dict}
+        nstarts = global_dict.pop("multistart")
+        if checkpoint is not None and threads > 1:
+            logger.warning("Basin hopping chains in other processes don't write the checkpoint, it's only written once all chains have ended")
+        try:
+            return multistart_basinhopping(beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict=global_dict, minimizer_dict=minimizer_dict, nstarts=nstarts, threads=threads, cache=cache, **multistart_opts)
+        finally:
+            if checkpoint is not None:
+                cache.save()
+
+    # Differential evolution evaluates the population with workers, each receiving a pickled copy of the eos and data objects
+    manager = None
+    if global_method == "differential_evolution":
+        global_dict = dict(global_dict)
+        if "workers" not in global_dict and threads > 1:
+            global_dict["workers"] = threads
+        if global_dict.get("workers", 1) != 1:
+            if "updating" not in global_dict:
+                global_dict["updating"] = "deferred"
+            logger.info("Members of the population are evaluated with {} workers".format(global_dict["workers"]))
+            threads = 1
+            # Copies of the cache and incumbent in the workers share their values through a manager process
+            if cache is not None or bound is not None:
+                manager = parallelization.multiprocessing.Manager()
+            if cache is not None:
+                cache.share(manager)
+            if bound is not None:
+                bound.share(manager)
+
+    # Start a pool of processes that is used for every objective evaluation. Derivatives by finite differences are also evaluated with it, one parameter per process.
+    if global_method == "least_squares" or minimizer_dict.get("method") in ["least_squares", "minimizer_jax"]:
+        threads = min(threads, max(len(exp_dict), len(beadparams0)))
+    else:
+        threads = min(threads, len(exp_dict))
+    if threads > 1:
+        pool = parallelization.MultiprocessingJob(eos, ncores=threads)
+        logger.info("Objective values of the experimental data sets are evaluated with {} processes".format(threads))
+    else:
+        pool = None
+
+    try:
+        result = _global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict=global_dict, minimizer_dict=minimizer_dict, pool=pool, cache=cache, bound=bound)
+    finally:
+        if pool is not None:
+            pool.end_pool()
+        if manager is not None:
+            if cache is not None:
+                cache.unshare()
+            if bound is not None:
+                bound.unshare()
+            manager.shutdown()
+        if checkpoint is not None:
+            cache.save()
+
+    if cache is not None:
+        logger.info("Objective cache: {}".format(cache))
+    if bound is not None:
+        logger.info("Early termination: {}".format(bound))
+
+    return result
+
+def _global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict={}, minimizer_dict={}, pool=None, cache=None, bound=None):
+    r"""
+    Run the global optimization method of :func:`global_minimization` with the given pool of processes.
+
+    Parameters
+    ----------
+    global_method : str
+        Global optimization method used to fit parameters.
+    beadparams0 : numpy.ndarray, 
+        An array of initial guesses for parameters, these will be optimized throughout the process.
+    bounds : list[tuple]
+        List of length equal to fit_params with lists of pairs for minimum and maximum bounds of parameter being fit.
+    fit_bead : str
+        Name of bead whose parameters are being fit, should be in bead list of beadconfig
+    fit_params : list[str]
+        This list of contains the name of the parameter being fit (e.g. epsilon).
+    eos : obj
+        Equation of state output that writes pressure, max density, chemical potential, updates parameters, and evaluates objective functions.
+    exp_dict : dict
+        Dictionary of experimental data objects.
+    global_dict : dict, Optional
+        Kwargs of golobal optimization algorithm
+    minimizer_dict : dict, Optional
+        Dictionary used to define minimization type and the associated options.
+    pool : obj, Optional, default: None
+        :class:`~despasito.utils.parallelization.MultiprocessingJob` object used to evaluate the objective of each data set. If None, data sets are evaluated serially.
+    cache : obj, Optional, default: None
+        :class:`ObjectiveCache` object of stored objective values
+    bound : obj, Optional, default: None
+        :class:`ObjectiveBound` object used to stop evaluations that exceed the lowest value found
+
+    Returns
+    -------
+    result : obj
+        Result of the scipy.optimize method
+    """
+
     # !!!!!!!!! If another methods is added to the if statement below, please also add it here and update the documentation above. !!!!!!!!
-    methods = ["basinhopping", "differential_evolution", "brute"]
+    methods = ["basinhopping", "differential_evolution", "brute", "least_squares"]
 
     if global_method == "basinhopping":
 
@@ -304,15 +469,7 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
         global_dict = new_global_dict
     
         # Set up options for minimizer in basin hopping
-        new_minimizer_dict = {"method": 'nelder-mead', "options": {'maxiter': 50}}
-        if minimizer_dict:
-            for key, value in minimizer_dict.items():
-                if key == "method":
-                    new_minimizer_dict[key] = value
-                elif key == "options":
-                    for key2, value2 in value.items():
-                        new_minimizer_dict[key][key2] = value2
-        minimizer_dict = new_minimizer_dict
+        minimizer_dict = _minimizer_options(minimizer_dict, bounds)
       
         # NoteHere: how is this array generated? stepmag = np.array([550.0, 26.0, 4.0e-10, 0.45, 500.0, 150.0e-30, 550.0])
         try:
@@ -326,7 +483,7 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
         except:
         	raise TypeError("Could not initialize BasinStep and/or BasinBounds")
 
-        result = spo.basinhopping(compute_obj, beadparams0, **global_dict, accept_test=custombounds, disp=True, minimizer_kwargs={"args": (fit_bead, fit_params, eos, exp_dict),**minimizer_dict})
+        result = spo.basinhopping(compute_obj, beadparams0, **global_dict, accept_test=custombounds, disp=True, minimizer_kwargs={"args": (fit_bead, fit_params, eos, exp_dict, pool, cache),**minimizer_dict})
 
     elif global_method == "differential_evolution":
 
@@ -337,7 +494,14 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
                 new_global_dict[key] = value
         global_dict = new_global_dict
 
-        result = spo.differential_evolution(compute_obj, bounds, args=(fit_bead, fit_params, eos, exp_dict), **global_dict)
+        # Polishing is a local minimization, which needs complete objective values
+        polish = global_dict.pop("polish", True)
+        result = spo.differential_evolution(compute_obj, bounds, args=(fit_bead, fit_params, eos, exp_dict, pool, cache, bound), polish=(polish and bound is None), **global_dict)
+        if polish and bound is not None:
+            result_polish = spo.minimize(compute_obj, np.copy(result.x), args=(fit_bead, fit_params, eos, exp_dict, pool, cache), method="L-BFGS-B", bounds=bounds)
+            result.nfev += result_polish.nfev
+            if result_polish.fun < result.fun:
+                result.x, result.fun, result.jac = result_polish.x, result_polish.fun, result_polish.jac
 
     elif global_method == "brute":
 
@@ -348,7 +512,15 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
                 new_global_dict[key] = value
         global_dict = new_global_dict
 
-        result = spo.brute(compute_obj, bounds, args=(fit_bead, fit_params, eos, exp_dict), **global_dict)
+        if bound is None:
+            result = spo.brute(compute_obj, bounds, args=(fit_bead, fit_params, eos, exp_dict, pool, cache), **global_dict)
+        else:
+            result = _brute_bounded(bounds, fit_bead, fit_params, eos, exp_dict, global_dict, pool=pool, cache=cache, bound=bound)
+
+    elif global_method == "least_squares":
+
+        # A single local fit from the initial guess, with options of scipy.optimize.least_squares
+        result = least_squares_minimizer(compute_obj, beadparams0, args=(fit_bead, fit_params, eos, exp_dict, pool, cache), bounds=bounds, **global_dict)
 
     else:
         raise ValueError("Global optimization method, {}, is not currently supported. Try: {}".format(global_method,", ".join(methods)))
@@ -356,59 +528,1697 @@ def global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params
     return result
 
 
-def compute_obj(beadparams, fit_bead, fit_params, eos, exp_dict):
+def _brute_bounded(bounds, fit_bead, fit_params, eos, exp_dict, global_dict, pool=None, cache=None, bound=None):
     r"""
-    Fit defined parameters for equation of state object with given experimental data. 
+    Run scipy.optimize.brute where grid points are evaluated with early termination, while the finish function, a local minimization, uses complete objective values.
 
-    Each set of experimental data is converted to an object with the build in ability to evaluate its part of objective function. 
-    To add another type of supported experimental data, add a class to the fit_classes.py file.
+    Parameters
+    ----------
+    bounds : list[tuple]
+        List of length equal to fit_params with lists of pairs for minimum and maximum bounds of parameter being fit.
+    fit_bead : str
+        Name of bead whose parameters are being fit, should be in bead list of beadconfig
+    fit_params : list[str]
+        This list of contains the name of the parameter being fit (e.g. epsilon).
+    eos : obj
+        Equation of state output that writes pressure, max density, chemical potential, updates parameters, and evaluates objective functions.
+    exp_dict : dict
+        Dictionary of experimental data objects.
+    global_dict : dict
+        Kwargs of scipy.optimize.brute
+    pool : obj, Optional, default: None
+        :class:`~despasito.utils.parallelization.MultiprocessingJob` object used to evaluate the objective of each data set. If None, data sets are evaluated serially.
+    cache : obj, Optional, default: None
+        :class:`ObjectiveCache` object of stored objective values
+    bound : obj, Optional, default: None
+        :class:`ObjectiveBound` object used to stop evaluations of grid points that exceed the lowest value found
+
+    Returns
+    -------
+    result : numpy.ndarray or tuple
+        Output of scipy.optimize.brute, the best parameters, followed by the objective value, grid and grid values when full_output is True
+    """
+
+    global_dict = global_dict.copy()
+    finish = global_dict.pop("finish", spo.fmin)
+    full_output = global_dict.pop("full_output", False)
+
+    xmin, Jmin, grid, Jout = spo.brute(compute_obj, bounds, args=(fit_bead, fit_params, eos, exp_dict, pool, cache, bound), finish=None, full_output=True, **global_dict)
+
+    if finish is not None:
+        # Keyword arguments are chosen as scipy.optimize.brute does
+        finish_kwargs = {}
+        if "full_output" in inspect.getfullargspec(finish).args:
+            finish_kwargs["full_output"] = 1
+        res = finish(compute_obj, xmin, args=(fit_bead, fit_params, eos, exp_dict, pool, cache), **finish_kwargs)
+        if isinstance(res, spo.OptimizeResult):
+            xmin, Jmin = res.x, res.fun
+        else:
+            xmin, Jmin = res[0], res[1]
+
+    if full_output:
+        return xmin, Jmin, grid, Jout
+    else:
+        return xmin
+
+
+def _minimizer_options(minimizer_dict, bounds):
+    r"""
+    Keyword arguments of scipy.optimize.minimize for local minimization, with defaults for missing options.
 
     Parameters
     ----------
+    minimizer_dict : dict
+        Dictionary used to define minimization type and the associated options, see :func:`global_minimization`.
+    bounds : list[tuple]
+        Bounds of each parameter, used by the 'least_squares' and 'minimizer_jax' methods
+
+    Returns
+    -------
+    minimizer_dict : dict
+        Keyword arguments of scipy.optimize.minimize
+    """
+
+    new_minimizer_dict = {"method": 'nelder-mead', "options": {'maxiter': 50}}
+    if minimizer_dict:
+        for key, value in minimizer_dict.items():
+            if key == "method":
+                new_minimizer_dict[key] = value
+            elif key == "options":
+                for key2, value2 in value.items():
+                    new_minimizer_dict[key][key2] = value2
+    minimizer_dict = new_minimizer_dict
+    if minimizer_dict["method"] == "least_squares":
+        minimizer_dict["method"] = least_squares_minimizer
+        minimizer_dict["bounds"] = bounds
+    elif minimizer_dict["method"] == "minimizer_jax":
+        minimizer_dict["method"] = gradient_minimizer
+        minimizer_dict["bounds"] = bounds
+
+    return minimizer_dict
+
+def multifidelity_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, fidelity={}, global_dict={}, minimizer_dict={}, threads=1, objective_cache=True, early_abort=False):
+    r"""
+    Fit parameters with a schedule of two fidelities. The global search is performed at low fidelity, where the data points of each set are subsampled and the density grid is coarser. The distinct candidate minima with the lowest objective values are then promoted to full fidelity, where the agreement of the two levels is checked, and the best candidate is refined by a local minimization at full fidelity.
+
+    Parameters
+    ----------
+    global_method : str
+        Global optimization method used to fit parameters, see :func:`global_minimization`.
     beadparams0 : numpy.ndarray, 
         An array of initial guesses for parameters, these will be optimized throughout the process.
+    bounds : list[tuple]
+        List of length equal to fit_params with lists of pairs for minimum and maximum bounds of parameter being fit.
     fit_bead : str
         Name of bead whose parameters are being fit, should be in bead list of beadconfig
     fit_params : list[str]
-        This list of contains the name of the parameter being fit (e.g. epsilon). See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. epsilon_CO2).
+        This list of contains the name of the parameter being fit (e.g. epsilon).
+    eos : obj
+        Equation of state output that writes pressure, max density, chemical potential, updates parameters, and evaluates objective functions.
+    exp_dict : dict
+        Dictionary of experimental data objects.
+    fidelity : dict, Optional
+        Options of the fidelity schedule
+
+        - subsample (int) - default: 2, Every subsample-th data point of each data set is evaluated at low fidelity. See :meth:`~despasito.fit_parameters.interface.ExpDataTemplate.set_fidelity`.
+        - rhodict (dict) - Options of rhodict at low fidelity. By default, the density increment, rhoinc, of each data set is increased five times, and vspacemax ten times.
+        - options (dict) - Other calculation options of each data set at low fidelity, e.g. solver tolerances
+        - npromote (int) - default: 3, Number of candidate minima promoted to full fidelity
+        - separation (float) - default: 0.05, Candidates closer than this fraction of the bounds in every parameter are considered the same minimum
+        - consistency_tol (float) - default: 0.1, Relative difference between the objective values of each fidelity above which a warning is given
+        - polish (bool) - default: True, Refine the best candidate with a local minimization at full fidelity, defined by minimizer_dict
+
+    global_dict : dict, Optional
+        Kwargs of global optimization algorithm, see :func:`global_minimization`.
+    minimizer_dict : dict, Optional
+        Dictionary used to define minimization type and the associated options, see :func:`global_minimization`.
+    threads : int, Optional, default: 1
+        Number of processes, see :func:`global_minimization`.
+    objective_cache : bool or dict, Optional, default: True
+        Objective cache used at full fidelity, see :func:`global_minimization`. Low fidelity values are kept in a separate cache in memory.
+    early_abort : bool or dict, Optional, default: False
+        Stop poor evaluations of the global search, see :func:`global_minimization`. Promoted candidates are always evaluated completely.
+
+    Returns
+    -------
+    result : obj
+        scipy.optimize.OptimizeResult object at full fidelity. The attribute, candidates, holds the parameters and objective values at low and full fidelity of each promoted candidate, and low_fidelity holds the result of the global search, also as an OptimizeResult for brute.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    fidelity = dict(fidelity)
+    subsample = fidelity.pop("subsample", 2)
+    rhodict = fidelity.pop("rhodict", None)
+    options = fidelity.pop("options", None)
+    npromote = fidelity.pop("npromote", 3)
+    separation = fidelity.pop("separation", 0.05)
+    consistency_tol = fidelity.pop("consistency_tol", 0.1)
+    polish = fidelity.pop("polish", True)
+    if fidelity:
+        raise ValueError("The fidelity options, {}, are not supported".format(", ".join(fidelity.keys())))
+
+    if threads == -1:
+        threads = parallelization.multiprocessing.cpu_count()
+
+    # Global search at low fidelity, with values kept apart from those at full fidelity
+    for data_obj in exp_dict.values():
+        if rhodict is None:
+            rhodict_full = data_obj._thermodict.get("rhodict", {})
+            rhodict_low = {"rhoinc": 5.0*rhodict_full.get("rhoinc", 10.0), "vspacemax": 10.0*rhodict_full.get("vspacemax", 1.0E-4)}
+        else:
+            rhodict_low = rhodict
+        data_obj.set_fidelity(subsample=subsample, rhodict=rhodict_low, options=options)
+    logger.info("Global search at low fidelity: subsample {}, options {}".format(subsample, options))
+
+    cache_low = ObjectiveCache()
+    try:
+        result_low = global_minimization(global_method, beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict=global_dict, minimizer_dict=minimizer_dict, threads=threads, objective_cache=cache_low, early_abort=early_abort)
+        # brute returns the parameters, or a tuple with the full output, instead of an OptimizeResult
+        if not isinstance(result_low, spo.OptimizeResult):
+            x_low = np.atleast_1d(np.array(result_low[0] if isinstance(result_low, tuple) else result_low, float))
+            fun_low = compute_obj(x_low, fit_bead, fit_params, eos, exp_dict, cache=cache_low)
+            result_low = spo.OptimizeResult(x=x_low, fun=fun_low)
+    finally:
+        for data_obj in exp_dict.values():
+            data_obj.set_fidelity()
+
+    # Distinct candidates within the bounds, starting with the result of the global search
+    xmin, xmax = np.transpose(np.array(bounds, float))
+    candidates = [(np.array(result_low.x, float), float(result_low.fun))]
+    for beadparams, obj_low in cache_low.lowest():
+        if len(candidates) >= npromote:
+            break
+        if np.any(beadparams < xmin) or np.any(beadparams > xmax):
+            continue
+        if all(np.any(np.abs(beadparams - x)/(xmax - xmin) > separation) for x, _ in candidates):
+            candidates.append((beadparams, obj_low))
+
+    # Promotion to full fidelity
+    cache = _objective_cache(objective_cache)
+    nprocesses = min(threads, len(exp_dict))
+    pool = parallelization.MultiprocessingJob(eos, ncores=nprocesses) if nprocesses > 1 else None
+    try:
+        promoted = []
+        for beadparams, obj_low in candidates:
+            obj_full = compute_obj(beadparams, fit_bead, fit_params, eos, exp_dict, pool=pool, cache=cache)
+            promoted.append({"x": beadparams, "fun_low": obj_low, "fun": obj_full})
+            difference = np.abs(obj_full - obj_low)/max(np.abs(obj_full), np.finfo(float).eps)
+            if not np.isfinite(difference) or difference > consistency_tol:
+                logger.warning("Objective values of parameters, {}, differ at low and full fidelity, {} and {}. Consider a finer low fidelity.".format(beadparams, obj_low, obj_full))
+            logger.info("Promoted candidate {}: low fidelity {}, full fidelity {}".format(beadparams, obj_low, obj_full))
+
+        ranked = sorted(range(len(promoted)), key=lambda i: promoted[i]["fun"])
+        if ranked[0] != int(np.argmin([x["fun_low"] for x in promoted])):
+            logger.warning("The ranking of candidates changed at full fidelity, the low fidelity may be too coarse")
+        best = promoted[ranked[0]]
+        result = spo.OptimizeResult(x=best["x"], fun=best["fun"], candidates=promoted, low_fidelity=result_low, message=["Promoted {} candidates to full fidelity".format(len(promoted))])
+
+        if polish:
+            result_polish = spo.minimize(compute_obj, best["x"], args=(fit_bead, fit_params, eos, exp_dict, pool, cache), **_minimizer_options(minimizer_dict, bounds))
+            if result_polish.fun < result.fun and np.all(result_polish.x >= xmin) and np.all(result_polish.x <= xmax):
+                result.x, result.fun = result_polish.x, result_polish.fun
+            result.message.append("Polish at full fidelity: {}".format(result_polish.message))
+    finally:
+        if pool is not None:
+            pool.end_pool()
+
+    if cache is not None:
+        logger.info("Objective cache at full fidelity: {}".format(cache))
+
+    return result
+
+def _objective_cache(objective_cache):
+    r"""
+    Create the objective cache requested in :func:`global_minimization`.
+
+    Parameters
+    ----------
+    objective_cache : bool, dict, or obj
+        If True, a default :class:`ObjectiveCache` is made, and if a dictionary, it holds its keyword arguments. An :class:`ObjectiveCache` object is used as is.
+
+    Returns
+    -------
+    cache : obj
+        :class:`ObjectiveCache` object, or None if objective_cache is False
+    """
+
+    if isinstance(objective_cache, ObjectiveCache):
+        return objective_cache
+    elif isinstance(objective_cache, dict):
+        return ObjectiveCache(**objective_cache)
+    elif objective_cache:
+        return ObjectiveCache()
+    else:
+        return None
+
+def _fit_checkpoint(checkpoint, objective_cache):
+    r"""
+    Create the checkpoint requested in :func:`global_minimization`.
+
+    Parameters
+    ----------
+    checkpoint : bool, dict, or obj
+        If True, a default :class:`FitCheckpoint` is made, and if a dictionary, it holds its keyword arguments. A :class:`FitCheckpoint` object is used as is.
+    objective_cache : bool, dict, or obj
+        If a dictionary, it holds keyword arguments of :class:`ObjectiveCache` that are also used for the checkpoint.
+
+    Returns
+    -------
+    checkpoint : obj
+        :class:`FitCheckpoint` object, or None if checkpoint is None or False
+    """
+
+    if isinstance(checkpoint, FitCheckpoint):
+        return checkpoint
+    elif not isinstance(checkpoint, dict) and not checkpoint:
+        return None
+
+    kwargs = dict(objective_cache) if isinstance(objective_cache, dict) else {}
+    if isinstance(checkpoint, dict):
+        kwargs.update(checkpoint)
+
+    return FitCheckpoint(**kwargs)
+
+def _resume_options(global_method, checkpoint, beadparams0, bounds, global_dict):
+    r"""
+    Continue the global optimization method from a loaded checkpoint.
+
+    Basin hopping runs the remaining iterations. Unless an array was given for the option, init, the initial population of differential evolution is made of the best stored parameter vectors within the bounds, and only then are the remaining generations run. Brute repeats the same grid. Other than brute, methods start from the best parameters found.
+
+    Parameters
+    ----------
+    global_method : str
+        Global optimization method used to fit parameters.
+    checkpoint : obj
+        :class:`FitCheckpoint` object that was loaded
+    beadparams0 : numpy.ndarray
+        An array of initial guesses for parameters
+    bounds : list[tuple]
+        List of length equal to fit_params with lists of pairs for minimum and maximum bounds of parameter being fit.
+    global_dict : dict
+        Kwargs of golobal optimization algorithm
+
+    Returns
+    -------
+    beadparams0 : numpy.ndarray
+        Initial guess of the resumed fit
+    global_dict : dict
+        Kwargs of golobal optimization algorithm for the resumed fit
+    """
+
+    logger = logging.getLogger(__name__)
+
+    global_dict = dict(global_dict)
+    iterations = checkpoint.state["iterations"]
+
+    if global_method == "basinhopping":
+        global_dict["niter"] = max(global_dict.get("niter", 10) - iterations, 0)
+        logger.info("Basin hopping continues with {} iterations".format(global_dict["niter"]))
+    elif global_method == "differential_evolution":
+        if not isinstance(global_dict.get("init"), np.ndarray):
+            npop = global_dict.get("popsize", 15) * len(bounds)
+            bounds_array = np.array(bounds, float)
+            population = [x for x, obj in checkpoint.lowest() if np.all(x >= bounds_array[:, 0]) and np.all(x <= bounds_array[:, 1])][:npop]
+            # scipy.optimize.differential_evolution requires at least five members
+            if len(population) >= 5:
+                global_dict["init"] = np.array(population)
+                global_dict["maxiter"] = max(global_dict.get("maxiter", 1000) - iterations, 1)
+                logger.info("Differential evolution continues from {} stored parameter vectors with {} generations".format(len(population), global_dict["maxiter"]))
+            else:
+                logger.info("Too few stored parameter vectors are within the bounds to make a population, differential evolution starts from a new population")
+
+    if global_method != "brute" and checkpoint.best[0] is not None:
+        beadparams0 = checkpoint.best[0]
+
+    return beadparams0, global_dict
+
+def latin_hypercube(bounds, nsamples, random_state=None):
+    r"""
+    Sample points within bounds so that, for each parameter, one point falls in each of nsamples intervals of equal width.
+
+    Parameters
+    ----------
+    bounds : list[tuple]
+        List of pairs of minimum and maximum values of each parameter
+    nsamples : int
+        Number of points
+    random_state : obj, Optional, default: None
+        numpy.random.RandomState object. If None, the global numpy random state is used.
 
+    Returns
+    -------
+    samples : numpy.ndarray
+        Array of points, of size nsamples by the number of parameters
+    """
+
+    if random_state is None:
+        random_state = np.random.mtrand._rand
+
+    bounds = np.array(bounds, float)
+    nparams = len(bounds)
+
+    samples = np.zeros((nsamples, nparams))
+    for j in range(nparams):
+        intervals = random_state.permutation(nsamples)
+        samples[:, j] = (intervals + random_state.uniform(size=nsamples)) / nsamples
+
+    return bounds[:, 0] + samples * (bounds[:, 1] - bounds[:, 0])
+
+def multistart_basinhopping(beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict={}, minimizer_dict={}, nstarts=4, threads=1, agree_tol=1e-3, nagree=None, seed=None, cache=None):
+    r"""
+    Run independent basin hopping chains from the initial guess and Latin hypercube samples within the bounds.
+
+    Each chain is a call of scipy.optimize.basinhopping, set up as in :func:`global_minimization`, and chains are distributed over processes. After each local minimization, a chain reports its lowest minimum. Once the lowest minima of nagree chains agree with the best result within agree_tol, all chains are stopped.
+
+    Parameters
+    ----------
+    beadparams0 : numpy.ndarray, 
+        Initial guess in parameters, used as the starting point of the first chain
+    bounds : list[tuple]
+        List of length equal to fit_params with lists of pairs for minimum and maximum bounds of parameter being fit.
+    fit_bead : str
+        Name of bead whose parameters are being fit, should be in bead list of beadconfig
+    fit_params : list[str]
+        This list of contains the name of the parameter being fit (e.g. epsilon).
     eos : obj
-        Equation of state output that writes pressure, max density, chemical potential, updates parameters, and evaluates objective functions. For parameter fitting algorithm See equation of state documentation for more details.
+        Equation of state output that writes pressure, max density, chemical potential, updates parameters, and evaluates objective functions.
     exp_dict : dict
         Dictionary of experimental data objects.
+    global_dict : dict, Optional
+        Kwargs of scipy.optimize.basinhopping, see :func:`global_minimization`
+    minimizer_dict : dict, Optional
+        Dictionary used to define minimization type and the associated options.
+    nstarts : int, Optional, default: 4
+        Number of chains
+    threads : int, Optional, default: 1
+        Number of processes used. A value of -1 uses all available cores.
+    agree_tol : float, Optional, default: 1e-3
+        Relative tolerance in objective value and parameters for two minima to be considered the same
+    nagree : int, Optional, default: None
+        Number of chains that must agree on the best result before all are stopped. If None, a majority of chains (at least 2) is used. A value greater than nstarts disables early termination.
+    seed : int, Optional, default: None
+        Seed for starting points and the random steps of each chain
+    cache : obj, Optional, default: None
+        :class:`ObjectiveCache` object of stored objective values. With more than one process, values are shared through a multiprocessing manager, see :meth:`ObjectiveCache.share`.
 
     Returns
     -------
-    Objective : float
-        Value of sum of objective values according to appropriate weights. Output file saved in current working directory.
-        
+    result : obj
+        scipy.optimize.OptimizeResult of the chain with the lowest objective value, where the attribute, chains, contains the result of each chain
     """
 
     logger = logging.getLogger(__name__)
 
-    # Update beadlibrary with test paramters
+    if nagree is None:
+        nagree = max(2, int(np.ceil(nstarts/2)))
+
+    random_state = np.random.RandomState(seed)
+    starts = latin_hypercube(bounds, nstarts, random_state=random_state)
+    starts[0] = beadparams0
+    seeds = random_state.randint(2**31-1, size=nstarts)
+    logger.info("Starting {} basin hopping chains from:\n{}".format(nstarts, starts))
+
+    if threads == -1:
+        threads = parallelization.multiprocessing.cpu_count()
+    threads = min(threads, nstarts)
+
+    # Lowest minimum of each chain, and objective values, shared between processes
+    if threads > 1:
+        manager = parallelization.multiprocessing.Manager()
+        shared = manager.dict()
+        if cache is not None:
+            cache.share(manager)
+    else:
+        manager = None
+        shared = {}
+
+    inputs = [(i, starts[i], seeds[i], bounds, fit_bead, fit_params, exp_dict, global_dict, minimizer_dict, shared, agree_tol, nagree, cache) for i in range(nstarts)]
+    try:
+        output = parallelization.batch_jobs(_basinhopping_chain, inputs, eos, ncores=threads)
+    finally:
+        if manager is not None:
+            if cache is not None:
+                cache.unshare()
+            manager.shutdown()
+
+    chains = [x for x in output if x is not None]
+    if not chains:
+        raise ValueError("None of the {} basin hopping chains completed".format(nstarts))
+
+    best = chains[int(np.argmin([x.fun for x in chains]))]
+    result = spo.OptimizeResult(x=best.x, fun=best.fun, chains=chains)
+    result.message = "Lowest minimum of {} completed basin hopping chains".format(len(chains))
 
-    if len(beadparams) != len(fit_params):
-        raise ValueError("The length of initial guess vector should be the same number of parameters to be fit.")    
+    return result
 
-    for i, param in enumerate(fit_params):
-        eos.update_parameters(fit_bead, param, beadparams[i])
-    eos.parameter_refresh()
+class _ChainMonitor(object):
+    r"""
+    Callback of scipy.optimize.basinhopping that shares the lowest minimum of a chain and stops it once enough chains agree.
+    """
 
-    # Compute obj_function
-    obj_function = []
-    for key,data_obj in exp_dict.items():
-        try:
-            obj_function.append(data_obj.objective(eos))
-        except:
-            raise ValueError("Failed to evaluate objective function for {} of type {}.".format(key,data_obj.name))
+    def __init__(self, ichain, shared, agree_tol, nagree):
+        r"""
 
-    obj_total = np.nansum(obj_function)
-    if obj_total == 0. and np.isnan(np.sum(obj_function)):
-        obj_total = np.inf
+        Parameters
+        ----------
+        ichain : int
+            Index of the chain
+        shared : dict
+            Dictionary, or multiprocessing proxy, of the lowest minimum of each chain
+        agree_tol : float
+            Relative tolerance in objective value and parameters for two minima to be considered the same
+        nagree : int
+            Number of chains that must agree on the best result
+        """
 
-    # Write out parameters and objective functions for each dataset
-    logger.info("\nParameters: {}\nValues: {}\nExp. Data: {}\nObj. Values: {}\nTotal Obj. Value: {}".format(fit_params,beadparams,list(exp_dict.keys()),obj_function,obj_total))
+        self._ichain = ichain
+        self._shared = shared
+        self._agree_tol = agree_tol
+        self._nagree = nagree
 
-    return obj_total
+    def __call__(self, x, f, accept):
+        r"""
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Parameters of the latest local minimum
+        f : float
+            Objective value of the latest local minimum
+        accept : bool
+            Whether the minimum was accepted
+
+        Returns
+        -------
+        stop : bool
+            If True, basin hopping is stopped
+        """
+
+        logger = logging.getLogger(__name__)
+
+        if self._shared.get("stop", False):
+            return True
+
+        lowest = self._shared.get(self._ichain)
+        if lowest is None or f < lowest[0]:
+            self._shared[self._ichain] = (float(f), list(x))
+
+        minima = [value for key, value in self._shared.items() if key != "stop"]
+        fbest, xbest = min(minima, key=lambda value: value[0])
+        nsame = sum([abs(fi - fbest) <= self._agree_tol*abs(fbest) and np.allclose(xi, xbest, rtol=self._agree_tol, atol=0.0) for fi, xi in minima])
+
+        if nsame >= self._nagree:
+            logger.info("Chain {}: {} chains agree on the minimum {} at {}, stopping".format(self._ichain, nsame, fbest, xbest))
+            self._shared["stop"] = True
+            return True
+
+        return False
+
+def _basinhopping_chain(eos, inputs):
+    r"""
+    Run one basin hopping chain for :func:`multistart_basinhopping`.
+
+    Parameters
+    ----------
+    eos : obj
+        Equation of state object held by this process
+    inputs : tuple
+        Index of the chain, starting point, random seed, bounds, fit_bead, fit_params, exp_dict, global_dict, minimizer_dict, shared dictionary of lowest minima, agree_tol, nagree, and objective cache
+
+    Returns
+    -------
+    result : obj
+        scipy.optimize.OptimizeResult of the chain
+    """
+
+    ichain, beadparams0, seed, bounds, fit_bead, fit_params, exp_dict, global_dict, minimizer_dict, shared, agree_tol, nagree, cache = inputs
+
+    # The random steps of BasinStep use the global numpy random state
+    np.random.seed(seed)
+    global_dict = dict(global_dict, seed=seed, callback=_ChainMonitor(ichain, shared, agree_tol, nagree))
+
+    return _global_minimization("basinhopping", beadparams0, bounds, fit_bead, fit_params, eos, exp_dict, global_dict=global_dict, minimizer_dict=minimizer_dict, cache=cache)
+
+class ObjectiveCache(object):
+    r"""
+    Size bounded store of objective values during parameter fitting, keyed by the parameter vector rounded to a number of significant figures. Both the total and the objective value of each data set are kept. When the number of entries exceeds the maximum, those that were least recently used are removed.
+
+    """
+
+    def __init__(self, max_entries=10000, significant_figures=10, path=None):
+        r"""
+
+        Parameters
+        ----------
+        max_entries : int, Optional, default: 10000
+            Maximum number of stored parameter vectors
+        significant_figures : int, Optional, default: 10
+            Parameter values that are equal to this number of significant figures share an entry
+        path : str, Optional, default: None
+            If given, values are also saved to and read from a :class:`~despasito.utils.result_cache.ResultCache` database at this location, so that they're kept between fits. Entries are identified by the eos definition, fit parameters, and experimental data objects.
+
+        Attributes
+        ----------
+        hits : int
+            Number of objective values that were found
+        misses : int
+            Number of objective values that weren't found
+        """
+
+        self.max_entries = max_entries
+        self.significant_figures = significant_figures
+        self.hits = 0
+        self.misses = 0
+        self._stored = collections.OrderedDict()
+        self._disk = ResultCache(path, max_entries=max_entries) if path is not None else None
+        self._context = None
+        self._shared = None
+        self._shared_counts = None
+        self._shared_lock = None
+
+    def share(self, manager):
+        r"""
+        Also keep values in a dictionary of a multiprocessing manager, so that they're shared by the copies of this object that other processes hold (e.g. workers of differential_evolution). Hit and miss counts are shared as well. Once the maximum number of entries is reached, new values are only kept in the memory of each process.
+
+        Parameters
+        ----------
+        manager : obj
+            multiprocessing.Manager object, which should be running until :meth:`unshare` is called
+        """
+
+        self._shared = manager.dict()
+        self._shared_counts = manager.dict({"hits": self.hits, "misses": self.misses})
+        self._shared_lock = manager.Lock()
+        self._shared.update(self._stored)
+
+    def unshare(self):
+        r"""
+        Copy shared values and counts to this object and stop using the shared dictionary, before the manager is shut down.
+        """
+
+        if self._shared is None:
+            return
+
+        for key, value in self._shared.items():
+            if key not in self._stored:
+                self._add(key, value)
+        self.hits, self.misses = self._shared_counts["hits"], self._shared_counts["misses"]
+        self._shared, self._shared_counts, self._shared_lock = None, None, None
+
+    def _count(self, name):
+        r"""
+        Increment the number of hits or misses, in the shared counts if used.
+        """
+
+        if self._shared_counts is not None:
+            with self._shared_lock:
+                self._shared_counts[name] += 1
+        else:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def key(self, beadparams):
+        r"""
+        Round a parameter vector for use as a key.
+
+        Parameters
+        ----------
+        beadparams : numpy.ndarray
+            Parameter values
 
+        Returns
+        -------
+        key : tuple
+            Parameter values rounded to the number of significant figures
+        """
+
+        return tuple(float("{:.{}e}".format(x, self.significant_figures-1)) for x in beadparams)
+
+    def _disk_key(self, key, fit_bead, fit_params, eos, exp_dict):
+        r"""
+        Key of an entry in the database, or None if the eos object wasn't created by the eos factory.
+        """
+
+        if self._context is None:
+            if not hasattr(eos, "_eos_inputs"):
+                return None
+            exp_data = {}
+            for name, data_obj in exp_dict.items():
+                exp_data[name] = data_obj.__getstate__()
+                exp_data[name].pop("_solution", None)
+            self._context = (eos._eos_inputs, {"fit_bead": fit_bead, "fit_params": list(fit_params), "exp_data": exp_data})
+
+        return ResultCache.key(self._context[0], "fit_objective", self._context[1], {"parameters": key})
+
+    def get(self, beadparams, fit_bead, fit_params, eos, exp_dict):
+        r"""
+        Read a stored objective value.
+
+        Parameters
+        ----------
+        beadparams : numpy.ndarray
+            Parameter values
+        fit_bead : str
+            Name of bead whose parameters are being fit
+        fit_params : list[str]
+            Names of the parameters being fit
+        eos : obj
+            Equation of state object
+        exp_dict : dict
+            Dictionary of experimental data objects.
+
+        Returns
+        -------
+        value : tuple
+            Total objective value and list of objective values of each data set, or None if it isn't stored
+        """
+
+        key = self.key(beadparams)
+        if key in self._stored:
+            self._stored.move_to_end(key)
+            self._count("hits")
+            return self._stored[key]
+
+        if self._shared is not None:
+            value = self._shared.get(key)
+            if value is not None:
+                self._count("hits")
+                self._add(key, value)
+                return value
+
+        if self._disk is not None:
+            disk_key = self._disk_key(key, fit_bead, fit_params, eos, exp_dict)
+            if disk_key is not None:
+                value = self._disk.get([disk_key])[0]
+                if value is not None:
+                    self._count("hits")
+                    value = (value["total"], value["data_sets"])
+                    self._add(key, value)
+                    return value
+
+        self._count("misses")
+        return None
+
+    def set(self, beadparams, obj_total, obj_function, fit_bead, fit_params, eos, exp_dict):
+        r"""
+        Store an objective value.
+
+        Parameters
+        ----------
+        beadparams : numpy.ndarray
+            Parameter values
+        obj_total : float
+            Total objective value
+        obj_function : list[float]
+            Objective value of each data set
+        fit_bead : str
+            Name of bead whose parameters are being fit
+        fit_params : list[str]
+            Names of the parameters being fit
+        eos : obj
+            Equation of state object
+        exp_dict : dict
+            Dictionary of experimental data objects.
+        """
+
+        key = self.key(beadparams)
+        value = (float(obj_total), [float(x) for x in obj_function])
+        self._add(key, value)
+        if self._shared is not None and len(self._shared) < self.max_entries:
+            self._shared[key] = value
+
+        if self._disk is not None:
+            disk_key = self._disk_key(key, fit_bead, fit_params, eos, exp_dict)
+            if disk_key is not None:
+                self._disk.set([disk_key], [{"total": value[0], "data_sets": value[1]}])
+
+    def _add(self, key, value):
+        r"""
+        Add an entry in memory and remove the least recently used entries beyond the maximum.
+        """
+
+        self._stored[key] = value
+        self._stored.move_to_end(key)
+        while len(self._stored) > self.max_entries:
+            self._stored.popitem(last=False)
+
+    def lowest(self, n=None):
+        r"""
+        Stored parameter vectors with the lowest finite objective values. Only values in memory are considered.
+
+        Parameters
+        ----------
+        n : int, Optional, default: None
+            Number of parameter vectors. If None, all are returned.
+
+        Returns
+        -------
+        entries : list[tuple]
+            Parameter values and total objective value, in order of increasing objective
+        """
+
+        entries = [(np.array(key), value[0]) for key, value in self._stored.items() if np.isfinite(value[0])]
+        entries.sort(key=lambda x: x[1])
+
+        if n is not None:
+            entries = entries[:n]
+
+        return entries
+
+    def __str__(self):
+
+        if self._shared_counts is not None:
+            string = "{} hits, {} misses, {} shared parameter vectors".format(self._shared_counts["hits"], self._shared_counts["misses"], len(self._shared))
+        else:
+            string = "{} hits, {} misses, {} stored parameter vectors".format(self.hits, self.misses, len(self._stored))
+        return string
+
+class FitCheckpoint(ObjectiveCache):
+    r"""
+    Objective cache that is periodically written to a JSON file, together with the best parameters found and the progress of the global optimization method, so that an interrupted fit may be resumed with :func:`global_minimization`.
+
+    On resume, evaluated parameter vectors are read from the checkpoint instead of recomputed. Basin hopping continues from the best parameters with the remaining iterations and the saved random state. Differential evolution starts from a population of the best stored parameter vectors and runs the remaining generations. If fewer than five stored vectors are within the bounds, the population is random and all generations are run again. Brute repeats its grid, where evaluated points are read from the checkpoint.
+
+    When the cache is shared with other processes (see :meth:`ObjectiveCache.share`), values found by them are included when the file is written. The file is only written by the process that made this object.
+
+    """
+
+    def __init__(self, filename="despasito_checkpoint.json", interval=300.0, resume=False, **kwargs):
+        r"""
+
+        Parameters
+        ----------
+        filename : str, Optional, default: despasito_checkpoint.json
+            Checkpoint file
+        interval : float, Optional, default: 300.0
+            Minimum number of seconds between writes of the checkpoint file. The file is also written when the fit ends or is interrupted.
+        resume : bool, Optional, default: False
+            If True, :func:`global_minimization` continues the fit saved in the checkpoint file, if it exists.
+        kwargs
+            Keyword arguments of :class:`ObjectiveCache`
+
+        Attributes
+        ----------
+        best : tuple
+            Best parameter values and their total objective value
+        state : dict
+            Progress of the global optimization method, such as the number of completed iterations
+        context : dict
+            Global optimization method, fit bead, and fit parameters that the checkpoint belongs to
+        """
+
+        super().__init__(**kwargs)
+        self.filename = filename
+        self.interval = interval
+        self.resume = resume
+        self.best = (None, np.inf)
+        self.state = {"iterations": 0}
+        self.context = {}
+        self._saved = time.time()
+        self._pid = os.getpid()
+        self._skip_callback = False
+
+    def set(self, beadparams, obj_total, obj_function, fit_bead, fit_params, eos, exp_dict):
+        r"""
+        Store an objective value, update the best parameters, and write the checkpoint file if the interval has passed. See :meth:`ObjectiveCache.set`.
+        """
+
+        super().set(beadparams, obj_total, obj_function, fit_bead, fit_params, eos, exp_dict)
+        if obj_total < self.best[1]:
+            self.best = (np.array(beadparams, float), float(obj_total))
+        self.save(force=False)
+
+    def unshare(self):
+        r"""
+        Copy shared values and counts to this object, and update the best parameters with them. See :meth:`ObjectiveCache.unshare`.
+        """
+
+        if self._shared is not None:
+            self._update_best(self._shared.items())
+        super().unshare()
+
+    def _update_best(self, entries):
+        r"""
+        Update the best parameters with stored entries, which may have been added by other processes.
+        """
+
+        for key, value in entries:
+            if value[0] < self.best[1]:
+                self.best = (np.array(key, float), float(value[0]))
+
+    def callback(self, *args, **kwargs):
+        r"""
+        Count a completed iteration of basinhopping or generation of differential_evolution, and write the checkpoint file if the interval has passed.
+
+        Returns
+        -------
+        stop : bool
+            Always False, the global optimization method isn't stopped
+        """
+
+        if self._skip_callback:
+            self._skip_callback = False
+        else:
+            self.state["iterations"] += 1
+        self.save(force=False)
+
+        return False
+
+    def save(self, force=True):
+        r"""
+        Write the checkpoint file. The file is replaced in a single step, so that an interruption while writing leaves the previous checkpoint intact. Copies of this object in other processes (e.g. workers of differential_evolution) don't write.
+
+        Parameters
+        ----------
+        force : bool, Optional, default: True
+            If False, the file is only written when the interval has passed since the last write.
+        """
+
+        logger = logging.getLogger(__name__)
+
+        if os.getpid() != self._pid or (not force and time.time() - self._saved < self.interval):
+            return
+
+        # Values of other processes are only in the shared dictionary
+        stored = self._stored
+        if self._shared is not None:
+            stored = collections.OrderedDict(self._stored)
+            stored.update(self._shared.items())
+            self._update_best(stored.items())
+
+        name, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+        state = dict(self.state)
+        state["random_state"] = [name, keys.tolist(), pos, has_gauss, cached_gaussian]
+        best_x = self.best[0].tolist() if self.best[0] is not None else None
+        entries = [[list(key), value[0], value[1]] for key, value in stored.items()]
+        content = {"context": self.context, "best": {"x": best_x, "fun": self.best[1]}, "state": state, "entries": entries}
+
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        tmp_filename = "{}.tmp".format(self.filename)
+        with open(tmp_filename, "w") as f:
+            json.dump(content, f)
+        os.replace(tmp_filename, self.filename)
+
+        self._saved = time.time()
+        logger.info("Saved checkpoint with {} parameter vectors to: {}".format(len(entries), self.filename))
+
+    def load(self):
+        r"""
+        Read the checkpoint file, if it exists.
+
+        Returns
+        -------
+        loaded : bool
+            True if a checkpoint was read
+        """
+
+        logger = logging.getLogger(__name__)
+
+        if not os.path.isfile(self.filename):
+            logger.info("No checkpoint was found at {}, the fit starts from the beginning".format(self.filename))
+            return False
+
+        with open(self.filename, "r") as f:
+            content = json.load(f)
+
+        for key, value in self.context.items():
+            if key in content["context"] and content["context"][key] != value:
+                raise ValueError("The checkpoint, {}, was made with {} = {}, not {}".format(self.filename, key, content["context"][key], value))
+
+        for key, total, data_sets in content["entries"]:
+            self._add(tuple(key), (total, data_sets))
+        if content["best"]["x"] is not None:
+            self.best = (np.array(content["best"]["x"], float), float(content["best"]["fun"]))
+        self.state = content["state"]
+        if "random_state" in self.state:
+            name, keys, pos, has_gauss, cached_gaussian = self.state.pop("random_state")
+            np.random.set_state((name, np.array(keys, dtype=np.uint32), pos, has_gauss, cached_gaussian))
+
+        logger.info("Resuming from checkpoint, {}, with {} parameter vectors after {} iterations. Best objective value: {}".format(self.filename, len(content["entries"]), self.state["iterations"], self.best[1]))
+
+        return True
+
+class ObjectiveBound(object):
+    r"""
+    Lowest objective value found so far, the incumbent, used to stop evaluations in :func:`compute_obj` once the partial sum of data set objectives exceeds it.
+
+    The value returned for a stopped evaluation is a lower bound of its objective, still above the incumbent. It's only suited to methods that compare each value to the best found, as the grid of brute and the population of differential_evolution do. Local minimization (e.g. basin hopping steps, polishing, or the finish of brute) always uses complete values.
+
+    """
+
+    def __init__(self, factor=1.0):
+        r"""
+
+        Parameters
+        ----------
+        factor : float, Optional, default: 1.0
+            Evaluations stop once the partial sum exceeds this factor times the incumbent. Values larger than one keep more nearly competitive evaluations complete.
+
+        Attributes
+        ----------
+        best : float
+            Lowest complete objective value
+        aborted : int
+            Number of evaluations that were stopped
+        """
+
+        self.factor = factor
+        self._best = np.inf
+        self._aborted = 0
+        self._shared = None
+        self._shared_lock = None
+
+    @property
+    def best(self):
+        return self._shared["best"] if self._shared is not None else self._best
+
+    @best.setter
+    def best(self, value):
+        if self._shared is not None:
+            self._shared["best"] = value
+        else:
+            self._best = value
+
+    @property
+    def aborted(self):
+        return self._shared["aborted"] if self._shared is not None else self._aborted
+
+    def share(self, manager):
+        r"""
+        Keep the incumbent and number of stopped evaluations in a dictionary of a multiprocessing manager, so that they're shared by the copies of this object that other processes hold (e.g. workers of differential_evolution).
+
+        Parameters
+        ----------
+        manager : obj
+            multiprocessing.Manager object, which should be running until :meth:`unshare` is called
+        """
+
+        self._shared = manager.dict({"best": self._best, "aborted": self._aborted})
+        self._shared_lock = manager.Lock()
+
+    def unshare(self):
+        r"""
+        Copy the shared values to this object and stop using the shared dictionary, before the manager is shut down.
+        """
+
+        if self._shared is None:
+            return
+
+        self._best, self._aborted = self._shared["best"], self._shared["aborted"]
+        self._shared, self._shared_lock = None, None
+
+    def threshold(self):
+        r"""
+        Partial objective value above which an evaluation is stopped.
+
+        Returns
+        -------
+        threshold : float
+            Factor times the incumbent
+        """
+
+        return self.factor*self.best
+
+    def update(self, obj_total):
+        r"""
+        Record a complete objective value.
+
+        Parameters
+        ----------
+        obj_total : float
+            Objective value
+        """
+
+        if self._shared is not None:
+            with self._shared_lock:
+                if obj_total < self._shared["best"]:
+                    self._shared["best"] = obj_total
+        elif obj_total < self._best:
+            self._best = obj_total
+
+    def abort(self):
+        r"""
+        Count an evaluation that was stopped.
+        """
+
+        if self._shared is not None:
+            with self._shared_lock:
+                self._shared["aborted"] += 1
+        else:
+            self._aborted += 1
+
+    def __str__(self):
+
+        string = "incumbent {}, {} evaluations stopped".format(self.best, self.aborted)
+        return string
+
+def compute_obj(beadparams, fit_bead, fit_params, eos, exp_dict, pool=None, cache=None, bound=None):
+    r"""
+    Fit defined parameters for equation of state object with given experimental data. 
+
+    Each set of experimental data is converted to an object with the build in ability to evaluate its part of objective function. 
+    To add another type of supported experimental data, add a class to the fit_classes.py file.
+
+    Parameters
+    ----------
+    beadparams0 : numpy.ndarray, 
+        An array of initial guesses for parameters, these will be optimized throughout the process.
+    fit_bead : str
+        Name of bead whose parameters are being fit, should be in bead list of beadconfig
+    fit_params : list[str]
+        This list of contains the name of the parameter being fit (e.g. epsilon). See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. epsilon_CO2).
+
+    eos : obj
+        Equation of state output that writes pressure, max density, chemical potential, updates parameters, and evaluates objective functions. For parameter fitting algorithm See equation of state documentation for more details.
+    exp_dict : dict
+        Dictionary of experimental data objects.
+    pool : obj, Optional, default: None
+        :class:`~despasito.utils.parallelization.MultiprocessingJob` object. If provided, the objective of each data set is evaluated concurrently by worker processes that each hold a copy of the eos object, to which only the parameter values are sent.
+    cache : obj, Optional, default: None
+        :class:`ObjectiveCache` object. If provided, stored values are returned for repeated parameter vectors, and new values are stored.
+    bound : obj, Optional, default: None
+        :class:`ObjectiveBound` object. If provided, data sets are evaluated in order of increasing cost, and the evaluation stops once the sum of their objective values exceeds the threshold of the lowest value found so far. The partial sum is then returned, and isn't stored in the cache.
+
+    Returns
+    -------
+    Objective : float
+        Value of sum of objective values according to appropriate weights. Output file saved in current working directory.
+        
+    """
+
+    logger = logging.getLogger(__name__)
+
+    # Update beadlibrary with test paramters
+
+    if len(beadparams) != len(fit_params):
+        raise ValueError("The length of initial guess vector should be the same number of parameters to be fit.")    
+
+    if cache is not None:
+        stored = cache.get(beadparams, fit_bead, fit_params, eos, exp_dict)
+        if stored is not None:
+            obj_total, obj_function = stored
+            logger.info("\nParameters: {}\nValues: {}\nExp. Data: {}\nObj. Values: {}\nTotal Obj. Value: {} (stored, {})".format(fit_params,beadparams,list(exp_dict.keys()),obj_function,obj_total,cache))
+            if bound is not None:
+                bound.update(obj_total)
+            return obj_total
+
+    for i, param in enumerate(fit_params):
+        eos.update_parameters(fit_bead, param, beadparams[i])
+    eos.parameter_refresh()
+
+    # With early termination, the cheapest data sets are evaluated first, one at a time or one per process
+    keys = list(exp_dict.keys())
+    if bound is not None:
+        keys.sort(key=lambda key: exp_dict[key].evaluation_cost())
+        nsets = pool.ncores if pool is not None else 1
+    else:
+        nsets = len(keys)
+
+    # Compute obj_function
+    values = {}
+    for i in range(0, len(keys), nsets):
+        subset = keys[i:i+nsets]
+        if pool is not None:
+            inputs = [(fit_bead, fit_params, np.array(beadparams), exp_dict[key]) for key in subset]
+            output = pool.pool_job(_dataset_objective, inputs)
+            for key, value in zip(subset, output):
+                if value is None:
+                    raise ValueError("Failed to evaluate objective function for {} of type {}.".format(key,exp_dict[key].name))
+                values[key] = value[0]
+                exp_dict[key]._solution = value[1]
+        else:
+            for key in subset:
+                try:
+                    values[key] = exp_dict[key].objective(eos)
+                except:
+                    raise ValueError("Failed to evaluate objective function for {} of type {}.".format(key,exp_dict[key].name))
+
+        if bound is not None and len(values) < len(keys):
+            obj_partial = np.nansum(list(values.values()))
+            if obj_partial > bound.threshold():
+                bound.abort()
+                logger.info("\nParameters: {}\nValues: {}\nEvaluation stopped after {} of {} data sets, partial Obj. Value: {} exceeds {}".format(fit_params,beadparams,len(values),len(keys),obj_partial,bound.threshold()))
+                return obj_partial
+
+    obj_function = [values[key] for key in exp_dict]
+    obj_total = np.nansum(obj_function)
+    if obj_total == 0. and np.isnan(np.sum(obj_function)):
+        obj_total = np.inf
+
+    if cache is not None:
+        cache.set(beadparams, obj_total, obj_function, fit_bead, fit_params, eos, exp_dict)
+    if bound is not None:
+        bound.update(obj_total)
+
+    # Write out parameters and objective functions for each dataset
+    logger.info("\nParameters: {}\nValues: {}\nExp. Data: {}\nObj. Values: {}\nTotal Obj. Value: {}".format(fit_params,beadparams,list(exp_dict.keys()),obj_function,obj_total))
+
+    return obj_total
+
+def _dataset_objective(eos, inputs):
+    r"""
+    Evaluate the objective of one experimental data set in a worker process. The parameters of the worker's eos object are only updated if they differ from those of its previous evaluation, so that stored results are kept.
+
+    Parameters
+    ----------
+    eos : obj
+        Copy of the eos object held by the worker process
+    inputs : tuple
+        Name of the bead being fit, names of the parameters being fit, parameter values, and experimental data object
+
+    Returns
+    -------
+    obj_value : float
+        Objective value of the data set
+    solution : obj
+        Solution state of the data set's points, to be used as initial guesses in the next evaluation
+    """
+
+    fit_bead, fit_params, beadparams, data_obj = inputs
+
+    _update_worker_parameters(eos, fit_bead, fit_params, beadparams)
+    obj_value = data_obj.objective(eos)
+
+    return obj_value, data_obj._solution
+
+def _update_worker_parameters(eos, fit_bead, fit_params, beadparams):
+    r"""
+    Update the parameters of a worker's eos object if they differ from those of its previous evaluation.
+
+    Parameters
+    ----------
+    eos : obj
+        Copy of the eos object held by the worker process
+    fit_bead : str
+        Name of bead whose parameters are being fit
+    fit_params : list[str]
+        Names of the parameters being fit
+    beadparams : numpy.ndarray
+        Parameter values
+    """
+
+    global _worker_parameters
+
+    parameters = (fit_bead, tuple(fit_params), tuple(beadparams))
+    if parameters != _worker_parameters:
+        for i, param in enumerate(fit_params):
+            eos.update_parameters(fit_bead, param, beadparams[i])
+        eos.parameter_refresh()
+        _worker_parameters = parameters
+
+def compute_residuals(beadparams, fit_bead, fit_params, eos, exp_dict, pool=None):
+    r"""
+    Weighted deviations of the predictions of each experimental data set, the sum of squares of which is the value of :func:`compute_obj`.
+
+    Parameters
+    ----------
+    beadparams : numpy.ndarray
+        Parameter values
+    fit_bead : str
+        Name of bead whose parameters are being fit, should be in bead list of beadconfig
+    fit_params : list[str]
+        This list of contains the name of the parameter being fit (e.g. epsilon).
+    eos : obj
+        Equation of state object
+    exp_dict : dict
+        Dictionary of experimental data objects, each of which provides a residuals method.
+    pool : obj, Optional, default: None
+        :class:`~despasito.utils.parallelization.MultiprocessingJob` object. If provided, the residuals of each data set are evaluated concurrently.
+
+    Returns
+    -------
+    residuals : numpy.ndarray
+        Residuals of all data sets, in the order of exp_dict
+    """
+
+    logger = logging.getLogger(__name__)
+
+    if len(beadparams) != len(fit_params):
+        raise ValueError("The length of initial guess vector should be the same number of parameters to be fit.")    
+
+    for i, param in enumerate(fit_params):
+        eos.update_parameters(fit_bead, param, beadparams[i])
+    eos.parameter_refresh()
+
+    residuals = []
+    if pool is not None:
+        inputs = [(fit_bead, fit_params, np.array(beadparams), data_obj) for data_obj in exp_dict.values()]
+        output = pool.pool_job(_dataset_residuals, inputs)
+        for key, value in zip(exp_dict.keys(), output):
+            if value is None:
+                raise ValueError("Failed to evaluate residuals for {} of type {}.".format(key,exp_dict[key].name))
+            residuals.append(value[0])
+            exp_dict[key]._solution = value[1]
+    else:
+        for key,data_obj in exp_dict.items():
+            try:
+                residuals.append(data_obj.residuals(eos))
+            except:
+                raise ValueError("Failed to evaluate residuals for {} of type {}.".format(key,data_obj.name))
+
+    residuals = np.concatenate([np.ravel(x) for x in residuals])
+
+    logger.info("\nParameters: {}\nValues: {}\nExp. Data: {}\nTotal Obj. Value: {}".format(fit_params,beadparams,list(exp_dict.keys()),np.sum(residuals**2)))
+
+    return residuals
+
+def _dataset_residuals(eos, inputs):
+    r"""
+    Evaluate the residuals of one experimental data set in a worker process.
+
+    Parameters
+    ----------
+    eos : obj
+        Copy of the eos object held by the worker process
+    inputs : tuple
+        Name of the bead being fit, names of the parameters being fit, parameter values, and experimental data object
+
+    Returns
+    -------
+    residuals : numpy.ndarray
+        Residuals of the data set
+    solution : obj
+        Solution state of the data set's points, to be used as initial guesses in the next evaluation
+    """
+
+    fit_bead, fit_params, beadparams, data_obj = inputs
+
+    _update_worker_parameters(eos, fit_bead, fit_params, beadparams)
+    residuals = data_obj.residuals(eos)
+
+    return residuals, data_obj._solution
+
+def _parameter_residuals(eos, inputs):
+    r"""
+    Evaluate the residuals of all experimental data sets for one parameter vector in a worker process, used for columns of a finite difference Jacobian.
+
+    Parameters
+    ----------
+    eos : obj
+        Copy of the eos object held by the worker process
+    inputs : tuple
+        Name of the bead being fit, names of the parameters being fit, parameter values, and dictionary of experimental data objects
+
+    Returns
+    -------
+    residuals : numpy.ndarray
+        Residuals of all data sets
+    """
+
+    fit_bead, fit_params, beadparams, exp_dict = inputs
+
+    _update_worker_parameters(eos, fit_bead, fit_params, beadparams)
+
+    return np.concatenate([np.ravel(data_obj.residuals(eos)) for data_obj in exp_dict.values()])
+
+class LeastSquaresProblem(object):
+    r"""
+    Residuals of the experimental data sets and their forward difference Jacobian, as used by scipy.optimize.least_squares. The residuals of the last parameter vector are kept so that they aren't recomputed for the Jacobian. Residuals of failed state points, which aren't finite, are replaced by a penalty, as scipy.optimize.least_squares requires finite values.
+    
+    """
+
+    def __init__(self, fit_bead, fit_params, eos, exp_dict, bounds=None, pool=None, rel_step=1e-5, penalty=10.0):
+        r"""
+            
+        Parameters
+        ----------
+        fit_bead : str
+            Name of bead whose parameters are being fit
+        fit_params : list[str]
+            Names of the parameters being fit
+        eos : obj
+            Equation of state object
+        exp_dict : dict
+            Dictionary of experimental data objects
+        bounds : list[tuple], Optional, default: None
+            Bounds of each parameter. A step that would leave the bounds is taken backward.
+        pool : obj, Optional, default: None
+            :class:`~despasito.utils.parallelization.MultiprocessingJob` object. If provided, the columns of the Jacobian are evaluated concurrently, one parameter vector per job.
+        rel_step : float, Optional, default: 1e-5
+            Step in each parameter relative to its magnitude. This is larger than the usual square root of machine precision because each residual is the result of an iterative solution.
+        penalty : float, Optional, default: 10.0
+            Value of residuals that aren't finite. Residuals are weighted relative deviations, so by default a failed state point counts as a deviation of 1000%.
+
+        Attributes
+        ----------
+        nfev : int
+            Number of parameter vectors evaluated, including those of the Jacobian
+        nfailed : int
+            Number of residuals that weren't finite for the last parameter vector
+            
+        """
+
+        self._args = (fit_bead, fit_params, eos, exp_dict)
+        self._pool = pool
+        self._rel_step = rel_step
+        if bounds is None:
+            self._xmax = None
+        else:
+            self._xmax = np.transpose(np.array(bounds, float))[1]
+        self._penalty = penalty
+        self._last = None
+        self.nfev = 0
+        self.nfailed = 0
+
+    def _finite(self, residuals):
+        r"""
+        Replace residuals that aren't finite with the penalty.
+        """
+
+        return np.where(np.isfinite(residuals), residuals, self._penalty)
+
+    def residuals(self, beadparams):
+        r"""
+            
+        Parameters
+        ----------
+        beadparams : numpy.ndarray
+            Parameter values
+
+        Returns
+        -------
+        residuals : numpy.ndarray
+            Residuals of all data sets
+            
+        """
+
+        beadparams = np.array(beadparams, float)
+        if self._last is not None and np.array_equal(self._last[0], beadparams):
+            return self._last[1]
+
+        residuals = compute_residuals(beadparams, *self._args, pool=self._pool)
+        self.nfailed = int(np.sum(~np.isfinite(residuals)))
+        if self.nfailed:
+            logger = logging.getLogger(__name__)
+            logger.info("{} of {} residuals aren't finite and are replaced by the penalty, {}".format(self.nfailed, len(residuals), self._penalty))
+        residuals = self._finite(residuals)
+        self._last = (beadparams, residuals)
+        self.nfev += 1
+
+        return residuals
+
+    def jacobian(self, beadparams):
+        r"""
+            
+        Parameters
+        ----------
+        beadparams : numpy.ndarray
+            Parameter values
+
+        Returns
+        -------
+        jacobian : numpy.ndarray
+            Derivatives of each residual (rows) with respect to each parameter (columns)
+            
+        """
+
+        beadparams = np.array(beadparams, float)
+        residuals0 = self.residuals(beadparams)
+
+        steps, perturbed = _finite_difference_steps(beadparams, self._rel_step, self._xmax)
+        fit_bead, fit_params, eos, exp_dict = self._args
+        if self._pool is not None:
+            output = self._pool.pool_job(_parameter_residuals, [(fit_bead, fit_params, x, exp_dict) for x in perturbed])
+            if any(x is None for x in output):
+                raise ValueError("Failed to evaluate residuals for the finite difference Jacobian")
+        else:
+            output = [compute_residuals(x, fit_bead, fit_params, eos, exp_dict) for x in perturbed]
+        self.nfev += len(perturbed)
+
+        return np.transpose([(self._finite(output[j]) - residuals0)/steps[j] for j in range(len(beadparams))])
+
+def _finite_difference_steps(beadparams, rel_step, xmax=None):
+    r"""
+    Forward difference steps in each parameter, relative to its magnitude. A step that would exceed the upper bound is taken backward.
+
+    Parameters
+    ----------
+    beadparams : numpy.ndarray
+        Parameter values
+    rel_step : float
+        Step relative to the magnitude of each parameter
+    xmax : numpy.ndarray, Optional, default: None
+        Upper bound of each parameter
+
+    Returns
+    -------
+    steps : numpy.ndarray
+        Step in each parameter
+    perturbed : list[numpy.ndarray]
+        Parameter vectors where one parameter is perturbed by its step
+    """
+
+    steps = rel_step*np.where(beadparams != 0.0, np.abs(beadparams), 1.0)
+    if xmax is not None:
+        steps = np.where(beadparams + steps > xmax, -steps, steps)
+
+    perturbed = [beadparams + np.eye(len(beadparams))[j]*steps[j] for j in range(len(beadparams))]
+
+    return steps, perturbed
+
+def least_squares_minimizer(fun, x0, args=(), bounds=None, callback=None, rel_step=1e-5, maxiter=None, penalty=10.0, **options):
+    r"""
+    Local minimization of the objective by scipy.optimize.least_squares, using the residuals of each data set instead of the scalar objective. This function has the form of a custom method of scipy.optimize.minimize, so that it may be used as the local minimizer of basinhopping with minimizer_dict, {"method": "least_squares"}.
+
+    Parameters
+    ----------
+    fun : function
+        Scalar objective, :func:`compute_obj`. It isn't used, the residuals are evaluated with :func:`compute_residuals` instead.
+    x0 : numpy.ndarray
+        Initial guess in parameters
+    args : tuple
+        Arguments of :func:`compute_obj`: fit_bead, fit_params, eos, exp_dict, and optionally, pool and cache.
+    bounds : list[tuple], Optional, default: None
+        Bounds of each parameter
+    callback : function, Optional, default: None
+        Not supported by scipy.optimize.least_squares and ignored
+    rel_step : float, Optional, default: 1e-5
+        Relative step in each parameter for the finite difference Jacobian, see :class:`LeastSquaresProblem`
+    maxiter : int, Optional, default: None
+        Maximum number of evaluations of the residuals, passed as max_nfev
+    penalty : float, Optional, default: 10.0
+        Value of residuals of failed state points, see :class:`LeastSquaresProblem`
+    options
+        Keyword arguments of scipy.optimize.least_squares (e.g. method, ftol, xtol, x_scale, loss). The method defaults to 'trf', and x_scale to 'jac', as parameters differ by orders of magnitude.
+
+    Returns
+    -------
+    result : obj
+        scipy.optimize.OptimizeResult object, where fun is the objective value and residuals are the residuals at the solution
+    """
+
+    logger = logging.getLogger(__name__)
+
+    fit_bead, fit_params, eos, exp_dict = args[:4]
+    pool = args[4] if len(args) > 4 else None
+
+    for key in ["jac", "hess", "hessp", "constraints", "tol"]:
+        options.pop(key, None)
+    if maxiter is not None and "max_nfev" not in options:
+        options["max_nfev"] = maxiter
+    options.setdefault("method", "trf")
+    options.setdefault("x_scale", "jac")
+
+    # Basin hopping steps may leave the bounds, which least_squares doesn't accept
+    x0 = np.array(x0, float)
+    if bounds is not None and options["method"] != "lm":
+        if hasattr(bounds, "lb"):
+            bounds = list(zip(bounds.lb, bounds.ub))
+        bounds_ls = tuple(np.transpose(np.array(bounds, float)))
+        x0 = np.clip(x0, bounds_ls[0], bounds_ls[1])
+    else:
+        bounds = None
+        bounds_ls = (-np.inf, np.inf)
+
+    problem = LeastSquaresProblem(fit_bead, fit_params, eos, exp_dict, bounds=bounds, pool=pool, rel_step=rel_step, penalty=penalty)
+
+    residuals0 = problem.residuals(x0)
+    if problem.nfailed == len(residuals0):
+        logger.warning("None of the residuals are finite at the initial guess, {}, least squares minimization was not performed".format(x0))
+        return spo.OptimizeResult(x=x0, fun=np.inf, success=False, status=-1, message="None of the residuals are finite at the initial guess", nfev=problem.nfev, njev=0, nit=0)
+
+    result = spo.least_squares(problem.residuals, x0, jac=problem.jacobian, bounds=bounds_ls, **options)
+
+    return spo.OptimizeResult(x=result.x, fun=2.0*result.cost, residuals=result.fun, jac=result.jac, success=result.success, status=result.status, message=result.message, nfev=problem.nfev, njev=result.njev, nit=result.nfev)
+
+def _parameter_objective(eos, inputs):
+    r"""
+    Evaluate the objective of all experimental data sets for one parameter vector in a worker process, used for the finite difference gradient.
+
+    Parameters
+    ----------
+    eos : obj
+        Copy of the eos object held by the worker process
+    inputs : tuple
+        Name of the bead being fit, names of the parameters being fit, parameter values, and dictionary of experimental data objects
+
+    Returns
+    -------
+    obj_total : float
+        Sum of the objective values of all data sets
+    """
+
+    fit_bead, fit_params, beadparams, exp_dict = inputs
+
+    _update_worker_parameters(eos, fit_bead, fit_params, beadparams)
+
+    obj_function = [data_obj.objective(eos) for data_obj in exp_dict.values()]
+    obj_total = np.nansum(obj_function)
+    if obj_total == 0. and np.isnan(np.sum(obj_function)):
+        obj_total = np.inf
+
+    return obj_total
+
+class ObjectiveGradient(object):
+    r"""
+    Objective and its gradient with respect to the parameters being fit. The objective and gradient of the last parameter vector are kept, so that separate requests for each by scipy.optimize don't repeat the calculation.
+
+    The gradient is found by forward differences only, evaluated concurrently for each parameter if a pool is given. The objective can't be traced with autograd, since the interaction matrices of the equation of state are filled element by element when parameters are updated.
+    
+    """
+
+    def __init__(self, fit_bead, fit_params, eos, exp_dict, bounds=None, pool=None, cache=None, rel_step=1e-5):
+        r"""
+            
+        Parameters
+        ----------
+        fit_bead : str
+            Name of bead whose parameters are being fit
+        fit_params : list[str]
+            Names of the parameters being fit
+        eos : obj
+            Equation of state object
+        exp_dict : dict
+            Dictionary of experimental data objects
+        bounds : list[tuple], Optional, default: None
+            Bounds of each parameter. A step that would leave the bounds is taken backward.
+        pool : obj, Optional, default: None
+            :class:`~despasito.utils.parallelization.MultiprocessingJob` object. If provided, the objective of each data set, and then each perturbed parameter vector, is evaluated concurrently.
+        cache : obj, Optional, default: None
+            :class:`ObjectiveCache` object of stored objective values
+        rel_step : float, Optional, default: 1e-5
+            Step in each parameter relative to its magnitude
+
+        Attributes
+        ----------
+        nfev : int
+            Number of parameter vectors evaluated, including those of the gradient
+            
+        """
+
+        self._args = (fit_bead, fit_params, eos, exp_dict)
+        self._pool = pool
+        self._cache = cache
+        self._rel_step = rel_step
+        if bounds is None:
+            self._xmax = None
+        else:
+            self._xmax = np.transpose(np.array(bounds, float))[1]
+        self._last = None
+        self.nfev = 0
+
+    def __call__(self, beadparams):
+        r"""
+            
+        Parameters
+        ----------
+        beadparams : numpy.ndarray
+            Parameter values
+
+        Returns
+        -------
+        obj_total : float
+            Objective value
+        gradient : numpy.ndarray
+            Derivative of the objective with respect to each parameter
+            
+        """
+
+        beadparams = np.array(beadparams, float)
+        if self._last is not None and np.array_equal(self._last[0], beadparams):
+            return self._last[1], self._last[2]
+
+        fit_bead, fit_params, eos, exp_dict = self._args
+        obj_total = compute_obj(beadparams, fit_bead, fit_params, eos, exp_dict, pool=self._pool, cache=self._cache)
+        self.nfev += 1
+
+        steps, perturbed = _finite_difference_steps(beadparams, self._rel_step, self._xmax)
+        if self._pool is not None:
+            output = self._pool.pool_job(_parameter_objective, [(fit_bead, fit_params, x, exp_dict) for x in perturbed])
+            if any(x is None for x in output):
+                raise ValueError("Failed to evaluate objective function for the finite difference gradient")
+        else:
+            output = [compute_obj(x, fit_bead, fit_params, eos, exp_dict, cache=self._cache) for x in perturbed]
+        self.nfev += len(perturbed)
+        gradient = (np.array(output, float) - obj_total)/steps
+
+        self._last = (beadparams, obj_total, gradient)
+
+        return obj_total, gradient
+
+    def objective(self, beadparams):
+        r"""
+        Objective value, see :meth:`__call__`.
+        """
+        return self(beadparams)[0]
+
+    def gradient(self, beadparams):
+        r"""
+        Gradient of the objective, see :meth:`__call__`.
+        """
+        return self(beadparams)[1]
+
+def gradient_minimizer(fun, x0, args=(), bounds=None, callback=None, rel_step=1e-5, minimize_method="L-BFGS-B", **options):
+    r"""
+    Gradient based local minimization with the :class:`~despasito.optimization.minimizer_jax.Minimizer` wrapper of scipy.optimize.minimize, where the objective and gradient are provided by :class:`ObjectiveGradient`. This function has the form of a custom method of scipy.optimize.minimize, so that it may be used as the local minimizer of basinhopping with minimizer_dict, {"method": "minimizer_jax"}.
+
+    Parameters
+    ----------
+    fun : function
+        Scalar objective, :func:`compute_obj`. It's evaluated through :class:`ObjectiveGradient`.
+    x0 : numpy.ndarray
+        Initial guess in parameters
+    args : tuple
+        Arguments of :func:`compute_obj`: fit_bead, fit_params, eos, exp_dict, and optionally, pool and cache.
+    bounds : list[tuple], Optional, default: None
+        Bounds of each parameter
+    callback : function, Optional, default: None
+        Called after each iteration with the current parameters
+    rel_step : float, Optional, default: 1e-5
+        Relative step in each parameter for the finite difference gradient
+    minimize_method : str, Optional, default: 'L-BFGS-B'
+        Gradient based method of scipy.optimize.minimize
+    options
+        Options of the chosen method (e.g. maxiter)
+
+    Returns
+    -------
+    result : obj
+        scipy.optimize.OptimizeResult object
+    """
+
+    from despasito.optimization.minimizer_jax import Minimizer
+
+    fit_bead, fit_params, eos, exp_dict = args[:4]
+    pool = args[4] if len(args) > 4 else None
+    cache = args[5] if len(args) > 5 else None
+
+    for key in ["jac", "hess", "hessp", "constraints"]:
+        options.pop(key, None)
+    tol = options.pop("tol", None)
+
+    x0 = np.array(x0, float)
+    if bounds is not None:
+        if hasattr(bounds, "lb"):
+            bounds = list(zip(bounds.lb, bounds.ub))
+        x0 = np.clip(x0, *np.transpose(np.array(bounds, float)))
+
+    problem = ObjectiveGradient(fit_bead, fit_params, eos, exp_dict, bounds=bounds, pool=pool, cache=cache, rel_step=rel_step)
+
+    minimizer = Minimizer(problem.objective, x0, gradient=problem.gradient, method=minimize_method, bounds=bounds, tol=tol, callback=callback, options=options)
+    x, result = minimizer.minimize()
+    result.nfev = problem.nfev
+
+    return result
@@ -7,6 +7,8 @@
 
 # All folders in this directory refer back to this interface
 
+import copy
+import numpy as np
 from abc import ABC, abstractmethod
 
 
@@ -17,8 +19,39 @@ class ExpDataTemplate(ABC):
     Interface needed to create further objects to represent experimental data.
 
      Using this template all future data types will be easily exchanged.
+
+     When pickled (e.g. sent to another process), objects keep their experimental data and calculation options. Attributes listed in _transient_attributes are not sent, and are reset to None when loaded.
     """
 
+    # Attributes that are specific to the current process, such as values stored between evaluations
+    _transient_attributes = []
+
+    # Solution of each point from the last evaluation, used as initial guesses in the next. It's returned from worker processes so that warm starts persist across evaluations.
+    _solution = None
+
+    # Keys of _thermodict with one value for each data point, which are subsampled at a lower fidelity
+    _point_keys = []
+
+    # Calculation options and weights at full fidelity, kept while a lower fidelity is set
+    _full_fidelity = None
+
+    # Relative cost of evaluating one data point, used to evaluate cheaper data sets first
+    _relative_cost = 1.0
+
+    def __getstate__(self):
+        """
+        Dictionary of attributes that are pickled, omitting those in _transient_attributes.
+        """
+        return {key: value for key, value in self.__dict__.items() if key not in self._transient_attributes}
+
+    def __setstate__(self, state):
+        """
+        Restore pickled attributes and reset those in _transient_attributes.
+        """
+        self.__dict__.update(state)
+        for key in self._transient_attributes:
+            setattr(self, key, None)
+
     @abstractmethod
     def objective(self, eos):
         """
@@ -26,3 +59,62 @@ class ExpDataTemplate(ABC):
         """
         pass
 
+    def evaluation_cost(self):
+        """
+        Estimated relative cost of evaluating the objective, the number of data points times _relative_cost.
+        """
+
+        keys = [key for key in self._point_keys if key in self._thermodict]
+        npoints = len(self._thermodict[keys[0]]) if keys else 1
+
+        return self._relative_cost*npoints
+
+    def set_fidelity(self, subsample=1, rhodict=None, options=None):
+        """
+        Set the fidelity of later evaluations. With the default arguments, the full fidelity of the original data set and options is restored.
+
+        When points are subsampled, the weights are scaled by the ratio of the number of points, so that objective values at each fidelity are comparable.
+
+        Parameters
+        ----------
+        subsample : int, Optional, default: 1
+            Every subsample-th data point is evaluated
+        rhodict : dict, Optional, default: None
+            Options that replace those of rhodict, e.g. a larger density increment, rhoinc
+        options : dict, Optional, default: None
+            Other calculation options that replace those of the data set, e.g. solver tolerances
+        """
+
+        if self._full_fidelity is None:
+            self._full_fidelity = (copy.deepcopy(self._thermodict), copy.deepcopy(self.weights))
+        self._thermodict, self.weights = copy.deepcopy(self._full_fidelity)
+        self._solution = None
+
+        if subsample > 1:
+            keys = [key for key in self._point_keys if key in self._thermodict]
+            npoints = len(self._thermodict[keys[0]])
+            ind = np.arange(0, npoints, int(subsample))
+            for key in keys:
+                self._thermodict[key] = np.array(self._thermodict[key])[ind]
+            for key, value in self.weights.items():
+                value = np.array(value, float)
+                if value.ndim > 0 and len(value) == npoints:
+                    value = value[ind]
+                value = value*npoints/len(ind)
+                self.weights[key] = float(value) if value.ndim == 0 else value
+
+        if rhodict is not None:
+            self._thermodict["rhodict"] = dict(self._thermodict.get("rhodict", {}), **rhodict)
+        if options is not None:
+            self._thermodict.update(options)
+
+        if subsample <= 1 and rhodict is None and options is None:
+            self._full_fidelity = None
+
+    @abstractmethod
+    def residuals(self, eos):
+        """
+        Array of weighted deviations of each prediction from experimental data, the sum of squares of which is the objective. Used for least squares fitting, see :func:`~despasito.fit_parameters.fit_funcs.least_squares_minimizer`.
+        """
+        pass
+
@@ -13,6 +13,7 @@ from .input_output import write_output
 from .equations_of_state import eos as eos_mod
 from .thermodynamics import thermo
 from .fit_parameters import fit
+from .utils.result_cache import ResultCache
 
 def commandline_parser():
     ## Define parser functions and arguments
@@ -20,9 +21,11 @@ def commandline_parser():
     parser.add_argument("-i", "--input", dest="input", help="Input .json file with calculation instructions and path(s) to equation of state parameters. See documentation for explicit explanation. Compile docs or visit https://despasito.readthedocs.io")
     parser.add_argument("-v", "--verbose", action="count", default=0, help="Verbose level: repeat up to three times for Warning, Info, or Debug levels.")
     parser.add_argument("--log", nargs='?', dest="logFile", default="despasito.log", help="Output a log file. The default name is despasito.log.")
-    parser.add_argument("-t", "--threads", dest="threads", type=int, help="**This hasn't been implemented yet.** Set the number of threads used.",default=1)
+    parser.add_argument("-t", "--threads", dest="threads", type=int, help="Set the number of processes used to compute independent state points. A value of -1 uses all available cores. The option, threads, in the input file takes precedence.",default=1)
     parser.add_argument("-p", "--path", default=".", help="Set the location of the data/library files (e.g. SAFTcross, etc.) for despasito to look for")
     parser.add_argument("--jit", action='store_true', default=0, help="Turn on Numba's JIT compilation for accelerated computation")
+    parser.add_argument("--no-cache", dest="no_cache", action='store_true', default=False, help="Calculate all state points instead of reading results stored by previous runs with the same inputs")
+    parser.add_argument("--resume", action='store_true', default=False, help="Continue a parameter fit from the checkpoint file written by a previous, interrupted run with the same inputs. See the input option, checkpoint.")
 
     return parser
 
@@ -37,6 +40,8 @@ def run(filename="input.json", path=".", **args):
     logger.info("Begin processing input file: %s" % filename)
     eos_dict, thermo_dict, output_file = read_input.extract_calc_data(filename, path, **args)
     eos_dict['jit'] = args['jit']
+    if "threads" not in thermo_dict and args.get("threads", 1) != 1:
+        thermo_dict["threads"] = args["threads"]
 
     if output_file:
         file_dict = {"output_file":output_file}
@@ -52,13 +57,21 @@ def run(filename="input.json", path=".", **args):
     # Run either parametrization or thermodynamic calculation
     if "opt_params" in list(thermo_dict.keys()):
         logger.info("Initializing parametrization procedure")
+        if args.get("resume", False):
+            if not isinstance(thermo_dict.get("checkpoint"), dict):
+                thermo_dict["checkpoint"] = {}
+            thermo_dict["checkpoint"]["resume"] = True
         output_dict = fit(eos, thermo_dict)
         #output = fit(eos, thermo_dict)
         logger.info("Finished parametrization")
         write_output.writeout_fit_dict(output_dict,eos,**file_dict)
     else:
         logger.info("Initializing thermodynamic calculation")
-        output_dict = thermo(eos, thermo_dict)
+        if args.get("no_cache", False):
+            cache = None
+        else:
+            cache = ResultCache()
+        output_dict = thermo(eos, thermo_dict, cache=cache)
         logger.info("Finished thermodynamic calculation")
         write_output.writeout_thermo_dict(output_dict,thermo_dict["calculation_type"],**file_dict)
     
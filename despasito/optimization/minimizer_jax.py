@@ -5,12 +5,17 @@ Authors: Andrew Abi-Mansour <andrew.gaam [at] gmail [dot] com>
 License: MIT
 
 """
-import autograd.numpy as np
-import autograd
+import logging
+import numpy as np
 from scipy import optimize
 
+try:
+    import autograd
+except ImportError:
+    autograd = None
+
 class Minimizer:
-    """A wrapper class for scipy.optimize.minimize that computes derivatives with JAX (AD).
+    """A wrapper class for scipy.optimize.minimize that computes derivatives with autograd (AD), or with a given gradient function.
         Parameters
         ----------
         objective_function : callable
@@ -44,6 +49,12 @@ class Minimizer:
             arrays and `args` is a tuple of fixed parameters needed to
             completely specify the function.
             This should be the reciprocal function of precon_fwd.
+        gradient : callable, optional
+            Gradient of the objective function, with the same arguments.
+            It returns an array, or a list of arrays in the shape of
+            `optim_vars`. If None, the gradient is computed with autograd,
+            which must be installed. The objective function and gradient are
+            evaluated together, once for each point requested by scipy.
         kwargs : dict, optional
             Extra arguments passed to scipy.optimize.minimize. See
             https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
@@ -61,22 +72,24 @@ class Minimizer:
         """
 
     def __init__(self, objective_function, optim_vars, args=(), precon_fwd=None,
-             precon_bwd=None, **kwargs):
+             precon_bwd=None, gradient=None, **kwargs):
 
         # Check if there is preconditioning:
         self._precondition = precon_fwd is not None
         if self._precondition != (precon_bwd is not None):
 
             error_string = {True: 'precon_fwd', False: 'precon_bwd'}[self._precondition]
-            raise ValueError(f'You should specify both precon_fwd and precon_bwd,'
-                             ' you only specified {error_string}')
+            raise ValueError('You should specify both precon_fwd and precon_bwd,'
+                             ' you only specified {}'.format(error_string))
 
         self._optim_vars = optim_vars
         self._objective_function = objective_function
         self._args = args
         self._precon_fwd = precon_fwd
         self._precon_bwd = precon_bwd
+        self._user_gradient = gradient
         self._kwargs = kwargs
+        self._last = None
 
     @staticmethod
     def _vectorize(optim_vars):
@@ -91,17 +104,25 @@ class Minimizer:
         return optim_vars
 
     def _objFunc(self, x):
-        def _scipy_func(objective_function, gradient, x, shapes, args=()):
-            """ whatever ... """
-            optim_vars = Minimizer._split(x, shapes)
-            obj = objective_function(optim_vars, *args)
-            gradients = gradient(optim_vars, *args)
-            g_vectorized, _ = Minimizer._vectorize(gradients)
-        
-            return obj, g_vectorized
-
-        print(x)
-        return _scipy_func(self.objective_converted, self._gradient, x, self._shapes, self._args)
+        """ Objective value and vectorized gradient at x, as used by scipy.optimize.minimize with jac=True """
+
+        logger = logging.getLogger(__name__)
+
+        # Repeated requests for the same point are returned without evaluation
+        if self._last is not None and np.array_equal(self._last[0], x):
+            return self._last[1], self._last[2]
+
+        logger.debug("Minimizer evaluation at: {}".format(x))
+        optim_vars = Minimizer._split(x, self._shapes)
+        obj = self.objective_converted(optim_vars, *self._args)
+        gradients = self._gradient(optim_vars, *self._args)
+        if isinstance(gradients, np.ndarray):
+            gradients = [gradients]
+        g_vectorized, _ = Minimizer._vectorize([np.asarray(g, float) for g in gradients])
+
+        self._last = (np.array(x, copy=True), obj, g_vectorized)
+
+        return obj, g_vectorized
 
     def minimize(self, **kwargs):
 
@@ -116,18 +137,23 @@ class Minimizer:
 
         if self._precondition:
 
+            args = self._args
             self._optim_vars = self._convert_to_tuple(self._optim_vars)
-            self._args = args
-            precon_optim_vars = precon_fwd(*self._optim_vars, *args)
+            precon_optim_vars = self._precon_fwd(*self._optim_vars, *args)
+
+            if self._user_gradient is not None:
+                raise ValueError("A gradient function can't be used with preconditioning")
 
+            # The preconditioned problem is solved once, without preconditioning
+            self._precondition = False
+            self._precon_objective_function = self._objective_function
             precon_result, res = self.minimize(
-                objective_function=self.precon_objective, 
-                optim_vars = precon_optim_vars,
-                args=args, precon_fwd=None, precon_bwd=None, 
-                **kwargs)
+                objective_function=self.precon_objective,
+                optim_vars=precon_optim_vars,
+                args=args)
 
             precon_result = self._convert_to_tuple(precon_result)
-            return precon_bwd(*precon_result, *args), res
+            return self._precon_bwd(*precon_result, *args), res
 
         # Check if there are bounds:
         bounds = self._kwargs.get('bounds')
@@ -143,14 +169,20 @@ class Minimizer:
             input_is_array = False
 
         # Compute the gradient
-        self._gradient = autograd.grad(self.objective_converted)
+        if self._user_gradient is not None:
+            self._gradient = self.gradient_converted
+        elif autograd is not None:
+            self._gradient = autograd.grad(self.objective_converted)
+        else:
+            raise ImportError("autograd is needed to compute the gradient, otherwise provide the gradient function")
+        self._last = None
 
         # Vectorize optimization variables
         x0, self._shapes = Minimizer._vectorize(self._optim_vars)
 
         # Convert bounds to the correct format
         if bounds_in_kwargs:
-            bounds = self._convert_bounds(bounds, shapes)
+            bounds = self._convert_bounds(bounds, self._shapes)
             self._kwargs['bounds'] = bounds
 
         res = optimize.minimize(self._objFunc, x0, jac=True, **self._kwargs)
@@ -163,13 +195,13 @@ class Minimizer:
         return output, res
 
     def precon_objective(self, *precon_optim_vars_and_args):
-        """ whatever ... """
+        """ Objective function of the preconditioned variables """
 
-        args = precon_optim_vars_and_args[-len(self._args):]
-        optim_vars = precon_bwd(*precon_optim_vars_and_args)
+        args = precon_optim_vars_and_args[len(precon_optim_vars_and_args)-len(self._args):]
+        optim_vars = self._precon_bwd(*precon_optim_vars_and_args)
         optim_vars = self._convert_to_tuple(optim_vars)
             
-        return objective_function(*optim_vars, *args)
+        return self._precon_objective_function(*optim_vars, *args)
 
     def _convert_to_tuple(self, optim_vars):
         if type(optim_vars) not in (list, tuple):
@@ -178,9 +210,13 @@ class Minimizer:
         return optim_vars
 
     def objective_converted(self, optim_vars, *args):
-        """ Converts loss to readable jax format """
+        """ Converts loss to readable autograd format """
         return self._objective_function(*optim_vars, *args)
 
+    def gradient_converted(self, optim_vars, *args):
+        """ Evaluates the given gradient function with the same arguments as the objective """
+        return self._user_gradient(*optim_vars, *args)
+
     def _convert_bounds(self, bounds, shapes):
         output_bounds = []
         for shape, bound in zip(shapes, bounds):
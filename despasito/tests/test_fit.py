@@ -6,8 +6,12 @@ Unit and regression test for the despasito package.
 import despasito.input_output.read_input as ri
 import despasito.fit_parameters as fit
 import despasito.fit_parameters.fit_funcs as funcs
+from despasito.fit_parameters.data_classes import sat_props
+from despasito.fit_parameters.data_classes import TLVE
+from despasito.utils import parallelization
 import despasito.equations_of_state
 import pytest
+import json
 import sys
 import numpy as np
 
@@ -33,6 +37,11 @@ opt_params = {"fit_bead" : "CH3OH", "fit_params": ["epsilon"], "epsilon_bounds"
 thermo_dict = {"opt_params": opt_params, "exp_data": exp_data, "basin_dict": {"niter": 1, "niter_success": 1}, "beadparams0": [384.0], "minimizer_dict": {"tol": 1e-1, "maxiter": 25}}
 
 
+@pytest.fixture
+def exp_dict():
+    """Experimental data objects of exp_data, made for each test so that stored solutions aren't shared"""
+    return {key: sat_props.Data(dict(value)) for key, value in exp_data.items()}
+
 def test_fit_import():
 #    """Sample test, will always pass so long as import statement worked"""
     assert "despasito.fit_parameters" in sys.modules
@@ -44,3 +53,131 @@ def test_fit_1comp(eos=eos,thermo_dict=thermo_dict):
         
     assert output["final_parameters"][0]==pytest.approx(384.93,abs=5e-1) and output["objective_value"]<1.1
 
+
+def test_compute_obj_pool(exp_dict, eos=eos):
+
+    obj_serial = funcs.compute_obj(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict)
+    pool = parallelization.MultiprocessingJob(eos, ncores=2)
+    try:
+        obj_pool = funcs.compute_obj(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict, pool=pool)
+    finally:
+        pool.end_pool()
+
+    assert obj_pool==pytest.approx(obj_serial,abs=1e-8)
+
+def test_latin_hypercube():
+
+    samples = funcs.latin_hypercube([(150.0, 400.0), (0.0, 1.0)], 5, random_state=np.random.RandomState(0))
+    strata = np.floor((samples - np.array([150.0, 0.0])) / np.array([250.0, 1.0]) * 5)
+
+    assert all(sorted(strata[:, j]) == [0, 1, 2, 3, 4] for j in range(2))
+
+def test_objective_cache(tmp_path, exp_dict, eos=eos):
+
+    path = str(tmp_path / "objective.sqlite")
+    cache = funcs.ObjectiveCache(path=path)
+    obj = funcs.compute_obj(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict, cache=cache)
+    obj_stored = funcs.compute_obj(np.array([384.0+1e-12]), "CH3OH", ["epsilon"], eos, exp_dict, cache=cache)
+    obj_disk = funcs.ObjectiveCache(path=path).get(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict)
+
+    assert obj_stored == obj and (cache.hits, cache.misses) == (1, 1) and obj_disk[0] == pytest.approx(obj, abs=1e-12)
+
+def test_objective_cache_workers(exp_dict, eos=eos):
+
+    cache = funcs.ObjectiveCache()
+    funcs.global_minimization("differential_evolution", [384.0], [(370.0, 400.0)], "CH3OH", ["epsilon"], eos, exp_dict, global_dict={"maxiter": 1, "popsize": 5, "polish": False, "seed": 1}, threads=2, objective_cache=cache)
+
+    assert cache.hits + cache.misses == 10 and len(cache._stored) == 9 and cache._shared is None
+
+def test_TLVE_warm_start():
+
+    beadlibrary_PR = {'acetone': {'Tc': 508.1, 'Pc': 4690000.0, 'omega': 0.304}, 'chloroform': {'Tc': 536.4, 'Pc': 5471550.0, 'omega': 0.221902}}
+    eos_PR = despasito.equations_of_state.eos(eos="cubic.peng_robinson",beads=["acetone","chloroform"],beadlibrary=beadlibrary_PR,crosslibrary={"acetone": {"chloroform": {"kij": -0.0605}}})
+    data_obj = TLVE.Data({"name": "TLVE", "calctype": "phase_xiT", "T": [332.15, 332.15], "xi": [[0.05, 0.95], [0.95, 0.05]], "yi": [[0.03, 0.97], [0.96, 0.04]], "P": [91000.0, 108000.0]})
+    obj = data_obj.objective(eos_PR)
+    P_stored = np.array(data_obj._solution["P"])
+    # A poor stored guess must not change the result
+    data_obj._solution["P"][0] = 1e12
+    obj_warm = data_obj.objective(eos_PR)
+
+    assert P_stored==pytest.approx([91209.50, 108404.14],abs=1e-1) and obj_warm==pytest.approx(obj,abs=1e-8)
+
+def test_compute_residuals(exp_dict, eos=eos):
+
+    obj = funcs.compute_obj(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict)
+    problem = funcs.LeastSquaresProblem("CH3OH", ["epsilon"], eos, exp_dict, bounds=[(150.0, 400.0)])
+    residuals = problem.residuals(np.array([384.0]))
+    jacobian = problem.jacobian(np.array([384.0]))
+
+    assert np.sum(residuals**2)==pytest.approx(obj,abs=1e-10) and jacobian.shape == (4, 1) and problem.nfev == 2
+
+def test_residuals_failed_points(eos=eos):
+
+    # Saturation properties above the critical temperature can't be computed
+    exp_dict = {"supercritical": sat_props.Data({"name": "sat_props", "calctype": "sat_props", "T": np.array([288.1506, 600.0]), "Psat": np.array([9884.4, 1e+7])})}
+    problem = funcs.LeastSquaresProblem("CH3OH", ["epsilon"], eos, exp_dict, bounds=[(150.0, 400.0)], penalty=10.0)
+    residuals = problem.residuals(np.array([384.0]))
+    jacobian = problem.jacobian(np.array([384.0]))
+
+    assert residuals[1] == 10.0 and problem.nfailed == 1 and np.all(np.isfinite(jacobian)) and jacobian[1, 0] == 0.0
+
+def test_objective_gradient(exp_dict, eos=eos):
+
+    problem = funcs.ObjectiveGradient("CH3OH", ["epsilon"], eos, exp_dict, bounds=[(150.0, 400.0)])
+    obj = problem.objective(np.array([384.0]))
+    gradient = problem.gradient(np.array([384.0]))
+
+    assert obj==pytest.approx(1.023017,abs=1e-5) and gradient[0]==pytest.approx(-0.002696,abs=1e-5) and problem.nfev == 2
+
+def test_set_fidelity():
+
+    data_obj = TLVE.Data({"name": "TLVE", "calctype": "phase_xiT", "T": [332.15, 332.15, 332.15], "xi": [[0.05, 0.95], [0.5, 0.5], [0.95, 0.05]], "yi": [[0.03, 0.97], [0.5, 0.5], [0.96, 0.04]], "P": [91000.0, 95000.0, 108000.0], "weights": {"P": [1.0, 2.0, 3.0]}})
+    data_obj.set_fidelity(subsample=2, rhodict={"rhoinc": 50.0})
+    low = (len(data_obj._thermodict["Tlist"]), list(data_obj.weights["Plist"]), data_obj._thermodict["rhodict"]["rhoinc"])
+    data_obj.set_fidelity()
+
+    assert low == (2, [1.5, 4.5], 50.0) and len(data_obj._thermodict["Tlist"]) == 3 and data_obj.weights["Plist"] == [1.0, 2.0, 3.0] and data_obj._thermodict["rhodict"]["rhoinc"] == 10.0
+
+def test_multifidelity_brute(exp_dict, eos=eos):
+
+    fidelity = {"npromote": 2, "polish": False}
+    result = funcs.global_minimization("brute", [384.0], [(380.0, 390.0)], "CH3OH", ["epsilon"], eos, exp_dict, global_dict={"Ns": 3, "finish": None}, fidelity=fidelity)
+
+    assert len(result.candidates) == 2 and result.candidates[0]["x"] == pytest.approx(result.low_fidelity.x, abs=1e-12) and np.isfinite(result.fun)
+
+def test_objective_bound(exp_dict, eos=eos):
+
+    bound = funcs.ObjectiveBound()
+    obj = funcs.compute_obj(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict, bound=bound)
+    bound.best = 1e-3
+    obj_partial = funcs.compute_obj(np.array([384.0]), "CH3OH", ["epsilon"], eos, exp_dict, bound=bound)
+
+    assert obj_partial < obj and obj_partial > 1e-3 and bound.aborted == 1
+
+def test_objective_bound_workers(exp_dict, eos=eos):
+
+    bound = funcs.ObjectiveBound()
+    global_dict = {"maxiter": 1, "popsize": 5, "seed": 1, "polish": False}
+    result = funcs.global_minimization("differential_evolution", [384.0], [(300.0, 450.0)], "CH3OH", ["epsilon"], eos, exp_dict, global_dict=global_dict, threads=2, objective_cache=False, early_abort=bound)
+
+    assert bound.best == pytest.approx(result.fun, abs=1e-12) and bound.aborted > 0 and bound._shared is None
+
+def test_fit_checkpoint(tmp_path, exp_dict, eos=eos):
+
+    filename = str(tmp_path / "checkpoint.json")
+    global_dict = {"Ns": 3, "finish": None}
+    x = funcs.global_minimization("brute", [384.0], [(380.0, 390.0)], "CH3OH", ["epsilon"], eos, exp_dict, global_dict=global_dict, checkpoint={"filename": filename})
+    checkpoint = funcs.FitCheckpoint(filename=filename, resume=True)
+    x_resumed = funcs.global_minimization("brute", [384.0], [(380.0, 390.0)], "CH3OH", ["epsilon"], eos, exp_dict, global_dict=global_dict, checkpoint=checkpoint)
+
+    assert x_resumed == pytest.approx(x, abs=1e-12) and checkpoint.best[0][0] == pytest.approx(x, abs=1e-12) and (checkpoint.hits, checkpoint.misses) == (3, 0)
+
+def test_fit_checkpoint_workers(tmp_path, exp_dict, eos=eos):
+
+    filename = str(tmp_path / "checkpoint.json")
+    global_dict = {"maxiter": 1, "popsize": 5, "seed": 1, "polish": False}
+    result = funcs.global_minimization("differential_evolution", [384.0], [(300.0, 450.0)], "CH3OH", ["epsilon"], eos, exp_dict, global_dict=global_dict, threads=2, checkpoint={"filename": filename, "interval": 0.0})
+    with open(filename, "r") as f:
+        content = json.load(f)
+
+    assert len(content["entries"]) == 9 and content["best"]["fun"] == pytest.approx(result.fun, abs=1e-12) and content["best"]["x"] == pytest.approx(result.x, abs=1e-6)
@@ -9,6 +9,7 @@ import despasito.equations_of_state.saft.gamma_mie_funcs
 import despasito.equations_of_state.saft.solv_assoc as solv_assoc
 
 import pytest
+import pickle
 import sys
 import numpy as np
 
@@ -66,3 +67,9 @@ def test_saft_gamma_mie_class_assoc_mu(P=P,xi=xi_co2_h2o,T=T,eos=eos_co2_h2o,rho
     assert phi == pytest.approx(np.array([4.35827475, 0.02554506]),abs=1e-4)
 
 
+
+def test_saft_gamma_mie_pickle(T=T,xi=xi_co2_h2o,eos=eos_co2_h2o,rho=rho_co2_h2o):
+#   """Test that a pickled EOS object is rebuilt from its parameter tables"""
+    eos.P(rho,T,xi)
+    eos_copy = pickle.loads(pickle.dumps(eos))
+    assert not hasattr(eos_copy, "_dkk") and eos_copy.P(rho,T,xi)[0] == pytest.approx(14807941.78,abs=1e-1)
@@ -6,6 +6,7 @@ Unit and regression test for the despasito package.
 import despasito.thermodynamics.calc as calc
 import despasito.thermodynamics as thermo
 import despasito.equations_of_state
+from despasito.utils.result_cache import ResultCache
 import pytest
 import sys
 import numpy as np
@@ -36,6 +37,11 @@ epsilonHB_co2_h2o = np.array([[[[   0.,     0.,     0. ], \
                        [   0.,     0.,     0. ]]]])
 eos_co2_h2o = despasito.equations_of_state.eos(eos="saft.gamma_mie",beads=beads_co2_h2o,nui=nui_co2_h2o,beadlibrary=beadlibrary_co2_h2o,crosslibrary=crosslibrary_co2_h2o,sitenames=sitenames_co2_h2o)
 
+beads_PR = ["acetone","chloroform"]
+beadlibrary_PR = {'acetone': {'Tc': 508.1, 'Pc': 4690000.0, 'omega': 0.304}, 'chloroform': {'Tc': 536.4, 'Pc': 5471550.0, 'omega': 0.221902}}
+crosslibrary_PR = {"acetone": {"chloroform": {"kij": -0.0605}}}
+eos_PR = despasito.equations_of_state.eos(eos="cubic.peng_robinson",beads=beads_PR,beadlibrary=beadlibrary_PR,crosslibrary=crosslibrary_PR)
+
 def test_thermo_import():
 #    """Sample test, will always pass so long as import statement worked"""
     assert "despasito.thermodynamics" in sys.modules
@@ -70,4 +76,153 @@ def test_vapor_properties(eos=eos_co2_h2o,Tlist=Tlist,yilist=yilist,Plist=Plist)
 
 #    assert output["rhov"][0]==pytest.approx(37.85937201,abs=1e-1) and output["phiv"][0]==pytest.approx(np.array([2.45619145, 0.37836741]),abs=1e-1)
     assert output["rhov"][0]==pytest.approx(2156.81,abs=1e-1) and output["phiv"][0]==pytest.approx(np.array([0.90729601, 0.13974291]),abs=1e-1)
-    
+
+def test_critical_point(eos=eos_PR):
+
+    Tc, Pc, rhoc = calc.calc_critical_point(np.array([1.0, 0.0]), eos, Tguess=600.)
+
+    assert Tc==pytest.approx(508.1,abs=1e-3) and Pc==pytest.approx(4690000.0,abs=1e+1)
+
+def test_setPsat(eos=eos_PR):
+
+    Psat, NaNbead = calc.setPsat(1, 600., eos)
+
+    assert Psat==pytest.approx(10984221.6,rel=1e-3) and NaNbead=="chloroform"
+
+def test_tangent_plane_distance(eos=eos_PR):
+
+    yi = np.array([0.89, 0.11])
+    phiv, rhov, flagv = calc.calc_phiv(2e+5, 332.15, yi, eos)
+    wi, tm, phil, flagl = calc.calc_tangent_plane_distance(2e+5, 332.15, yi, phiv, eos, trial_phase="liquid")
+
+    assert tm < 0. and flagl == 1 and wi==pytest.approx(np.array([0.81103, 0.18897]),abs=1e-4)
+
+def test_accelerate_substitution():
+
+    A = np.array([[0.5, 0.1], [0.2, 0.3]])
+    b = np.array([1.0, 2.0])
+    x_hist, g_hist = [np.zeros(2)], [b]
+    for i in range(2):
+        x_hist.append(g_hist[-1])
+        g_hist.append(np.dot(A, x_hist[-1]) + b)
+    x_new, flag = calc.accelerate_substitution(x_hist, g_hist, method="anderson")
+
+    assert flag and x_new==pytest.approx(np.linalg.solve(np.eye(2)-A, b),abs=1e-8)
+
+def test_saturation_newton(eos=eos_PR):
+
+    P, xi, flagv, flagl, success = calc.calc_saturation_newton(np.array([0.89, 0.11]), 332.15, 1e+5, np.array([0.85, 0.15]), eos, feed_phase="vapor")
+
+    assert success and flagl == 1 and P==pytest.approx(99113.86,abs=1e-1) and xi==pytest.approx(np.array([0.81089, 0.18911]),abs=1e-4)
+
+def test_phase_solver_state(eos=eos_PR):
+
+    state = calc.PhaseSolverState()
+    P, yi, flagv, flagl, obj = calc.calc_xT_phase(np.array([0.5, 0.5]), 332.15, eos, meth="newton", state=state)
+
+    assert P==pytest.approx(84694.33,abs=1e-1) and state.yi==pytest.approx(yi,abs=1e-8) and state.P==pytest.approx(P,abs=1e-8)
+
+def test_liquid_properties_threads(eos=eos_co2_h2o,Tlist=Tlist,xilist=xilist,Plist=Plist):
+
+    output = thermo.thermo(eos,{"calculation_type":"liquid_properties","Tlist":Tlist,"Plist":Plist,"xilist":xilist,"threads":2})
+
+    assert output["rhol"][0]==pytest.approx(54156.297,abs=1e-1) and output["phil"][0]==pytest.approx(np.array([6.04140887e+01, 2.79514245e-03]),abs=1e-1)
+
+def test_saturation_envelope(eos=eos_PR):
+
+    output = calc.calc_saturation_envelope(np.array([[1.0, 0.0], [0.9, 0.1], [0.7, 0.3]]), np.array([332.15, 332.15, 332.15]), eos)
+
+    assert output[1][0]==pytest.approx(104997.47,abs=1e-1) and output[2][0]==pytest.approx(92565.90,abs=1e-1) and output[2][1]==pytest.approx(np.array([0.79094563, 0.20905437]),abs=1e-5)
+
+def test_flash(eos=eos_PR):
+
+    output = thermo.thermo(eos,{"calculation_type":"flash","Tlist":[332.15],"Plist":[95000.0, 2e+5],"zilist":[[0.8, 0.2], [0.5, 0.5]]})
+
+    assert output["beta"][0]==pytest.approx(0.62993,abs=1e-4) and output["xi"][0]==pytest.approx(np.array([0.74356, 0.25644]),abs=1e-4) and output["yi"][0]==pytest.approx(np.array([0.83316, 0.16684]),abs=1e-4) and output["beta"][1]==0.0
+
+def test_flash_near_azeotrope(eos=eos_PR):
+
+    xi, yi, beta, flagl, flagv = calc.calc_PT_phase(83212.13, 332.15, np.array([0.38, 0.62]), eos)
+
+    assert beta==pytest.approx(0.3851,abs=1e-3) and xi[0]==pytest.approx(0.37907,abs=1e-4) and yi[0]==pytest.approx(0.38149,abs=1e-4)
+
+def test_derived_properties(eos=eos_PR):
+
+    output = calc.calc_derived_properties(np.array([10000.0, 40.0]), 332.15, np.array([0.8, 0.2]), eos, Cp_ideal=np.array([75.0, 65.0]), massi=np.array([0.05808, 0.11938]))
+
+    assert output["Ures"]==pytest.approx(np.array([-24618.18, -145.391]),abs=1e-1) and output["Z"][1]==pytest.approx(0.96897,abs=1e-5) and output["speed_of_sound"][1]==pytest.approx(205.15,abs=1e-1)
+
+def test_solubility_parameter(eos=eos_PR):
+
+    output = thermo.thermo(eos,{"calculation_type":"solubility_parameter","Tlist":[298.15],"xilist":[[1.0, 0.0]]})
+    delta = calc.hildebrand_solubility(output["rhol"][0], np.array([1.0, 0.0]), 298.15, eos, method="integration")
+
+    assert output["delta"][0]==pytest.approx(18586.67,abs=1e-1) and delta==pytest.approx(output["delta"][0],rel=1e-3)
+
+def test_sat_props_failed_point(eos=eos_PR):
+
+    output = thermo.thermo(eos,{"calculation_type":"sat_props","Tlist":[298.15, 298.15, 298.15],"xilist":[[1.0, 0.0], [0.5, 0.5], [0.0, 1.0]]})
+    Psat = calc.calc_Psat(298.15, np.array([0.0, 1.0]), eos)[0]
+
+    assert np.all(np.isfinite(output["Psat"][[0, 2]])) and np.isnan(output["Psat"][1]) and output["Psat"][2]==pytest.approx(Psat,abs=1e-6)
+
+def test_spinodal(eos=eos_PR):
+
+    spinodal = calc.calc_spinodal(332.15, np.array([0.5, 0.5]), eos)
+    rhov, flagv = calc.calc_rhov(1e+6, 332.15, np.array([0.5, 0.5]), eos)
+
+    assert spinodal["P_vapor"]==pytest.approx(985835.6,abs=1e+0) and spinodal["rho_liquid"]==pytest.approx(9528.20,abs=1e-1) and flagv == 1 and rhov==pytest.approx(12124.1537,abs=1e-3)
+
+def test_spinodal_density_range(eos=eos_PR):
+
+    spinodal = calc.calc_spinodal(332.15, np.array([0.5, 0.5]), eos)
+    spinodal_maxrho = calc.calc_spinodal(332.15, np.array([0.5, 0.5]), eos, rhodict={"maxrho": 12000.0})
+
+    assert spinodal_maxrho["rho"][-1]==pytest.approx(12000.0,abs=1e-6) and spinodal["rho"][-1]==pytest.approx(13484.394,abs=1e-3)
+
+def test_chebyshev_proxy(eos=eos_PR):
+
+    proxy = calc.calc_chebyshev_proxy(332.15, np.array([0.5, 0.5]), eos)
+    rhov, flagv = calc.calc_rhov(1e+5, 332.15, np.array([0.5, 0.5]), eos, rhodict={"root_method": "chebyshev"})
+    rhol, flagl = calc.calc_rhol(1e+5, 332.15, np.array([0.5, 0.5]), eos, rhodict={"root_method": "chebyshev"})
+
+    assert proxy["P_vapor"]==pytest.approx(985835.6,abs=1e+0) and flagv == 0 and rhov==pytest.approx(37.2848,abs=1e-3) and flagl == 1 and rhol==pytest.approx(12105.743,abs=1e-2)
+
+def test_pure_Psat(eos=eos_PR):
+
+    calc.calc_pure_Psat(0, 320.0, eos)
+    calc.calc_pure_Psat(0, 330.0, eos)
+    Psat, rhol, rhov = calc.calc_pure_Psat(0, 325.0, eos)
+
+    assert Psat==pytest.approx(87393.35,abs=1e-1) and rhol==pytest.approx(11473.64,abs=1e-1) and 325.0 not in calc._eos_cache(eos, "Psat")[(0, ())]
+
+def test_pure_Psat_density_range(eos=eos_PR):
+
+    calc.calc_pure_Psat(0, 320.0, eos)
+    calc.calc_pure_Psat(0, 320.0, eos, rhodict={"maxrho": 12000.0})
+
+    assert 320.0 in calc._eos_cache(eos, "Psat")[(0, (("maxrho", "12000.0"),))]
+
+def test_bubble_points(eos=eos_PR):
+
+    output = thermo.thermo(eos, {"calculation_type":"phase_xiT","Tlist":[332.15],"xilist":[[0.05, 0.95], [0.95, 0.05]],"vectorize":True})
+
+    assert output["P"]==pytest.approx([91209.50, 108404.14],abs=1e-1) and output["yi"][0][0]==pytest.approx(0.030132,abs=1e-5)
+
+def test_result_cache(tmp_path, eos=eos_PR):
+
+    cache = ResultCache(str(tmp_path / "results.sqlite"), max_entries=2)
+    thermo_dict = {"calculation_type":"liquid_properties","Tlist":[298.15],"Plist":[101325.0, 2e+5],"xilist":[[1.0, 0.0], [1.0, 0.0]]}
+    output = thermo.thermo(eos, dict(thermo_dict), cache=cache)
+    output_cached = thermo.thermo(eos, dict(thermo_dict), cache=cache)
+    thermo.thermo(eos, dict(thermo_dict, Plist=[3e+5], xilist=[[1.0, 0.0]]), cache=cache)
+
+    assert output_cached["rhol"]==pytest.approx(output["rhol"],abs=1e-8) and output_cached["phil"].shape == (2, 2) and cache.get([cache.key(eos._eos_inputs, "liquid_properties", {}, {"Tlist": 298.15, "Plist": 3e+5, "xilist": [1.0, 0.0]})])[0] is not None
+
+def test_result_cache_failed_points(tmp_path, eos=eos_PR):
+
+    cache = ResultCache(str(tmp_path / "results.sqlite"))
+    thermo.thermo(eos, {"calculation_type":"flash","Tlist":[332.15],"Plist":[95000.0, 2e+5],"zilist":[[0.8, 0.2], [0.5, 0.5]]}, cache=cache)
+    keys = [cache.key(eos._eos_inputs, "flash", {}, {"Tlist": 332.15, "Plist": P, "zilist": zi}) for P, zi in [(95000.0, [0.8, 0.2]), (2e+5, [0.5, 0.5])]]
+
+    assert [value is not None for value in cache.get(keys)] == [True, False]
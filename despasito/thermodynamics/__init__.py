@@ -7,11 +7,15 @@ This package will take in an equation of state object, and any user defined vari
 
 # Add imports here
 from inspect import getmembers, isfunction
-#import logging
+import logging
+import numpy as np
 
 from . import calc_types
 
-def thermo(eos, thermo_dict):
+# Inputs given for each state point, all other inputs are options shared by all points
+_point_keys = ["Tlist", "Plist", "xilist", "yilist", "zilist", "Pguess", "xiguess", "yiguess"]
+
+def thermo(eos, thermo_dict, cache=None):
     """
     Use factory design pattern to search for matching calctype with those supported in this module.
     
@@ -23,6 +27,8 @@ def thermo(eos, thermo_dict):
             Equation of state output that writes pressure, max density, and chemical potential
         thermo_dict : dict
             Other keywords passed to the function, depends on calculation type
+        cache : obj, Optional, default: None
+            A :class:`~despasito.utils.result_cache.ResultCache` object. If given, stored state points are read and only the missing points are calculated.
                 
 
     Returns
@@ -55,9 +61,112 @@ def thermo(eos, thermo_dict):
         raise ImportError("The calculation type, '"+calctype+"', was not found\nThe following calculation types are supported: "+", ".join(calc_list))
 
     try:
-        output_dict = func(eos, sys_dict, **kwargs)
+        if cache is None:
+            output_dict = func(eos, sys_dict, **kwargs)
+        else:
+            output_dict = _cached_thermo(func, calctype, eos, sys_dict, kwargs, cache)
     except:
         raise TypeError("The calculation type, '"+calctype+"', failed")
 
     return output_dict
 
+def _failed_point(result):
+    """
+    Identify the result of a state point that failed, from non-finite values or a flag of 3, which means that neither a vapor nor a liquid was found.
+
+    Parameters
+    ----------
+        result : dict
+            Output values of one state point
+
+    Returns
+    -------
+        failed : bool
+            True if the state point failed
+    """
+
+    for key, value in result.items():
+        value = np.array(value)
+        if np.issubdtype(value.dtype, np.number) and not np.all(np.isfinite(value)):
+            return True
+        if key.startswith("flag") and np.any(value == 3):
+            return True
+
+    return False
+
+def _cached_thermo(func, calctype, eos, sys_dict, kwargs, cache):
+    """
+    Evaluate a calculation type, reading stored state points from a cache and calculating only those that are missing.
+
+    State points are defined by the list inputs in _point_keys, where a list of length one is shared by all points. Failed state points, see :func:`_failed_point`, aren't stored. If the eos parameters were changed after it was created, or the inputs or outputs can't be split into state points, the calculation is performed without the cache.
+
+    Parameters
+    ----------
+        func : function
+            Calculation type function from :mod:`~despasito.thermodynamics.calc_types`
+        calctype : str
+            Name of the calculation type
+        eos : obj
+            Equation of state output that writes pressure, max density, and chemical potential
+        sys_dict : dict
+            Inputs of the calculation type
+        kwargs : dict
+            Keyword arguments of the calculation type
+        cache : obj
+            A :class:`~despasito.utils.result_cache.ResultCache` object
+
+    Returns
+    -------
+        output_dict : dict
+            Output of dictionary containing given and calculated values
+    """
+
+    logger = logging.getLogger(__name__)
+
+    eos_inputs = getattr(eos, "_eos_inputs", None)
+    if eos_inputs is None or getattr(eos, "_parameter_version", 0) != 0:
+        logger.info("The eos object doesn't match its input definition, the result cache isn't used")
+        return func(eos, sys_dict, **kwargs)
+
+    point_inputs = {}
+    for key in _point_keys:
+        if key in sys_dict:
+            value = np.array(sys_dict[key], float)
+            point_inputs[key] = value[np.newaxis] if value.ndim == 0 else value
+    npts = max([len(value) for value in point_inputs.values()] + [0])
+    if npts == 0 or any([len(value) not in [1, npts] for value in point_inputs.values()]):
+        logger.info("Inputs couldn't be separated into state points, the result cache isn't used")
+        return func(eos, sys_dict, **kwargs)
+
+    options = {key: value for key, value in sys_dict.items() if key not in _point_keys and key != "threads"}
+    states = [{key: value[0] if len(value) == 1 else value[i] for key, value in point_inputs.items()} for i in range(npts)]
+    keys = [cache.key(eos_inputs, calctype, options, state) for state in states]
+    results = cache.get(keys)
+    missing = [i for i, result in enumerate(results) if result is None]
+    logger.info("Read {} of {} state points from the result cache".format(npts-len(missing), npts))
+
+    if missing:
+        new_dict = dict(sys_dict)
+        for key, value in point_inputs.items():
+            new_dict[key] = value if len(value) == 1 else value[missing]
+        output_dict = func(eos, new_dict, **kwargs)
+
+        if any([np.shape(value)[:1] != (len(missing),) for value in output_dict.values()]):
+            logger.info("Output couldn't be separated into state points, the result cache isn't used")
+            if len(missing) == npts:
+                return output_dict
+            else:
+                return func(eos, sys_dict, **kwargs)
+
+        new_results = [{key: np.array(value)[j] for key, value in output_dict.items()} for j in range(len(missing))]
+        # Failed points aren't stored, so that they're calculated again by later runs (e.g. after a solver fix or with another initial guess)
+        stored = [j for j, result in enumerate(new_results) if not _failed_point(result)]
+        if len(stored) < len(missing):
+            logger.info("{} failed state points weren't stored in the result cache".format(len(missing)-len(stored)))
+        if stored:
+            cache.set([keys[missing[j]] for j in stored], [new_results[j] for j in stored])
+        for i, result in zip(missing, new_results):
+            results[i] = result
+
+    return {key: np.array([result[key] for result in results]) for key in results[0]}
+
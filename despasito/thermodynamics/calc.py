@@ -7,7 +7,6 @@ import numpy as np
 from scipy import interpolate
 import scipy.optimize as spo
 from scipy.ndimage.filters import gaussian_filter1d
-import copy
 #import matplotlib.pyplot as plt
 import logging
 from . import fund_constants as constants
@@ -117,7 +116,7 @@ def calc_CC_Pguess(xilist, Tlist, CriticalProp):
             eos = eos("saft.gamma_mie",**eos_dict)
     
             if (Tlist[kk] < Tc_tmp):
-                Psat_tmp, _, _ = calc_Psat(Tlist[kk], np.array([1.0]), eos)
+                Psat_tmp, _, _ = calc_pure_Psat(0, Tlist[kk], eos)
             else:
                 Psat_tmp = np.nan
     
@@ -135,6 +134,282 @@ def calc_CC_Pguess(xilist, Tlist, CriticalProp):
 
     return Psatm
 
+######################################################################
+#                                                                    #
+#                       Phase Solver State                           #
+#                                                                    #
+######################################################################
+class PhaseSolverState(object):
+    r"""
+    Warm-start values carried between bubble and dew point calculations.
+
+    One instance should be used for a series of related calculations (e.g. a list of compositions at the same temperature), so that the converged composition of one point is the initial guess of the next. Unrelated calculations should use separate instances.
+    
+    """
+
+    def __init__(self, xi=None, yi=None, P=None, rhol=None, rhov=None):
+        r"""
+            
+        Parameters
+        ----------
+        xi : numpy.ndarray, Optional, default: None
+            Guess in liquid mole fraction of each component
+        yi : numpy.ndarray, Optional, default: None
+            Guess in vapor mole fraction of each component
+        P : float, Optional, default: None
+            Pressure of the last converged calculation [Pa]
+        rhol : float, Optional, default: None
+            Liquid molar density of the last converged calculation [mol/m^3]
+        rhov : float, Optional, default: None
+            Vapor molar density of the last converged calculation [mol/m^3]
+
+        Attributes
+        ----------
+        xi : numpy.ndarray
+            Guess in liquid mole fraction of each component
+        yi : numpy.ndarray
+            Guess in vapor mole fraction of each component
+        P : float
+            Pressure of the last converged calculation [Pa]
+        rhol : float
+            Liquid molar density of the last converged calculation [mol/m^3]
+        rhov : float
+            Vapor molar density of the last converged calculation [mol/m^3]
+            
+        """
+
+        self.xi = None if xi is None else np.array(xi, float)
+        self.yi = None if yi is None else np.array(yi, float)
+        self.P = P
+        self.rhol = rhol
+        self.rhov = rhov
+
+    def valid_guess(self, name, ncomp):
+        r"""
+        Check whether a stored composition may be used as an initial guess.
+            
+        Parameters
+        ----------
+        name : str
+            Either "xi" or "yi"
+        ncomp : int
+            Number of components in the system
+
+        Returns
+        -------
+        valid : bool
+            True if the composition exists, has the right number of components, and contains no NaN values
+            
+        """
+
+        zi = getattr(self, name)
+        return (zi is not None and len(zi) == ncomp and not any(np.isnan(zi)))
+
+    def reset(self):
+        r"""
+        Remove all stored values.
+        """
+
+        self.xi = None
+        self.yi = None
+        self.P = None
+        self.rhol = None
+        self.rhov = None
+
+######################################################################
+#                                                                    #
+#                     Stored EOS Results                             #
+#                                                                    #
+######################################################################
+def _eos_cache(eos, name):
+    r"""
+    Access a dictionary of stored results attached to the eos object.
+
+    Stored results are only valid for the current parameters of the eos object. If the attribute, _parameter_version, has changed since the results were stored, the dictionary is emptied.
+
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    name : str
+        Name of the type of result stored (e.g. "critical_point")
+
+    Returns
+    -------
+    cache : dict
+        Dictionary of stored results for the current parameter version
+    """
+
+    version = getattr(eos, "_parameter_version", 0)
+    if not hasattr(eos, "_thermo_cache"):
+        eos._thermo_cache = {}
+
+    if name not in eos._thermo_cache or eos._thermo_cache[name]["version"] != version:
+        eos._thermo_cache[name] = {"version": version, "data": {}}
+
+    return eos._thermo_cache[name]["data"]
+
+######################################################################
+#                                                                    #
+#                  Pure Component Critical Point                     #
+#                                                                    #
+######################################################################
+def _dPdrho_min(T, xi, eos, npts=200, step=1e-4):
+    r"""
+    Find the density where :math:`\partial P / \partial \rho` is at a minimum, which is where :math:`\partial^2 P / \partial \rho^2 = 0`.
+
+    A coarse density grid up to the maximum density is used to locate the inflection point before refining with a bounded scalar minimization.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of the system [K]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    npts : int, Optional, default: 200
+        Number of densities in the coarse grid
+    step : float, Optional, default: 1e-4
+        Relative step size used in the central difference of pressure with respect to density
+
+    Returns
+    -------
+    dPdrho : float
+        Minimum value of the derivative of pressure with respect to density [Pa*m^3/mol]
+    rho : float
+        Density at the inflection point [mol/:math:`m^3`]
+    """
+
+    maxrho = eos.density_max(xi, T)
+    rholist = np.linspace(maxrho/npts, maxrho*0.9, npts)
+    dPdrho_list = np.gradient(eos.P(rholist, T, xi), rholist)
+    ind = np.argmin(dPdrho_list[1:-1]) + 1
+
+    def dPdrho(rho):
+        return float((eos.P(rho*(1+step), T, xi) - eos.P(rho*(1-step), T, xi))/(2*rho*step))
+
+    result = spo.minimize_scalar(dPdrho, bounds=(rholist[ind-1], rholist[ind+1]), method="bounded")
+
+    return result.fun, result.x
+
+def calc_critical_point(xi, eos, Tguess=None, maxiter=30):
+    r"""
+    Computes the critical point of a pure component, where :math:`\partial P / \partial \rho = \partial^2 P / \partial \rho^2 = 0`.
+
+    The temperature where the minimum of :math:`\partial P / \partial \rho` is zero is found with Brent's method. Results are stored with the eos object for each component and are recomputed when eos parameters are updated.
+
+    Parameters
+    ----------
+    xi : numpy.ndarray
+        Mole fraction of each component, only one component should be nonzero
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    Tguess : float, Optional, default: None
+        Temperature used to start the search for a temperature range containing the critical point. If None, 300 K is used.
+    maxiter : int, Optional, default: 30
+        Maximum number of times the temperature range is expanded
+
+    Returns
+    -------
+    Tc : float
+        Critical temperature [K]
+    Pc : float
+        Critical pressure [Pa]
+    rhoc : float
+        Critical density [mol/:math:`m^3`]
+    """
+
+    logger = logging.getLogger(__name__)
+
+    xi = np.array(xi, float)
+    if np.count_nonzero(xi) != 1:
+        raise ValueError("The critical point is only computed for a single component, given mole fractions: {}".format(xi))
+    ind = int(np.nonzero(xi)[0][0])
+    xi = xi/np.sum(xi)
+
+    cache = _eos_cache(eos, "critical_point")
+    if ind in cache:
+        return cache[ind]
+
+    def obj(T):
+        return _dPdrho_min(T, xi, eos)[0]
+
+    # Find temperature bounds where the derivative changes sign
+    if Tguess is None or np.isnan(Tguess):
+        Tguess = 300.0
+    Tbounds = [Tguess, Tguess]
+    objbounds = [obj(Tguess), obj(Tguess)]
+    for i in range(maxiter):
+        if objbounds[0] < 0. and objbounds[1] > 0.:
+            break
+        if objbounds[0] >= 0.:
+            Tbounds[0] /= 1.2
+            objbounds[0] = obj(Tbounds[0])
+        if objbounds[1] <= 0.:
+            Tbounds[1] *= 1.2
+            objbounds[1] = obj(Tbounds[1])
+
+    if objbounds[0] < 0. and objbounds[1] > 0.:
+        Tc = spo.brentq(obj, Tbounds[0], Tbounds[1], xtol=1e-8*Tbounds[1])
+        _, rhoc = _dPdrho_min(Tc, xi, eos)
+        Pc = float(eos.P(rhoc, Tc, xi))
+        logger.info("Critical point of component {}: Tc {} K, Pc {} Pa, rhoc {} mol/m^3".format(ind, Tc, Pc, rhoc))
+    else:
+        logger.warning("Critical point of component {} could not be bounded with temperatures {} K".format(ind, Tbounds))
+        Tc, Pc, rhoc = np.nan, np.nan, np.nan
+
+    cache[ind] = (Tc, Pc, rhoc)
+
+    return Tc, Pc, rhoc
+
+######################################################################
+#                                                                    #
+#                        Acentric Factor                             #
+#                                                                    #
+######################################################################
+def calc_acentric_factor(xi, eos, rhodict={}):
+    r"""
+    Computes the acentric factor of a pure component from the saturation pressure at :math:`T_r = 0.7`.
+
+    Results are stored with the eos object for each component and are recomputed when eos parameters are updated.
+
+    Parameters
+    ----------
+    xi : numpy.ndarray
+        Mole fraction of each component, only one component should be nonzero
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+
+    Returns
+    -------
+    omega : float
+        Acentric factor, :math:`\omega = -\log_{10}(P_{sat}/P_C)_{T_r=0.7} - 1`
+    """
+
+    logger = logging.getLogger(__name__)
+
+    xi = np.array(xi, float)
+    ind = int(np.nonzero(xi)[0][0])
+
+    cache = _eos_cache(eos, "acentric_factor")
+    if ind in cache:
+        return cache[ind]
+
+    Tc, Pc, _ = calc_critical_point(xi, eos)
+    if np.isnan(Tc):
+        omega = np.nan
+    else:
+        Psat, _, _ = calc_Psat(0.7*Tc, xi, eos, rhodict)
+        omega = -np.log10(Psat/Pc) - 1.0
+        logger.info("Acentric factor of component {}: {}".format(ind, omega))
+
+    cache[ind] = omega
+
+    return omega
+
 ######################################################################
 #                                                                    #
 #                      Pressure-Density Curve                        #
@@ -175,6 +450,9 @@ def PvsRho(T, xi, eos, minrhofrac=(1.0 / 500000.0), rhoinc=5.0, vspacemax=1.0E-4
     if type(xi) == list:
         xi = np.array(xi)
 
+    # The density root method is an option of calc_rhov and calc_rhol, not the eos
+    kwargs.pop("root_method", None)
+
     #estimate the maximum density based on the hard sphere packing fraction, part of EOS
     if not maxrho:
         maxrho = eos.density_max(xi, T, **kwargs)
@@ -387,7 +665,7 @@ def calc_Psat(T, xi, eos, rhodict={}):
     Pvspline, roots, extrema = PvsV_spline(vlist, Plist)
 
     if (not extrema or len(extrema)<2):
-        logger.warning('Error: One of the components is above its critical point, add an exception to setPsat')
+        logger.warning('Error: One of the components is above its critical point, use setPsat to estimate a value')
         Psat = np.nan
         roots = [1.0, 1.0, 1.0]
 
@@ -422,6 +700,72 @@ def calc_Psat(T, xi, eos, rhodict={}):
     #Psat,rholsat,rhogsat
     return Psat, 1.0 / roots[0], 1.0 / roots[2]
 
+def calc_pure_Psat(ind, T, eos, rhodict={}, interpolate=True, Tspacing=10.0, maxstored=1000):
+    r"""
+    Saturation pressure and densities of a pure component taken from a table stored in the eos object.
+
+    Values computed with :func:`calc_Psat` are stored for each component, density range (see :func:`_density_range_key`), and temperature until the parameters of the eos object are updated. If a temperature hasn't been computed but is bracketed by two stored temperatures less than Tspacing apart, the saturation pressure is interpolated as linear in :math:`\ln P_{sat}` vs. :math:`1/T`, and the densities as linear in :math:`\ln \rho` vs. :math:`T`. Interpolated values are intended as initial guesses.
+
+    Parameters
+    ----------
+    ind : int
+        Index of the component
+    T : float
+        Temperature of the system [K]
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    interpolate : bool, Optional, default: True
+        If False, only an exact match in temperature is taken from the table
+    Tspacing : float, Optional, default: 10.0
+        Largest difference between stored temperatures that is used for interpolation [K]
+    maxstored : int, Optional, default: 1000
+        Maximum number of temperatures stored for each component. The oldest entries are removed first.
+
+    Returns
+    -------
+    Psat : float
+        Saturation pressure given system information [Pa]
+    rhol : float
+        Density of liquid at saturation pressure [mol/:math:`m^3`]
+    rhov : float
+        Density of vapor at saturation pressure [mol/:math:`m^3`]
+    """
+
+    logger = logging.getLogger(__name__)
+
+    # Temperatures are stored separately for each component and range of densities
+    T = float(T)
+    table = _eos_cache(eos, "Psat").setdefault((ind, _density_range_key(rhodict)), {})
+
+    if T in table:
+        return table[T]
+
+    if interpolate and table:
+        Tstored = np.array(sorted(table.keys()))
+        i = np.searchsorted(Tstored, T)
+        if 0 < i < len(Tstored) and Tstored[i] - Tstored[i-1] <= Tspacing:
+            T1, T2 = Tstored[i-1], Tstored[i]
+            values1, values2 = np.array(table[T1]), np.array(table[T2])
+            if np.all(np.isfinite(values1)) and np.all(np.isfinite(values2)):
+                w = (1.0/T - 1.0/T1) / (1.0/T2 - 1.0/T1)
+                Psat = np.exp((1.0-w)*np.log(values1[0]) + w*np.log(values2[0]))
+                w = (T - T1) / (T2 - T1)
+                rhol, rhov = np.exp((1.0-w)*np.log(values1[1:]) + w*np.log(values2[1:]))
+                logger.debug("Psat of component {} at {} K interpolated from stored values at {} K and {} K".format(ind, T, T1, T2))
+                return Psat, rhol, rhov
+
+    xi = np.zeros(len(eos._nui))
+    xi[ind] = 1.0
+    result = calc_Psat(T, xi, eos, rhodict)
+
+    if len(table) >= maxstored:
+        del table[next(iter(table))]
+    table[T] = result
+
+    return result
+
 ######################################################################
 #                                                                    #
 #                              Eq Area                               #
@@ -467,6 +811,389 @@ def eq_area(shift, Pv, vlist):
 
     return (a + b)**2
 
+######################################################################
+#                                                                    #
+#                              Spinodal                              #
+#                                                                    #
+######################################################################
+def _density_range(T, xi, eos, rhodict={}):
+    r"""
+    Minimum and maximum density considered in density root searches, consistent with :func:`PvsRho`.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of the system [K]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole. The options minrhofrac and maxrho are used, and remaining options other than root_method are passed to the eos method, density_max.
+
+    Returns
+    -------
+    minrho : float
+        Minimum molar density [mol/:math:`m^3`]
+    maxrho : float
+        Maximum molar density [mol/:math:`m^3`]
+    """
+
+    kwargs = {key: value for key, value in rhodict.items() if key not in ["minrhofrac", "rhoinc", "vspacemax", "maxrho", "root_method"]}
+    if "maxrho" in rhodict and rhodict["maxrho"]:
+        maxrho = rhodict["maxrho"]
+    else:
+        maxrho = eos.density_max(xi, T, **kwargs)
+    minrho = maxrho * rhodict.get("minrhofrac", 1.0 / 500000.0)
+
+    return minrho, maxrho
+
+def _density_range_key(rhodict={}):
+    r"""
+    Options of rhodict that determine the density range of :func:`_density_range`, for use in the keys of stored results.
+
+    Parameters
+    ----------
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+
+    Returns
+    -------
+    key : tuple
+        Sorted pairs of option names and values
+    """
+
+    return tuple(sorted((key, repr(value)) for key, value in rhodict.items() if key not in ["rhoinc", "vspacemax", "root_method"]))
+
+def _classify_pressure(P, spinodal, phase):
+    r"""
+    Choose the branch of the pressure curve that holds the requested phase at the given pressure.
+
+    Parameters
+    ----------
+    P : float
+        Pressure of the system [Pa]
+    spinodal : dict
+        Dictionary with the spinodal pressures, "P_vapor" and "P_liquid" [Pa], and densities, "rho_vapor" and "rho_liquid" [mol/:math:`m^3`], which are NaN for a supercritical fluid
+    phase : str
+        Either "vapor" or "liquid". A requested phase that doesn't exist at this pressure returns the branch of the other phase.
+
+    Returns
+    -------
+    branch : str
+        Either "vapor", "liquid", "critical", or None if no fluid exists at this pressure
+    flag : int
+        A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true
+    """
+
+    if np.isnan(spinodal["P_vapor"]):
+        return "critical", 2
+
+    if phase == "vapor":
+        if 0. < P < spinodal["P_vapor"]:
+            return "vapor", 0
+        elif P > spinodal["P_liquid"]:
+            return "liquid", 1
+    else:
+        if P > spinodal["P_liquid"]:
+            return "liquid", 1
+        elif P > 0.:
+            return "vapor", 0
+
+    return None, 3
+
+def calc_spinodal(T, xi, eos, rhodict={}, npts=1000, maxstored=1000):
+    r"""
+    Locate the vapor and liquid spinodal densities, where :math:`\partial P / \partial \rho = 0`, and the pressure at each.
+
+    Pressure is computed on a logarithmic density grid to find the local maximum (vapor spinodal) and the following local minimum (liquid spinodal), which are then refined with a bounded scalar minimization. The result is stored with the eos object for each temperature, composition, and density range, so that density roots at other pressures only require a comparison with the spinodal pressures and a root search on the correct monotonic branch. Stored results are recomputed when eos parameters are updated.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of the system [K]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole. The options minrhofrac and maxrho are used to set the density range, see :func:`PvsRho`.
+    npts : int, Optional, default: 1000
+        Number of densities in the logarithmic grid
+    maxstored : int, Optional, default: 1000
+        Maximum number of temperature and composition combinations stored, the oldest entry is removed first
+
+    Returns
+    -------
+    spinodal : dict
+        Dictionary with the ascending density grid, "rho" [mol/:math:`m^3`], and pressures, "P" [Pa], the spinodal densities, "rho_vapor" and "rho_liquid" [mol/:math:`m^3`], their pressures, "P_vapor" and "P_liquid" [Pa], and the grid indices, "ind_vapor" and "ind_liquid", at which each spinodal is bounded. Spinodal values are NaN for a supercritical fluid.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    xi = np.array(xi, float)
+    cache = _eos_cache(eos, "spinodal")
+    key = (float(T), tuple(xi), npts, _density_range_key(rhodict))
+    if key in cache:
+        return cache[key]
+
+    minrho, maxrho = _density_range(T, xi, eos, rhodict)
+    rholist = np.geomspace(minrho, maxrho, npts)
+    Plist = eos.P(rholist, T, xi)
+    dP = np.diff(Plist)
+
+    spinodal = {"rho": rholist, "P": Plist, "rho_vapor": np.nan, "P_vapor": np.nan, "rho_liquid": np.nan, "P_liquid": np.nan, "ind_vapor": None, "ind_liquid": None}
+
+    ind_max = np.where(np.logical_and(dP[:-1] > 0., dP[1:] <= 0.))[0]
+    if len(ind_max):
+        ind_max = ind_max[0] + 1
+        ind_min = np.where(np.logical_and(dP[ind_max:-1] < 0., dP[ind_max+1:] >= 0.))[0]
+        if len(ind_min):
+            ind_min = ind_min[0] + ind_max + 1
+
+            result = spo.minimize_scalar(lambda rho: -float(eos.P(rho, T, xi)), bounds=(rholist[ind_max-1], rholist[ind_max+1]), method="bounded")
+            spinodal["rho_vapor"], spinodal["P_vapor"], spinodal["ind_vapor"] = result.x, -result.fun, ind_max
+            result = spo.minimize_scalar(lambda rho: float(eos.P(rho, T, xi)), bounds=(rholist[ind_min-1], rholist[ind_min+1]), method="bounded")
+            spinodal["rho_liquid"], spinodal["P_liquid"], spinodal["ind_liquid"] = result.x, result.fun, ind_min
+
+    logger.debug("    Spinodal: T {} K, xi {}, vapor {} mol/m^3 at {} Pa, liquid {} mol/m^3 at {} Pa".format(T, xi, spinodal["rho_vapor"], spinodal["P_vapor"], spinodal["rho_liquid"], spinodal["P_liquid"]))
+
+    if len(cache) >= maxstored:
+        cache.pop(next(iter(cache)))
+    cache[key] = spinodal
+
+    return spinodal
+
+def _spinodal_density(P, T, xi, eos, phase, rhodict={}):
+    r"""
+    Classify the fluid and find its density at the given pressure, using the stored spinodal from :func:`calc_spinodal`.
+
+    The flags are assigned as in :func:`calc_rhov` and :func:`calc_rhol`. A requested phase that doesn't exist at this pressure returns the root of the other phase.
+
+    Parameters
+    ----------
+    P : float
+        Pressure of the system [Pa]
+    T : float
+        Temperature of the system [K]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    phase : str
+        Either "vapor" or "liquid"
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+
+    Returns
+    -------
+    rho : float
+        Density at system pressure [mol/:math:`m^3`]
+    flag : int
+        A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true. None is returned if the root could not be bracketed, so that the full pressure curve should be used instead.
+    """
+
+    spinodal = calc_spinodal(T, xi, eos, rhodict)
+    rholist, Plist = spinodal["rho"], spinodal["P"]
+
+    branch, flag = _classify_pressure(P, spinodal, phase)
+    if branch is None:
+        return np.nan, flag
+    elif branch == "critical":
+        rho_branch, P_branch = rholist, Plist
+    elif branch == "vapor":
+        rho_branch = np.append(rholist[:spinodal["ind_vapor"]], spinodal["rho_vapor"])
+        P_branch = np.append(Plist[:spinodal["ind_vapor"]], spinodal["P_vapor"])
+    else:
+        rho_branch = np.insert(rholist[spinodal["ind_liquid"]:], 0, spinodal["rho_liquid"])
+        P_branch = np.insert(Plist[spinodal["ind_liquid"]:], 0, spinodal["P_liquid"])
+
+    if P < P_branch[0]:
+        # Below the density grid, pressure approaches that of an ideal gas
+        if flag == 1 or P <= 0.:
+            return np.nan, None
+        bounds = [min(0.5*P/(constants.Nav*constants.kb*T), 0.5*rho_branch[0]), rho_branch[0]]
+    elif P > P_branch[-1]:
+        return np.nan, None
+    else:
+        ind = max(np.searchsorted(P_branch, P), 1)
+        bounds = [rho_branch[ind-1], rho_branch[ind]]
+
+    if Pdiff(bounds[0], P, T, xi, eos)*Pdiff(bounds[1], P, T, xi, eos) > 0.:
+        return np.nan, None
+
+    rho = spo.brentq(Pdiff, bounds[0], bounds[1], args=(P, T, xi, eos), rtol=0.0000001)
+
+    return rho, flag
+
+######################################################################
+#                                                                    #
+#                   Chebyshev Pressure-Density Proxy                 #
+#                                                                    #
+######################################################################
+def calc_chebyshev_proxy(T, xi, eos, rhodict={}, npieces=16, degree=16, maxstored=1000):
+    r"""
+    Build a piecewise Chebyshev approximation of pressure vs. density at a given temperature and composition.
+
+    The density range of :func:`PvsRho` is split into pieces that are evenly spaced in the logarithm of density. Pressure is interpolated at the Chebyshev nodes of every piece, so that npieces*(degree+1) densities are computed with one call to the eos. Local extrema of the approximation identify the vapor and liquid spinodals. The proxy is stored with the eos object for each temperature, composition, and density range and is recomputed when eos parameters are updated.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of the system [K]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole. The options minrhofrac and maxrho are used to set the density range, see :func:`PvsRho`.
+    npieces : int, Optional, default: 16
+        Number of density intervals
+    degree : int, Optional, default: 16
+        Degree of the Chebyshev series in each interval
+    maxstored : int, Optional, default: 1000
+        Maximum number of temperature and composition combinations stored, the oldest entry is removed first
+
+    Returns
+    -------
+    proxy : dict
+        Dictionary with the density bounds of each piece, "edges" [mol/:math:`m^3`], the Chebyshev coefficients of each piece, "coeffs", the spinodal densities, "rho_vapor" and "rho_liquid" [mol/:math:`m^3`], and their pressures, "P_vapor" and "P_liquid" [Pa]. Spinodal values are NaN for a supercritical fluid.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    xi = np.array(xi, float)
+    cache = _eos_cache(eos, "chebyshev_proxy")
+    key = (float(T), tuple(xi), npieces, degree, _density_range_key(rhodict))
+    if key in cache:
+        return cache[key]
+
+    minrho, maxrho = _density_range(T, xi, eos, rhodict)
+    edges = np.geomspace(minrho, maxrho, npieces+1)
+    nodes = np.cos(np.pi*(np.arange(degree+1)+0.5)/(degree+1))
+    rho_nodes = 0.5*(edges[1:,np.newaxis] + edges[:-1,np.newaxis]) + 0.5*(edges[1:,np.newaxis] - edges[:-1,np.newaxis])*nodes
+    P_nodes = np.reshape(eos.P(rho_nodes.flatten(), T, xi), (npieces, degree+1))
+    coeffs = np.array([np.polynomial.chebyshev.chebfit(nodes, P_nodes[i], degree) for i in range(npieces)])
+
+    tail = np.max(np.abs(coeffs[:,-2:]), axis=1)/np.max(np.abs(coeffs), axis=1)
+    logger.debug("    Chebyshev proxy: T {} K, xi {}, largest relative tail coefficient {}".format(T, xi, np.max(tail)))
+
+    proxy = {"edges": edges, "coeffs": coeffs, "rho_vapor": np.nan, "P_vapor": np.nan, "rho_liquid": np.nan, "P_liquid": np.nan}
+
+    # Find extrema from the roots of the derivative of each piece
+    extrema = []
+    for i in range(npieces):
+        dcoeffs = np.polynomial.chebyshev.chebder(coeffs[i])
+        d2coeffs = np.polynomial.chebyshev.chebder(dcoeffs)
+        for t in _chebyshev_interval_roots(dcoeffs):
+            rho = 0.5*(edges[i+1] + edges[i]) + 0.5*(edges[i+1] - edges[i])*t
+            curvature = np.polynomial.chebyshev.chebval(t, d2coeffs)
+            extrema.append((rho, np.polynomial.chebyshev.chebval(t, coeffs[i]), curvature))
+    extrema.sort(key=lambda x: x[0])
+
+    ind_max = [j for j, x in enumerate(extrema) if x[2] < 0.]
+    if ind_max:
+        ind_min = [j for j, x in enumerate(extrema) if x[2] > 0. and j > ind_max[0]]
+        if ind_min:
+            proxy["rho_vapor"], proxy["P_vapor"] = extrema[ind_max[0]][:2]
+            proxy["rho_liquid"], proxy["P_liquid"] = extrema[ind_min[0]][:2]
+
+    if len(cache) >= maxstored:
+        cache.pop(next(iter(cache)))
+    cache[key] = proxy
+
+    return proxy
+
+def _chebyshev_interval_roots(coeffs, tol=1e-8):
+    r"""
+    Real roots in [-1, 1] of a Chebyshev series, from the eigenvalues of its companion matrix.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Chebyshev series coefficients
+    tol : float, Optional, default: 1e-8
+        Tolerance of the imaginary part and interval bounds for a root to be accepted
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        Sorted real roots within the interval
+    """
+
+    # The series can't be zero in this interval if the constant term is larger than the sum of the others
+    if np.abs(coeffs[0]) > np.sum(np.abs(coeffs[1:])):
+        return np.array([])
+
+    roots = np.polynomial.chebyshev.chebroots(coeffs)
+    roots = np.real(roots[np.abs(np.imag(roots)) < tol])
+    roots = roots[np.logical_and(roots >= -1.0-tol, roots <= 1.0+tol)]
+
+    return np.sort(np.clip(roots, -1.0, 1.0))
+
+def _chebyshev_density(P, T, xi, eos, phase, rhodict={}):
+    r"""
+    Classify the fluid and find its density at the given pressure, using the stored proxy from :func:`calc_chebyshev_proxy`.
+
+    Roots of the proxy are polished with Brent's method on the eos pressure when they can be bracketed. The flags are assigned as in :func:`calc_rhov` and :func:`calc_rhol`.
+
+    Parameters
+    ----------
+    P : float
+        Pressure of the system [Pa]
+    T : float
+        Temperature of the system [K]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    phase : str
+        Either "vapor" or "liquid"
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+
+    Returns
+    -------
+    rho : float
+        Density at system pressure [mol/:math:`m^3`]
+    flag : int
+        A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true. None is returned if the proxy has no root on the correct branch, so that another method should be used.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    proxy = calc_chebyshev_proxy(T, xi, eos, rhodict)
+    branch, flag = _classify_pressure(P, proxy, phase)
+    if branch is None:
+        return np.nan, flag
+
+    edges = proxy["edges"]
+    roots = []
+    for i, coeffs in enumerate(proxy["coeffs"]):
+        shifted = np.copy(coeffs)
+        shifted[0] -= P
+        for t in _chebyshev_interval_roots(shifted):
+            roots.append(0.5*(edges[i+1] + edges[i]) + 0.5*(edges[i+1] - edges[i])*t)
+    roots = np.sort(roots)
+
+    if branch == "vapor":
+        roots = roots[roots <= proxy["rho_vapor"]]
+    elif branch == "liquid":
+        roots = roots[roots >= proxy["rho_liquid"]]
+    if not len(roots):
+        return np.nan, None
+    rho = roots[-1] if branch == "liquid" else roots[0]
+
+    for delta in [1e-6, 1e-4, 1e-2]:
+        bounds = [rho*(1.0-delta), rho*(1.0+delta)]
+        if Pdiff(bounds[0], P, T, xi, eos)*Pdiff(bounds[1], P, T, xi, eos) <= 0.:
+            rho = spo.brentq(Pdiff, bounds[0], bounds[1], args=(P, T, xi, eos), rtol=0.0000001)
+            break
+    else:
+        logger.debug("    Root of Chebyshev proxy, {} mol/m^3, could not be bracketed with the eos".format(rho))
+
+    return rho, flag
+
 ######################################################################
 #                                                                    #
 #                              Calc Rho V Full                       #
@@ -487,7 +1214,7 @@ def calc_rhov(P, T, xi, eos, rhodict={}):
     eos : obj
         An instance of the defined EOS class to be used in thermodynamic computations.
     rhodict : dict, Optional, default: {}
-        Dictionary of options used in calculating pressure vs. mole 
+        Dictionary of options used in calculating pressure vs. mole. The option, root_method, is either "spinodal" (default) to classify the fluid with the stored spinodal from :func:`calc_spinodal`, "chebyshev" to find roots of the stored proxy from :func:`calc_chebyshev_proxy`, or "spline" to fit the full pressure curve at every pressure.
 
     Returns
     -------
@@ -499,6 +1226,18 @@ def calc_rhov(P, T, xi, eos, rhodict={}):
 
     logger = logging.getLogger(__name__)
 
+    root_method = rhodict.get("root_method", "spinodal")
+    flag = None
+    if root_method == "chebyshev":
+        rho_tmp, flag = _chebyshev_density(P, T, xi, eos, "vapor", rhodict)
+    if flag is None and root_method in ["spinodal", "chebyshev"]:
+        rho_tmp, flag = _spinodal_density(P, T, xi, eos, "vapor", rhodict)
+    if flag is not None:
+        logger.info("    Vapor Density: {} mol/m^3, flag {}".format(rho_tmp,flag))
+        return rho_tmp, flag
+    elif root_method in ["spinodal", "chebyshev"]:
+        logger.debug("    Vapor density could not be bracketed with the stored spinodal, use full pressure curve")
+
     vlist, Plist = PvsRho(T, xi, eos, **rhodict)
     Plist = Plist-P
     Pvspline, roots, extrema = PvsV_spline(vlist, Plist)
@@ -612,7 +1351,7 @@ def calc_rhol(P, T, xi, eos, rhodict={}):
     eos : obj
         An instance of the defined EOS class to be used in thermodynamic computations.
     rhodict : dict, Optional, default: {}
-        Dictionary of options used in calculating pressure vs. mole 
+        Dictionary of options used in calculating pressure vs. mole. The option, root_method, is either "spinodal" (default) to classify the fluid with the stored spinodal from :func:`calc_spinodal`, "chebyshev" to find roots of the stored proxy from :func:`calc_chebyshev_proxy`, or "spline" to fit the full pressure curve at every pressure.
 
     Returns
     -------
@@ -624,6 +1363,18 @@ def calc_rhol(P, T, xi, eos, rhodict={}):
 
     logger = logging.getLogger(__name__)
 
+    root_method = rhodict.get("root_method", "spinodal")
+    flag = None
+    if root_method == "chebyshev":
+        rho_tmp, flag = _chebyshev_density(P, T, xi, eos, "liquid", rhodict)
+    if flag is None and root_method in ["spinodal", "chebyshev"]:
+        rho_tmp, flag = _spinodal_density(P, T, xi, eos, "liquid", rhodict)
+    if flag is not None:
+        logger.info("    Liquid Density: {} mol/m^3, flag {}".format(rho_tmp,flag))
+        return rho_tmp, flag
+    elif root_method in ["spinodal", "chebyshev"]:
+        logger.debug("    Liquid density could not be bracketed with the stored spinodal, use full pressure curve")
+
     # Get roots and local minima and maxima 
     vlist, Plist = PvsRho(T, xi, eos, **rhodict)
     Plist = Plist-P
@@ -791,7 +1542,7 @@ def calc_phiv(P, T, yi, eos, rhodict={}):
         rhov = 0.
         logger.info("    rhov set to 0.")
     elif flagv == 3:
-        phiv = np.array([np.nan,np.nan])
+        phiv = np.nan*np.ones(len(yi))
     else:
         phiv = eos.fugacity_coefficient(P, np.array([rhov]), yi, T)
 
@@ -838,7 +1589,7 @@ def calc_phil(P, T, xi, eos, rhodict={}):
 
     rhol, flagl = calc_rhol(P, T, xi, eos, rhodict)
     if flagl == 3:
-        phil = np.array([np.nan,np.nan])
+        phil = np.nan*np.ones(len(xi))
     else:
         phil = eos.fugacity_coefficient(P, np.array([rhol]), xi, T)
 
@@ -946,7 +1697,7 @@ def _clean_plot_data(x_old, y_old):
 #                              Calc P range                          #
 #                                                                    #
 ######################################################################
-def calc_Prange_xi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
+def calc_Prange_xi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}, state=None):
     r"""
     Obtain min and max pressure values.
 
@@ -968,6 +1719,8 @@ def calc_Prange_xi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
         Minimum pressure in pressure range that restricts searched space.
     zi_opts : dict, Optional, default: {}
         Options used to solve the inner loop in the solving algorithm
+    state : PhaseSolverState, Optional, default: None
+        If provided, the vapor mole fraction at the upper bound of the pressure range is stored as a warm-start value
 
     Returns
     -------
@@ -977,8 +1730,6 @@ def calc_Prange_xi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
 
     logger = logging.getLogger(__name__)
 
-    global yi_global
-
     # Guess a range from Pmin to the local max of the liquid curve
     vlist, Plist = PvsRho(T, xi, eos, **rhodict)
     Pvspline, roots, extrema = PvsV_spline(vlist, Plist)
@@ -1114,7 +1865,8 @@ def calc_Prange_xi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
     logger.info("[Pmin, Pmax]: {}, Obj. Values: {}".format(str(Prange),str(ObjRange)))
     logger.info("Initial guess in pressure: {} Pa".format(Pguess))
 
-    yi_global = yi_range
+    if state is not None:
+        state.yi = yi_range
 
     return Prange, Pguess
 
@@ -1123,7 +1875,7 @@ def calc_Prange_xi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
 #                              Calc P range                          #
 #                                                                    #
 ######################################################################
-def calc_Prange_yi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
+def calc_Prange_yi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}, state=None):
     r"""
     Obtain min and max pressure values.
 
@@ -1145,6 +1897,8 @@ def calc_Prange_yi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
         Minimum pressure in pressure range that restricts searched space.
     zi_opts : dict, Optional, default: {}
         Options used to solve the inner loop in the solving algorithm
+    state : PhaseSolverState, Optional, default: None
+        If provided, the liquid mole fraction at the upper bound of the pressure range is stored as a warm-start value
 
     Returns
     -------
@@ -1154,8 +1908,6 @@ def calc_Prange_yi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
 
     logger = logging.getLogger(__name__)
 
-    global xi_global
-
     # Guess a range from Pmin to the local max of the liquid curve
     vlist, Plist = PvsRho(T, yi, eos, **rhodict)
     Pvspline, roots, extrema = PvsV_spline(vlist, Plist)
@@ -1214,21 +1966,85 @@ def calc_Prange_yi(T, xi, yi, eos, rhodict={}, Pmin=1000, zi_opts={}):
     logger.info("[Pmin, Pmax]: {}, Obj. Values: {}".format(str(Prange),str(ObjRange)))
     logger.info("Initial guess in pressure: {} Pa".format(Pguess))
 
-    xi_global = xi_range
+    if state is not None:
+        state.xi = xi_range
 
     return Prange, Pguess
 
 
+######################################################################
+#                                                                    #
+#               Accelerated Successive Substitution                  #
+#                                                                    #
+######################################################################
+def accelerate_substitution(x_hist, g_hist, method="dem", memory=3):
+    r"""
+    Extrapolate the next iterate of a successive substitution loop, :math:`x_{k+1} = g(x_k)`.
+
+    The dominant eigenvalue method (DEM) uses the last three iterates of unaccelerated substitution, and Anderson mixing uses up to "memory" previous inputs and outputs of the mapping.
+
+    From: Crowe, C. M., and M. Nishio AIChE J. 1975, 21, 528-533, and Walker, H. F., and P. Ni SIAM J. Numer. Anal. 2011, 49, 1715-1735
+    
+    Parameters
+    ----------
+    x_hist : list[numpy.ndarray]
+        Previous inputs to the mapping, :math:`x_k`
+    g_hist : list[numpy.ndarray]
+        Previous outputs of the mapping, :math:`g(x_k)`
+    method : str, Optional, default: "dem"
+        Acceleration method, either "dem" or "anderson"
+    memory : int, Optional, default: 3
+        Number of previous iterations used in Anderson mixing
+
+    Returns
+    -------
+    x_new : numpy.ndarray
+        Extrapolated next iterate. If no extrapolation is possible, the last output of the mapping is returned.
+    flag_accel : bool
+        True if the iterate was extrapolated
+    """
+
+    x_new = g_hist[-1]
+    flag_accel = False
+
+    if method == "dem":
+        if len(g_hist) >= 3:
+            d1 = g_hist[-2] - g_hist[-3]
+            d2 = g_hist[-1] - g_hist[-2]
+            denom = np.dot(d1, d2)
+            if denom != 0.:
+                lam = np.dot(d2, d2) / denom
+                if 0. < lam < 1.:
+                    x_new = g_hist[-1] + d2 * lam / (1. - lam)
+                    flag_accel = True
+    elif method == "anderson":
+        mk = min(memory, len(g_hist)-1)
+        if mk > 0:
+            f_hist = [g_hist[i] - x_hist[i] for i in range(-mk-1, 0)]
+            dF = np.array([f_hist[i+1] - f_hist[i] for i in range(mk)]).T
+            dG = np.array([g_hist[i+1] - g_hist[i] for i in range(-mk-1, -1)]).T
+            gamma = np.linalg.lstsq(dF, f_hist[-1], rcond=None)[0]
+            x_new = g_hist[-1] - np.dot(dG, gamma)
+            flag_accel = True
+    elif method is not None:
+        raise ValueError("Acceleration method, {}, is not supported. Choose 'dem', 'anderson', or None.".format(method))
+
+    if not all(np.isfinite(x_new)):
+        x_new = g_hist[-1]
+        flag_accel = False
+
+    return x_new, flag_accel
+
 ######################################################################
 #                                                                    #
 #                       Solve Yi for xi and T                        #
 #                                                                    #
 ######################################################################
-def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
+def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6, accelerate="dem", accel_freq=5):
     r"""
     Find vapor mole fraction given pressure, liquid mole fraction, and temperature.
 
-    Objective function is the sum of the predicted "mole numbers" predicted by the computed fugacity coefficients. Note that by "mole number" we mean that the prediction will only sum to 1 when the correct pressure is chosen in the outer loop. In this inner loop, we seek to find a mole fraction that is converged to reproduce itself in a prediction. If it hasn't, the new "mole numbers" are normalized into mole fractions and used as the next guess.
+    Objective function is the sum of the predicted "mole numbers" predicted by the computed fugacity coefficients. Note that by "mole number" we mean that the prediction will only sum to 1 when the correct pressure is chosen in the outer loop. In this inner loop, we seek to find a mole fraction that is converged to reproduce itself in a prediction. If it hasn't, the new "mole numbers" are normalized into mole fractions and used as the next guess. The logarithm of the normalized guesses may be extrapolated with :func:`accelerate_substitution`.
     In the case that a guess doesn't produce a gas or critical fluid, we use another function to produce a new guess.
     
     Parameters
@@ -1251,6 +2067,10 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
         Maximum number of iteration for both the outer pressure and inner vapor mole fraction loops
     tol : float, Optional, default: 1e-6
         Tolerance in sum of predicted yi "mole numbers"
+    accelerate : str, Optional, default: "dem"
+        Method used to accelerate successive substitution, "dem", "anderson", or None
+    accel_freq : int, Optional, default: 5
+        Number of iterations between extrapolations with the "dem" method
 
     Returns
     -------
@@ -1264,21 +2084,23 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
 
     logger = logging.getLogger(__name__)
 
-    global yi_global
-
-    yi /= np.sum(yi)
+    yi = yi / np.sum(yi)
     yi_total = [np.sum(yi)]
+    ln_hist, lnnew_hist = [], []
+    naccel = 0
     flag_check_vapor = True # Make sure we only search for vapor compositions once
     logger.info("    Solve yi: P {}, T {}, xi {}, phil {}".format(P, T, xi, phil))
     for z in range(maxiter):
 
         yi_tmp = yi/np.sum(yi)
+        flag_new_guess = False
 
         # Try yi
         phiv, rhov, flagv = calc_phiv(P, T, yi_tmp, eos, rhodict=rhodict)
 
         if ((any(np.isnan(phiv)) or flagv==1) and flag_check_vapor): # If vapor density doesn't exist
             flag_check_vapor = False
+            flag_new_guess = True
             logger.info("    Composition doesn't produce a vapor, let's find one!")
             if all(yi != 0.):
                 yinew = find_new_yi(P, T, phil, xi, eos, rhodict=rhodict)
@@ -1294,17 +2116,6 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
             yinew = xi * phil / phiv
         yinew[np.isnan(yinew)] = 0.
 
-        ## Check for bouncing between values
-        #if len(yi_total) > 3:
-        #    tmp1 =  (np.abs(np.sum(yinew)-yi_total[-2]) + np.abs(yi_total[-1]-yi_total[-3]))
-        #    tmp2 = (np.abs(np.sum(yinew)-yi_total[-2]) + np.abs(yi_total[-1]-yi_total[-3])) < tol/1000
-        #    if (tmp1 < np.abs(np.sum(yinew)-yi_total[-1]) and tmp1 < 1e-5):
-        #        # This occurs when the P vs. v curve doesn't cross the 0 axis, there could be a larger problem causing this, but in my experience, it's because the curve is not long enough to converge to zero. Instead of the possible endless increase in vector length and a substantial increase in computational time, we simply set the fugacity coefficient to ideal and the density to 0. When an iteration on our assumption produces a vapor near ideality, it then may predict an ideal gas. This causes the constant back and forth that really isn't that important to solve, as the fugacity coefficients are unity regardless.
-        #        logger.info("    yi_total is bouncing between {} and {}, choose the lowest value (outer loop obj. function).".format(np.sum(yinew),yi_total[-1]))
-        #        if np.sum(yinew) > yi_total[-1]:
-        #            yinew = yi
-        #            phiv, rhov, flagv = calc_phiv(P, T, yi_tmp, eos, rhodict=rhodict)
-
         logger.info("    yi guess {}, yi calc {}, phiv {}".format(yi_tmp,yinew,phiv))
         logger.info("    Old yi_total: {}, New yi_total: {}, Change: {}".format(yi_total[-1],np.sum(yinew),np.sum(yinew)-yi_total[-1])) 
 
@@ -1313,7 +2124,6 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
             ind_tmp = np.where(yi_tmp == min(yi_tmp[yi_tmp>0]))[0] 
             yi2 = yinew/np.sum(yinew)
             if np.abs(yi2[ind_tmp] - yi_tmp[ind_tmp]) / yi_tmp[ind_tmp] < tol:
-                yi_global = yi_tmp
                 logger.info("    Found yi")
                 break
 
@@ -1321,6 +2131,22 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
             yi_total.append(np.sum(yinew))
             yi = yinew
 
+            # Accelerate substitution with the logarithm of normalized mole fractions
+            ind = np.where(xi > 0.)[0]
+            if flag_new_guess or np.sum(yinew) == 0. or any(yinew[ind] <= 0.) or any(yi_tmp[ind] <= 0.):
+                ln_hist, lnnew_hist = [], []
+            elif accelerate is not None:
+                ln_hist.append(np.log(yi_tmp[ind]))
+                lnnew_hist.append(np.log(yinew[ind]/np.sum(yinew)))
+                if accelerate != "dem" or (len(lnnew_hist) >= 3 and (z+1) % accel_freq == 0):
+                    lnyi, flag_accel = accelerate_substitution(ln_hist, lnnew_hist, method=accelerate)
+                    if flag_accel:
+                        naccel += 1
+                        yi = np.zeros(len(yinew))
+                        yi[ind] = np.exp(lnyi)
+                        if accelerate == "dem":
+                            ln_hist, lnnew_hist = [], []
+
     ## If yi wasn't found in defined number of iterations
     yi_tmp = yi/np.sum(yi)
     yinew /= np.sum(yinew)
@@ -1332,13 +2158,21 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
         logger.warning('    More than {} iterations needed. Error in Smallest Fraction: {} %%'.format(maxiter, tmp*100))
         if tmp > .1: # If difference is greater than 10%
             yinew = find_new_yi(P, T, phil, xi, eos, rhodict=rhodict)
-        yinew = spo.least_squares(obj_yi, yinew[0], bounds=(0.,1.), args=(P, T, phil, xi, eos, rhodict))
-        yi = yinew.x[0]
-        yi = np.array([yi,1-yi])
-        obj = obj_yi(yi, P, T, phil, xi, eos, rhodict=rhodict)
-        logger.warning('    Find yi with root algorithm, yi {}, obj {}'.format(yi,obj))
+        yinew /= np.sum(yinew)
+        result = spo.least_squares(obj_yi, yinew, bounds=(0.,1.), args=(P, T, phil, xi, eos, rhodict))
+        yi_ls = result.x/np.sum(result.x)
+        phiv_ls, rhov, flagv_ls = calc_phiv(P, T, yi_ls, eos, rhodict=rhodict)
+        # Keep the vapor guess if the solution is the trivial solution with liquid fugacity coefficients
+        if flagv_ls in [0,2,4] and not any(np.isnan(phiv_ls)):
+            yi_tmp, phiv, flagv = yi_ls, phiv_ls, flagv_ls
+            logger.warning('    Find yi with root algorithm, yi {}, obj {}'.format(yi_tmp,result.fun))
+        else:
+            yi_tmp = yinew
+            phiv, rhov, flagv = calc_phiv(P, T, yi_tmp, eos, rhodict=rhodict)
+            logger.warning('    Root algorithm did not produce a vapor, flag {}. Using yi {}'.format(flagv_ls,yi_tmp))
     else:
         logger.info("    Inner Loop Final yi: {}, Final Error on Smallest Fraction: {}".format(yi_tmp,np.abs(yi2[ind_tmp] - yi_tmp[ind_tmp]) / yi_tmp[ind_tmp]*100))
+    logger.info("    Inner loop iterations: {}, accelerated steps: {}".format(z+1, naccel))
 
     return yi_tmp, phiv, flagv
 
@@ -1347,11 +2181,11 @@ def solve_yi_xiT(yi, xi, phil, P, T, eos, rhodict={}, maxiter=30, tol=1e-6):
 #                       Solve Yi for xi and T                        #
 #                                                                    #
 ######################################################################
-def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6):
+def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6, accelerate="dem", accel_freq=5):
     r"""
     Find liquid mole fraction given pressure, vapor mole fraction, and temperature. 
 
-    Objective function is the sum of the predicted "mole numbers" predicted by the computed fugacity coefficients. Note that by "mole number" we mean that the prediction will only sum to 1 when the correct pressure is chosen in the outer loop. In this inner loop, we seek to find a mole fraction that is converged to reproduce itself in a prediction. If it hasn't, the new "mole numbers" are normalized into mole fractions and used as the next guess.
+    Objective function is the sum of the predicted "mole numbers" predicted by the computed fugacity coefficients. Note that by "mole number" we mean that the prediction will only sum to 1 when the correct pressure is chosen in the outer loop. In this inner loop, we seek to find a mole fraction that is converged to reproduce itself in a prediction. If it hasn't, the new "mole numbers" are normalized into mole fractions and used as the next guess. The logarithm of the normalized guesses may be extrapolated with :func:`accelerate_substitution`.
     In the case that a guess doesn't produce a liquid or critical fluid, we use another function to produce a new guess.
     
     Parameters
@@ -1374,6 +2208,10 @@ def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6):
         Maximum number of iteration for both the outer pressure and inner vapor mole fraction loops
     tol : float, Optional, default: 1e-6
         Tolerance in sum of predicted xi "mole numbers"
+    accelerate : str, Optional, default: "dem"
+        Method used to accelerate successive substitution, "dem", "anderson", or None
+    accel_freq : int, Optional, default: 5
+        Number of iterations between extrapolations with the "dem" method
 
     Returns
     -------
@@ -1387,19 +2225,21 @@ def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6):
 
     logger = logging.getLogger(__name__)
 
-    global xi_global
-
-    xi /= np.sum(xi)
+    xi = xi / np.sum(xi)
     xi_total = [np.sum(xi)]
+    ln_hist, lnnew_hist = [], []
+    naccel = 0
     logger.info("    Solve xi: P {}, T {}, yi {}, phiv {}".format(P, T, yi, phiv))
     for z in range(maxiter):
 
         xi_tmp = xi/np.sum(xi)
+        flag_new_guess = False
 
         # Try xi
         phil, rhol, flagl = calc_phil(P, T, xi_tmp, eos, rhodict=rhodict)
 
         if (any(np.isnan(phil)) or flagl==0): # If liquid density doesn't exist
+            flag_new_guess = True
             logger.info("    Composition doesn't produce a liquid, let's find one!")
             if all(xi != 0.):
                 xinew = find_new_xi(P, T, phiv, yi, eos, rhodict=rhodict)
@@ -1423,7 +2263,6 @@ def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6):
             ind_tmp = np.where(xi_tmp == min(xi_tmp[xi_tmp>0]))[0]
             xi2 = xinew/np.sum(xinew)
             if np.abs(xi2[ind_tmp] - xi_tmp[ind_tmp]) / xi_tmp[ind_tmp] < tol:
-                xi_global = xi_tmp
                 logger.info("    Found xi")
                 break
 
@@ -1431,6 +2270,22 @@ def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6):
             xi_total.append(np.sum(xinew))
             xi = xinew
 
+            # Accelerate substitution with the logarithm of normalized mole fractions
+            ind = np.where(yi > 0.)[0]
+            if flag_new_guess or np.sum(xinew) == 0. or any(xinew[ind] <= 0.) or any(xi_tmp[ind] <= 0.):
+                ln_hist, lnnew_hist = [], []
+            elif accelerate is not None:
+                ln_hist.append(np.log(xi_tmp[ind]))
+                lnnew_hist.append(np.log(xinew[ind]/np.sum(xinew)))
+                if accelerate != "dem" or (len(lnnew_hist) >= 3 and (z+1) % accel_freq == 0):
+                    lnxi, flag_accel = accelerate_substitution(ln_hist, lnnew_hist, method=accelerate)
+                    if flag_accel:
+                        naccel += 1
+                        xi = np.zeros(len(xinew))
+                        xi[ind] = np.exp(lnxi)
+                        if accelerate == "dem":
+                            ln_hist, lnnew_hist = [], []
+
     ## If xi wasn't found in defined number of iterations
     xinew /= np.sum(xinew)
 
@@ -1441,26 +2296,154 @@ def solve_xi_yiT(xi, yi, phiv, P, T, eos, rhodict={}, maxiter=20, tol=1e-6):
         logger.warning('    More than {} iterations needed. Error in Smallest Fraction: {} %%'.format(maxiter, tmp*100))
         if tmp > .1: # If difference is greater than 10%
             xinew = find_new_xi(P, T, phiv, yi, eos, rhodict=rhodict)
-        xinew = spo.least_squares(obj_xi, xinew[0], bounds=(0.,1.), args=(P, T, phiv, yi, eos, rhodict))
-        xi = xinew.x[0]
-        xi = np.array([xi,1-xi])
-        obj = obj_xi(xi, P, T, phiv, yi, eos, rhodict=rhodict)
-        logger.warning('    Find xi with root algorithm, xi {}, obj {}'.format(xi,obj))
+        xinew /= np.sum(xinew)
+        result = spo.least_squares(obj_xi, xinew, bounds=(0.,1.), args=(P, T, phiv, yi, eos, rhodict))
+        xi_ls = result.x/np.sum(result.x)
+        phil_ls, rhol, flagl_ls = calc_phil(P, T, xi_ls, eos, rhodict=rhodict)
+        # Keep the liquid guess if the solution is the trivial solution with vapor fugacity coefficients
+        if flagl_ls in [1,2] and not any(np.isnan(phil_ls)):
+            xi_tmp, phil, flagl = xi_ls, phil_ls, flagl_ls
+            logger.warning('    Find xi with root algorithm, xi {}, obj {}'.format(xi_tmp,result.fun))
+        else:
+            xi_tmp = xinew
+            phil, rhol, flagl = calc_phil(P, T, xi_tmp, eos, rhodict=rhodict)
+            logger.warning('    Root algorithm did not produce a liquid, flag {}. Using xi {}'.format(flagl_ls,xi_tmp))
     else:
         logger.info("    Inner Loop Final xi: {}, Final Error on Smallest Fraction: {}".format(xi_tmp,np.abs(xi2[ind_tmp] - xi_tmp[ind_tmp]) / xi_tmp[ind_tmp]*100))
+    logger.info("    Inner loop iterations: {}, accelerated steps: {}".format(z+1, naccel))
 
     return xi_tmp, phil, flagl
 
 ######################################################################
 #                                                                    #
-#                       Find new Yi                                  #
+#                     Tangent Plane Stability                        #
 #                                                                    #
 ######################################################################
+def calc_tangent_plane_distance(P, T, zi, phiz, eos, trial_phase="vapor", Wi=None, rhodict={}, maxiter=50, tol=1e-8):
+    r"""
+    Michelsen stability test to find the stationary point of the tangent plane distance for a trial phase.
+
+    The trial "mole numbers", :math:`W_i`, are found by successive substitution of :math:`\ln W_i = \ln z_i + \ln \phi_i(z) - \ln \phi_i(W)`. At the stationary point, the modified tangent plane distance is :math:`tm = 1 - \sum W_i`. A negative value means that the feed is unstable and the normalized trial composition is the incipient phase.
+
+    From: Michelsen, M. L. Fluid Phase Equilib. 1982, 9, 1-19
+    
+    Parameters
+    ----------
+    P : float
+        Pressure of the system [Pa]
+    T : float
+        Temperature of the system [K]
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed phase, sum(zi) should equal 1.0
+    phiz : numpy.ndarray
+        Fugacity coefficient of each component in the feed phase at system pressure
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    trial_phase : str, Optional, default: "vapor"
+        Phase of the trial composition, either "vapor" or "liquid"
+    Wi : numpy.ndarray, Optional, default: None
+        Initial guess in trial mole numbers. If None, a vapor trial phase is initialized as an ideal gas, and a liquid trial phase from the liquid fugacity coefficients of the feed composition.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    maxiter : int, Optional, default: 50
+        Maximum number of successive substitution iterations
+    tol : float, Optional, default: 1e-8
+        Tolerance in the change of :math:`\ln W_i`
 
+    Returns
+    -------
+    wi : numpy.ndarray
+        Normalized trial mole fractions at the stationary point, sum(wi) equals 1.0
+    tm : float
+        Modified tangent plane distance at the stationary point, a negative value indicates that the feed is unstable
+    phiw : numpy.ndarray
+        Fugacity coefficient of each component in the trial phase
+    flag : int
+        Flag identifying the fluid type of the trial phase. A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true, 4 means ideal gas is assumed
+    """
+
+    logger = logging.getLogger(__name__)
 
+    if trial_phase == "vapor":
+        calc_phi = calc_phiv
+    elif trial_phase == "liquid":
+        calc_phi = calc_phil
+    else:
+        raise ValueError("Trial phase, {}, should be 'vapor' or 'liquid'".format(trial_phase))
+
+    zi = np.array(zi, float)
+    ind = np.where(zi > 0.)[0]
+    di = np.zeros(len(zi))
+    di[ind] = np.log(zi[ind]) + np.log(phiz[ind])
+
+    if any(np.isnan(di)):
+        logger.error("    Feed fugacity coefficients should not be NaN, {}".format(phiz))
+        return np.nan*np.ones(len(zi)), np.nan, np.nan*np.ones(len(zi)), 3
+
+    # Initial guess in trial mole numbers
+    if Wi is None:
+        Wi = np.zeros(len(zi))
+        Wi[ind] = np.exp(di[ind])
+        if trial_phase == "liquid":
+            phiw, _, flag = calc_phi(P, T, zi, eos, rhodict=rhodict)
+            if flag in [1,2] and not any(np.isnan(phiw)):
+                Wi[ind] /= phiw[ind]
+    Wi = np.array(Wi, float)
+
+    if trial_phase == "vapor":
+        phase_flags = [0, 2, 4]
+    else:
+        phase_flags = [1, 2]
+
+    flag_trivial = False
+    match = None
+    for z in range(maxiter):
+        wi = Wi/np.sum(Wi)
+        phiw, _, flag = calc_phi(P, T, wi, eos, rhodict=rhodict)
+        if any(np.isnan(phiw[ind])):
+            logger.warning("    Trial {} composition, {}, doesn't produce fugacity coefficients".format(trial_phase,wi))
+            break
+
+        # If the trial composition collapses onto the other phase after producing the desired phase, keep the last valid trial
+        if flag in phase_flags:
+            match = (Wi, phiw, flag)
+        elif match is not None:
+            logger.info("    Trial {} composition, {}, produces flag {}, the last {} composition is kept".format(trial_phase,wi,flag,trial_phase))
+            Wi, phiw, flag = match
+            break
+
+        Winew = np.zeros(len(zi))
+        Winew[ind] = np.exp(di[ind] - np.log(phiw[ind]))
+        change = np.max(np.abs(np.log(Winew[ind]) - np.log(Wi[ind])))
+        Wi = Winew
+
+        if np.sum((Wi/np.sum(Wi) - zi)**2) < tol:
+            flag_trivial = True
+            logger.debug("    Trial {} phase converged to the trivial solution".format(trial_phase))
+            break
+        if change < tol:
+            break
+
+    if z == maxiter-1:
+        logger.warning("    Stability test for a trial {} phase did not converge in {} iterations, change in ln(Wi): {}".format(trial_phase,maxiter,change))
+
+    tm = 1.0 - np.sum(Wi)
+    wi = Wi/np.sum(Wi)
+    if flag_trivial:
+        tm = 0.0
+
+    logger.info("    Stability test, trial {} phase: wi {}, tm {}, flag {}".format(trial_phase,wi,tm,flag))
+
+    return wi, tm, phiw, flag
+
+######################################################################
+#                                                                    #
+#                       Find new Yi                                  #
+#                                                                    #
+######################################################################
 def find_new_yi(P, T, phil, xi, eos, rhodict={}):
     r"""
-    Search vapor mole fraction combinations for a new estimate that produces a vapor density.
+    Find the incipient vapor mole fraction from the liquid with a tangent plane stability test.
     
     Parameters
     ----------
@@ -1485,71 +2468,10 @@ def find_new_yi(P, T, phil, xi, eos, rhodict={}):
 
     logger = logging.getLogger(__name__)
 
-    yi_ext = np.linspace(0.01,.99,30) # Guess for yi
-    obj_ext = []
-    flag_ext = [[],[]]
-
-    for yi in yi_ext:
-        yi = np.array([yi, 1-yi])
-        ####
-        phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict=rhodict)
-        yinew = xi * phil / phiv
-        yinew_total_1 = np.sum(yinew)
-
-        yi2 = yinew/yinew_total_1
-        phiv2, rhov2, flagv2 = calc_phiv(P, T, yi2, eos, rhodict=rhodict)
-        yinew = xi * phil / phiv2
-        yinew_total_2 = np.sum(yinew)
-
-        logger.debug("    yi_totals {} {}".format(yinew_total_1,yinew_total_2))
-
-        obj = yinew_total_1 - yinew_total_2
-
-        flag_ext[0].append(flagv)
-        flag_ext[1].append(flagv2)
-        ######
-    #    obj = obj_yi(yi, P, T, phil, xi, eos, rhodict=rhodict)
-        obj_ext.append(abs(obj))
-        logger.debug("    Obj yi {} total1 - total2 = {}".format(yi,obj))
-
-    #plt.figure(1)
-    #plt.plot(yi_ext,obj_ext,".-b")
-    #plt.figure(2)
-    #plt.plot(yi_ext,flag_ext[0],".-b")
-    #plt.plot(yi_ext,flag_ext[1],".-r")
-    #plt.show()
-
-    obj_ext = np.array(obj_ext)
-    flag_ext = np.array(flag_ext)
-
-    tmp = np.count_nonzero(~np.isnan(obj_ext))
-    logger.debug("    Number of valid mole fractions: {}".format(tmp))
-    if tmp == 0:
-        yi_tmp = np.nan
-        obj_tmp = np.nan
-    else:
-        # Remove any NaN
-        obj_tmp  =  obj_ext[~np.isnan(obj_ext)]
-        yi_tmp   =   yi_ext[~np.isnan(obj_ext)]
-        flag_tmp = flag_ext[1][~np.isnan(obj_ext)]
- 
-        # Assess vapor values
-        # A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true, 4 means we should assume ideal gas
-        ind = [i for i in range(len(flag_tmp)) if flag_tmp[i] not in [1,3]]
-        if ind:
-            obj_tmp = [obj_tmp[i] for i in ind]
-            yi_tmp = [yi_tmp[i] for i in ind]
-
-        # Choose values with lowest objective function
-        ind = np.where(np.abs(obj_tmp)==min(np.abs(obj_tmp)))[0][0]
-        obj_tmp = obj_tmp[ind]
-        yi_tmp = yi_tmp[ind]
+    yi, tm, phiv, flagv = calc_tangent_plane_distance(P, T, xi, phil, eos, trial_phase="vapor", rhodict=rhodict)
+    logger.info("    Found new guess in yi: {}, tm: {}, flag: {}".format(yi,tm,flagv))
 
-    logger.info("    Found new guess in yi: {}, Obj: {}".format(yi_tmp,obj_tmp))
-    if type(yi_tmp) not in [list,np.ndarray]:
-        yi_tmp = np.array([yi_tmp, 1-yi_tmp])
-
-    return yi_tmp
+    return yi
 
 ######################################################################
 #                                                                    #
@@ -1561,11 +2483,13 @@ def find_new_yi(P, T, phil, xi, eos, rhodict={}):
 def obj_yi(yi, P, T, phil, xi, eos, rhodict={}):
     r"""
     Objective function for solving for stable vapor mole fraction.
+
+    The residual is the difference between the given vapor mole fraction and the normalized prediction, :math:`x_i\phi_i^l/\phi_i^v`.
     
     Parameters
     ----------
     yi : numpy.ndarray
-        Vapor mole fraction of each component, sum(yi) should equal 1.0
+        Vapor mole fraction of each component, sum(yi) should equal 1.0. For a binary system, the mole fraction of the first component may be given alone.
     P : float
         Pressure of the system [Pa]
     T : float
@@ -1582,7 +2506,7 @@ def obj_yi(yi, P, T, phil, xi, eos, rhodict={}):
     Returns
     -------
     obj : numpy.ndarray
-        Objective function for solving for vapor mole fractions
+        Residual in vapor mole fraction of each component
     """
 
     logger = logging.getLogger(__name__)
@@ -1592,19 +2516,16 @@ def obj_yi(yi, P, T, phil, xi, eos, rhodict={}):
             yi = np.array([yi[0], 1-yi[0]])
         else:
             yi = np.array([yi, 1-yi])
+    yi = yi/np.sum(yi)
 
     phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict=rhodict)
     yinew = xi * phil / phiv
-    yinew_total_1 = np.sum(yinew)
+    yinew[np.isnan(yinew)] = 0.
+    yinew_total = np.sum(yinew)
 
-    yi2 = yinew/yinew_total_1
-    phiv2, rhov2, flagv2 = calc_phiv(P, T, yi2, eos, rhodict=rhodict)
-    yinew = xi * phil / phiv2
-    yinew_total_2 = np.sum(yinew)
+    logger.debug("    yi_total {}".format(yinew_total))
 
-    logger.debug("    yi_totals {} {}".format(yinew_total_1,yinew_total_2))
-
-    obj = np.abs(yinew_total_1 - yinew_total_2)
+    obj = yi - yinew/yinew_total
     
     return obj
 
@@ -1613,11 +2534,9 @@ def obj_yi(yi, P, T, phil, xi, eos, rhodict={}):
 #                       Find new Xi                                  #
 #                                                                    #
 ######################################################################
-
-
 def find_new_xi(P, T, phiv, yi, eos, rhodict={}):
     r"""
-    Search liquid mole fraction combinations for a new estimate that produces a liquid density.
+    Find the incipient liquid mole fraction from the vapor with a tangent plane stability test.
         
     Parameters
     ----------
@@ -1637,70 +2556,15 @@ def find_new_xi(P, T, phiv, yi, eos, rhodict={}):
     Returns
     -------
     xi : numpy.ndarray
-        Vapor mole fraction of each component, sum(yi) should equal 1.0
+        Liquid mole fraction of each component, sum(xi) should equal 1.0
     """
     
     logger = logging.getLogger(__name__)
-    
-    xi_ext = np.linspace(0.01,.99,30) # Guess for yi
-    obj_ext = []
-    flag_ext = [[],[]]
-    
-    for xi in xi_ext:
-        xi = np.array([xi, 1-xi])
-        ####
-        phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict=rhodict)
-        xinew = yi * phiv / phil
-        xinew_total_1 = np.sum(xinew)
-        
-        xi2 = xinew/xinew_total_1
-        phil2, rhol2, flagl2 = calc_phil(P, T, xi2, eos, rhodict=rhodict)
-        xinew = yi * phiv / phil2
-        xinew_total_2 = np.sum(xinew)
-        
-        logger.debug("    xi_totals {} {}".format(xinew_total_1,xinew_total_2))
-        
-        obj = xinew_total_1 - xinew_total_2
-        
-        flag_ext[0].append(flagl)
-        flag_ext[1].append(flagl2)
-        ######
-        #    obj = obj_yi(yi, P, T, phil, xi, eos, rhodict=rhodict)
-        obj_ext.append(abs(obj))
-        logger.debug("    Obj xi {} total1 - total2 = {}".format(xi,obj))
-
-    obj_ext = np.array(obj_ext)
-    flag_ext = np.array(flag_ext)
-
-    tmp = np.count_nonzero(~np.isnan(obj_ext))
-    logger.debug("    Number of valid mole fractions: {}".format(tmp))
-    if tmp == 0:
-        xi_tmp = np.nan
-        obj_tmp = np.nan
-    else:
-        # Remove any NaN
-        obj_tmp  =  obj_ext[~np.isnan(obj_ext)]
-        xi_tmp   =   xi_ext[~np.isnan(obj_ext)]
-        flag_tmp = flag_ext[1][~np.isnan(obj_ext)]
-    
-        # Assess vapor values
-        # A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true, 4 means we should assume ideal gas
-        ind = [i for i in range(len(flag_tmp)) if flag_tmp[i] not in [0,3,4]]
-        if ind:
-            obj_tmp = [obj_tmp[i] for i in ind]
-            xi_tmp = [xi_tmp[i] for i in ind]
-    
-        # Choose values with lowest objective function
-        ind = np.where(np.abs(obj_tmp)==min(np.abs(obj_tmp)))[0][0]
-        obj_tmp = obj_tmp[ind]
-        xi_tmp = xi_tmp[ind]
-    
-    logger.info("    Found new guess in xi: {}, Obj: {}".format(xi_tmp,obj_tmp))
 
-    if type(xi_tmp) not in [list,np.ndarray]:
-        xi_tmp = np.array([xi_tmp, 1-xi_tmp])
+    xi, tm, phil, flagl = calc_tangent_plane_distance(P, T, yi, phiv, eos, trial_phase="liquid", rhodict=rhodict)
+    logger.info("    Found new guess in xi: {}, tm: {}, flag: {}".format(xi,tm,flagl))
     
-    return xi_tmp
+    return xi
 
 ######################################################################
 #                                                                    #
@@ -1711,12 +2575,14 @@ def find_new_xi(P, T, phiv, yi, eos, rhodict={}):
 
 def obj_xi(xi, P, T, phiv, yi, eos, rhodict={}):
     r"""
-    Objective function for solving for stable vapor mole fraction.
+    Objective function for solving for stable liquid mole fraction.
+
+    The residual is the difference between the given liquid mole fraction and the normalized prediction, :math:`y_i\phi_i^v/\phi_i^l`.
         
     Parameters
     ----------
     xi : numpy.ndarray
-        Liquid mole fraction of each component, sum(xi) should equal 1.0
+        Liquid mole fraction of each component, sum(xi) should equal 1.0. For a binary system, the mole fraction of the first component may be given alone.
     P : float
         Pressure of the system [Pa]
     T : float
@@ -1733,7 +2599,7 @@ def obj_xi(xi, P, T, phiv, yi, eos, rhodict={}):
     Returns
     -------
     obj : numpy.ndarray
-        Objective function for solving for liquid mole fractions
+        Residual in liquid mole fraction of each component
     """
     
     logger = logging.getLogger(__name__)
@@ -1743,19 +2609,16 @@ def obj_xi(xi, P, T, phiv, yi, eos, rhodict={}):
             xi = np.array([xi[0], 1-xi[0]])
         else:
             xi = np.array([xi, 1-xi])
+    xi = xi/np.sum(xi)
 
     phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict=rhodict)
     xinew = yi * phiv / phil
-    xinew_total_1 = np.sum(xinew)
-    
-    xi2 = xinew/xinew_total_1
-    phil2, rhol2, flagl2 = calc_phil(P, T, xi2, eos, rhodict=rhodict)
-    xinew = yi * phiv / phil2
-    xinew_total_2 = np.sum(xinew)
+    xinew[np.isnan(xinew)] = 0.
+    xinew_total = np.sum(xinew)
     
-    logger.debug("    xi_totals {} {}".format(xinew_total_1,xinew_total_2))
+    logger.debug("    xi_total {}".format(xinew_total))
     
-    obj = np.abs(xinew_total_1 - xinew_total_2)
+    obj = xi - xinew/xinew_total
     
     return obj
 
@@ -1764,7 +2627,7 @@ def obj_xi(xi, P, T, phiv, yi, eos, rhodict={}):
 #                              Solve P xT                            #
 #                                                                    #
 ######################################################################
-def solve_P_xiT(P, xi, T, eos, rhodict, zi_opts={}):
+def solve_P_xiT(P, xi, T, eos, rhodict, zi_opts={}, state=None):
     r"""
     Objective function used to search pressure values and solve outer loop of P bubble point calculations.
     
@@ -1782,6 +2645,8 @@ def solve_P_xiT(P, xi, T, eos, rhodict, zi_opts={}):
         Dictionary of options used in calculating pressure vs. mole 
     zi_opts : dict, Optional, default: {}
         Options used to solve the inner loop in the solving algorithm
+    state : PhaseSolverState
+        Contains the guess in vapor mole fraction, which is updated with the result of the inner loop
     
 
     Returns
@@ -1792,7 +2657,8 @@ def solve_P_xiT(P, xi, T, eos, rhodict, zi_opts={}):
 
     logger = logging.getLogger(__name__)
 
-    global yi_global
+    if state is None or not state.valid_guess("yi", len(xi)):
+        raise ValueError("A PhaseSolverState with a guess in vapor mole fraction is needed to solve the bubble point")
 
     if P < 0:
         return 10.0
@@ -1802,13 +2668,13 @@ def solve_P_xiT(P, xi, T, eos, rhodict, zi_opts={}):
     #find liquid density
     phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict={})
 
-    yinew, phiv, flagv = solve_yi_xiT(yi_global, xi, phil, P, T, eos, rhodict=rhodict, **zi_opts)
-    yi_global = yi_global / np.sum(yi_global)
+    yinew, phiv, flagv = solve_yi_xiT(state.yi, xi, phil, P, T, eos, rhodict=rhodict, **zi_opts)
+    state.yi = yinew / np.sum(yinew)
 
     #given final yi recompute
-    phiv, rhov, flagv = calc_phiv(P, T, yi_global, eos, rhodict={})
+    phiv, rhov, flagv = calc_phiv(P, T, state.yi, eos, rhodict={})
 
-    Pv_test = eos.P(rhov, T, yi_global)
+    Pv_test = eos.P(rhov, T, state.yi)
     obj_value = float((np.nansum(xi * phil / phiv) - 1.0))
     logger.info('Obj Func: {}, Pset: {}, Pcalc: {}'.format(obj_value, P, Pv_test[0]))
 
@@ -1819,7 +2685,7 @@ def solve_P_xiT(P, xi, T, eos, rhodict, zi_opts={}):
 #                              Solve P yT                            #
 #                                                                    #
 ######################################################################
-def solve_P_yiT(P, yi, T, eos, rhodict, zi_opts={}):
+def solve_P_yiT(P, yi, T, eos, rhodict, zi_opts={}, state=None):
     r"""
     Objective function used to search pressure values and solve outer loop of P dew point calculations.
     
@@ -1837,6 +2703,8 @@ def solve_P_yiT(P, yi, T, eos, rhodict, zi_opts={}):
         Dictionary of options used in calculating pressure vs. mole 
     zi_opts : dict, Optional, default: {}
         Options used to solve the inner loop in the solving algorithm
+    state : PhaseSolverState
+        Contains the guess in liquid mole fraction, which is updated with the result of the inner loop
 
     Returns
     -------
@@ -1846,79 +2714,267 @@ def solve_P_yiT(P, yi, T, eos, rhodict, zi_opts={}):
 
     logger = logging.getLogger(__name__)
 
-    global xi_global
+    if state is None or not state.valid_guess("xi", len(yi)):
+        raise ValueError("A PhaseSolverState with a guess in liquid mole fraction is needed to solve the dew point")
+
+    if P < 0:
+        return 10.0
+
+    #find liquid density
+    phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict={})
+
+    xinew, phil, flagl = solve_xi_yiT(state.xi, yi, phiv, P, T, eos, rhodict=rhodict, **zi_opts)
+    state.xi = xinew / np.sum(xinew)
+
+    #given final yi recompute
+    phil, rhol, flagl = calc_phil(P, T, state.xi, eos, rhodict={})
+
+    Pv_test = eos.P(rhov, T, state.xi)
+    obj_value = (np.nansum(state.xi * phil / phiv) - 1.0)
+    logger.info('Obj Func: {}, Pset: {}, Pcalc: {}'.format(obj_value, P, Pv_test[0]))
+
+    return obj_value
+
+######################################################################
+#                                                                    #
+#                   Set Psat for Critical Components                 #
+#                                                                    #
+######################################################################
+def setPsat(ind, T, eos, rhodict={}):
+    r"""
+    Estimate the component saturation pressure if it is above its critical point.
+
+    The vapor pressure is extrapolated beyond the critical point with the Wilson correlation, :math:`\ln(P_{sat}/P_C) = 5.373(1+\omega)(1-T_C/T)`, where the critical point and acentric factor are computed from the eos.
+    
+    Parameters
+    ----------
+    ind : int
+        Index of the component that is above critical point
+    T : float
+        Temperature of the system [K]
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+
+    Returns
+    -------
+    Psat : float
+        Extrapolated value of saturation pressure [Pa]
+    NaNbead : str
+        Bead names of the component that is above it's critical point
+    """
+
+    logger = logging.getLogger(__name__)
+
+    NaNbead = ", ".join([eos._beads[j] for j in range(np.size(eos._nui[ind])) if eos._nui[ind][j] > 0.0])
+
+    xi = np.zeros(len(eos._nui))
+    xi[ind] = 1.0
+    Tc, Pc, _ = calc_critical_point(xi, eos, Tguess=T)
+    if np.isnan(Tc):
+        Psat = np.nan
+    else:
+        omega = calc_acentric_factor(xi, eos, rhodict)
+        if np.isnan(omega):
+            logger.warning("Acentric factor of component, {}, could not be computed, assume a value of 0.".format(NaNbead))
+            omega = 0.0
+        Psat = Pc*np.exp(5.373*(1.0+omega)*(1.0-Tc/T))
+        logger.info("Component, {}, is above its critical point, Tc={} K. Psat is estimated to be {} Pa".format(NaNbead,Tc,Psat))
+
+    return Psat, NaNbead
+
+######################################################################
+#                                                                    #
+#                Coupled Newton Saturation Point Solver              #
+#                                                                    #
+######################################################################
+def _saturation_residual(lnw, lnP, zi, T, eos, feed_phase, rhodict={}, phiz=None):
+    r"""
+    Residual of the equality of fugacity between a feed of fixed composition and an incipient phase, used in the coupled Newton solver.
+
+    The incipient mole fractions are :math:`w_i = z_i \exp(\theta_i)`, where :math:`\theta_i` is the first argument, and the residual is :math:`\theta_i + \ln\phi^w_i - \ln\phi^z_i` with the closure :math:`\sum w_i - 1`.
+    
+    Parameters
+    ----------
+    lnw : numpy.ndarray
+        Log of the ratio of the incipient and feed mole fraction for components present in the feed
+    lnP : float
+        Log of the pressure of the system [Pa]
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed phase, sum(zi) should equal 1.0
+    T : float
+        Temperature of the system [K]
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    feed_phase : str
+        Phase of the feed, either "liquid" for a bubble point or "vapor" for a dew point.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    phiz : tuple, Optional, default: None
+        Output of calc_phil or calc_phiv for the feed at this pressure. If provided, the feed fugacity coefficients aren't recomputed.
 
-    if P < 0:
-        return 10.0
+    Returns
+    -------
+    residual : numpy.ndarray
+        Residual of the fugacity equality for each component in the feed, followed by the mole fraction closure
+    wi : numpy.ndarray
+        Normalized mole fraction of each component in the incipient phase
+    phiz : tuple
+        Fugacity coefficients, density and flag of the feed phase
+    phiw : tuple
+        Fugacity coefficients, density and flag of the incipient phase
+    """
 
-    #find liquid density
-    phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict={})
+    P = np.exp(lnP)
+    ind = np.where(zi>0.)[0]
 
-    xi_global, phil, flagl = solve_xi_yiT(xi_global, yi, phiv, P, T, eos, rhodict=rhodict, **zi_opts)
-    xi_global = xi_global / np.sum(xi_global)
+    wi = np.zeros_like(zi)
+    wi[ind] = zi[ind]*np.exp(lnw)
+    wsum = np.sum(wi)
+    wi /= wsum
 
-    #given final yi recompute
-    phil, rhol, flagl = calc_phil(P, T, xi_global, eos, rhodict={})
+    if feed_phase == "liquid":
+        if phiz is None:
+            phiz = calc_phil(P, T, zi, eos, rhodict=rhodict)
+        phiw = calc_phiv(P, T, wi, eos, rhodict=rhodict)
+    else:
+        if phiz is None:
+            phiz = calc_phiv(P, T, zi, eos, rhodict=rhodict)
+        phiw = calc_phil(P, T, wi, eos, rhodict=rhodict)
 
-    Pv_test = eos.P(rhov, T, xi_global)
-    obj_value = (np.nansum(xi_global * phil / phiv) - 1.0)
-    logger.info('Obj Func: {}, Pset: {}, Pcalc: {}'.format(obj_value, P, Pv_test[0]))
+    residual = np.zeros(len(ind)+1)
+    residual[:-1] = lnw + np.log(phiw[0][ind]) - np.log(phiz[0][ind])
+    residual[-1] = wsum - 1.0
 
-    return obj_value
+    return residual, wi, phiz, phiw
 
-######################################################################
-#                                                                    #
-#                   Set Psat for Critical Components                 #
-#                                                                    #
-######################################################################
-def setPsat(ind, eos):
+def calc_saturation_newton(zi, T, P, wi, eos, feed_phase="liquid", rhodict={}, maxiter=20, tol=1e-8, step=1e-6, max_step=1.0):
     r"""
-    Generate dummy value for component saturation pressure if it is above its critical point.
+    Solve for the bubble or dew point pressure and incipient phase composition simultaneously with Newton's method.
+
+    The unknowns are the log of the incipient to feed mole fraction ratio of each component and the log of the pressure. The Jacobian is evaluated by forward finite difference, where the columns for the composition only require the fugacity coefficients of the incipient phase. If the step does not reduce the residual, it is halved.
     
     Parameters
     ----------
-    ind : int
-        Index of bead that is above critical point
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed phase, sum(zi) should equal 1.0
+    T : float
+        Temperature of the system [K]
+    P : float
+        Guess in pressure of the system [Pa]
+    wi : numpy.ndarray
+        Guess in the mole fraction of each component in the incipient phase
     eos : obj
         An instance of the defined EOS class to be used in thermodynamic computations.
+    feed_phase : str, Optional, default: "liquid"
+        Phase of the feed, "liquid" for a bubble point, or "vapor" for a dew point.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    maxiter : int, Optional, default: 20
+        Maximum number of Newton steps
+    tol : float, Optional, default: 1e-8
+        Tolerance in the norm of the residual
+    step : float, Optional, default: 1e-6
+        Step size used in the finite difference Jacobian
+    max_step : float, Optional, default: 1.0
+        Maximum change in any log variable in one Newton step
 
     Returns
     -------
-    Psat : float
-        Dummy value of saturation pressure [Pa]
-    NaNbead : str
-        Bead name of the component that is above it's critical point
+    P : float
+        Pressure of the system [Pa]
+    wi : numpy.ndarray
+        Mole fraction of each component in the incipient phase, sum(wi) should equal 1.0
+    flagz : int
+        Flag identifying the fluid type of the feed. A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true, 4 means ideal gas is assumed
+    flagw : int
+        Flag identifying the fluid type of the incipient phase
+    success : bool
+        True if the residual converged with the expected fluid types
     """
 
     logger = logging.getLogger(__name__)
 
-    for j in range(np.size(eos._nui[ind])):
-        if eos._nui[ind][j] > 0.0 and eos._beads[j] == "CO2":
-            Psat = 10377000.0
-        elif eos._nui[ind][j] > 0.0 and eos._beads[j] == "N2":
-            Psat = 7377000.0
-        elif eos._nui[ind][j] > 0.0 and ("CH4" in eos._beads[j]):
-            Psat = 6377000.0
-        elif eos._nui[ind][j] > 0.0 and ("CH3CH3" in eos._beads[j]):
-            Psat = 7377000.0
-        elif eos._nui[ind][j] > 0.0:
-            #Psat = np.nan
-            Psat = 7377000.0
-            NaNbead = eos._beads[j]
-            logger.warning("Bead, {}, is above its critical point. Psat is assumed to be {}. To add an exception go to thermodynamics.calc.setPsat".format(NaNbead,Psat))
+    if feed_phase == "liquid":
+        flagsz, flagsw = [1,2], [0,2,4]
+    elif feed_phase == "vapor":
+        flagsz, flagsw = [0,2,4], [1,2]
+    else:
+        raise ValueError("Feed phase, {}, should be either 'liquid' or 'vapor'".format(feed_phase))
+
+    ind = np.where(zi>0.)[0]
+    wi = np.array(wi, float)
+    if any(wi[ind] <= 0.) or any(np.isnan(wi)):
+        raise ValueError("Initial guess in incipient mole fraction, {}, should be positive for each component in the feed".format(wi))
+    lnw = np.log(wi[ind]/zi[ind])
+    lnP = np.log(P)
+
+    def valid(phiz, phiw):
+        return (phiz[2] in flagsz and phiw[2] in flagsw and not any(np.isnan(phiz[0][ind])) and not any(np.isnan(phiw[0][ind])))
+
+    F, wi, phiz, phiw = _saturation_residual(lnw, lnP, zi, T, eos, feed_phase, rhodict=rhodict)
+    if not valid(phiz, phiw):
+        logger.info("Newton saturation point: Initial guess, P {} Pa, does not produce the expected phases, flags {} and {}".format(P, phiz[2], phiw[2]))
+        return np.exp(lnP), wi, phiz[2], phiw[2], False
+    norm = np.linalg.norm(F)
+
+    success = False
+    for z in range(maxiter):
+        if norm < tol:
+            success = True
+            break
+
+        # Jacobian by forward difference, the feed fugacity coefficients are only a function of pressure
+        Jac = np.zeros((len(F),len(F)))
+        for j in range(len(ind)):
+            lnw_tmp = np.copy(lnw)
+            lnw_tmp[j] += step
+            Jac[:,j] = (_saturation_residual(lnw_tmp, lnP, zi, T, eos, feed_phase, rhodict=rhodict, phiz=phiz)[0] - F)/step
+        Jac[:,-1] = (_saturation_residual(lnw, lnP+step, zi, T, eos, feed_phase, rhodict=rhodict)[0] - F)/step
+
+        try:
+            dx = np.linalg.solve(Jac, -F)
+        except np.linalg.LinAlgError:
+            logger.info("Newton saturation point: Singular Jacobian at P {} Pa".format(np.exp(lnP)))
+            break
+        if np.max(np.abs(dx)) > max_step:
+            dx *= max_step/np.max(np.abs(dx))
+
+        # Halve the step until the residual is reduced with the expected phases
+        alpha = 1.0
+        for k in range(6):
+            lnw_new = lnw + alpha*dx[:-1]
+            lnP_new = lnP + alpha*dx[-1]
+            F_new, wi_new, phiz_new, phiw_new = _saturation_residual(lnw_new, lnP_new, zi, T, eos, feed_phase, rhodict=rhodict)
+            norm_new = np.linalg.norm(F_new)
+            if valid(phiz_new, phiw_new) and norm_new < norm:
+                break
+            alpha /= 2.0
+        else:
+            logger.info("Newton saturation point: Step could not reduce the residual, {}, at P {} Pa".format(norm, np.exp(lnP)))
+            break
+
+        lnw, lnP, F, wi, phiz, phiw, norm = lnw_new, lnP_new, F_new, wi_new, phiz_new, phiw_new, norm_new
+        logger.debug("Newton saturation point: Iteration {}, P {} Pa, wi {}, residual {}".format(z+1, np.exp(lnP), wi, norm))
+    else:
+        success = norm < tol
+
+    # Reject the trivial solution where both phases have the same density
+    if success and np.abs(phiz[1]-phiw[1]) < 1e-4*np.abs(phiz[1]):
+        logger.info("Newton saturation point: Converged to the trivial solution at P {} Pa".format(np.exp(lnP)))
+        success = False
 
-    if "NaNbead" not in list(locals().keys()):
-       NaNbead = "No NaNbead"
-       logger.info("No beads above their critical point")
+    logger.info("Newton saturation point: Success {} in {} iterations, P {} Pa, wi {}, residual {}".format(success, z, np.exp(lnP), wi, norm))
 
-    return Psat, NaNbead 
+    return np.exp(lnP), wi, phiz[2], phiw[2], success
 
 ######################################################################
 #                                                                    #
 #                              Calc yT phase                         #
 #                                                                    #
 ######################################################################
-def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pressure_opts={}):
+def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pressure_opts={}, state=None):
     r"""
     Calculate dew point mole fraction and pressure given system vapor mole fraction and temperature.
     
@@ -1937,9 +2993,11 @@ def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
     Pguess : float, Optional, default: -1
         Guess the system pressure at the dew point. A negative value will force an estimation based on the saturation pressure of each component.
     meth : str, Optional, default: "broyden1"
-        Choose the method used to solve the dew point calculation
+        Choose the method used to solve the dew point calculation. The option, "newton", solves pressure and composition simultaneously with calc_saturation_newton and falls back to "hybr" if it fails.
     pressure_opts : dict, Optional, default: {}
         Options used in the given method, "meth", to solve the outer loop in the solving algorithm
+    state : PhaseSolverState, Optional, default: None
+        Warm-start values for this calculation, updated in place with the converged result. If None, a new instance is used and the initial guess is estimated from the saturation pressure of each component.
 
     Returns
     -------
@@ -1955,18 +3013,17 @@ def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
 
     logger = logging.getLogger(__name__)
 
-    global xi_global
+    if state is None:
+        state = PhaseSolverState()
 
     # Estimate pure component vapor pressures
     Psat = np.zeros_like(yi)
     for i in range(np.size(yi)):
-        yi_tmp = np.zeros_like(yi)
-        yi_tmp[i] = 1.0
-        Psat[i], _, _ = calc_Psat(T, yi_tmp, eos, rhodict)
+        Psat[i], _, _ = calc_pure_Psat(i, T, eos, rhodict)
         if np.isnan(Psat[i]):
-            Psat[i], NaNbead = setPsat(i, eos)
+            Psat[i], NaNbead = setPsat(i, T, eos, rhodict)
             if np.isnan(Psat[i]):
-                raise ValueError("Component, {}, is beyond it's critical point at {} K. Add an exception to setPsat".format(NaNbead,T))
+                raise ValueError("Component, {}, is beyond it's critical point at {} K, and the critical point could not be found".format(NaNbead,T))
 
     # Estimate initial pressure
     if Pguess < 0:
@@ -1975,11 +3032,30 @@ def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
         P = Pguess
 
     # Estimate initial xi
-    if ("xi_global" not in globals() or any(np.isnan(xi_global))):
-        xi_global = P * (yi / Psat)
-        xi_global /= np.sum(xi_global)
-        xi_global = copy.deepcopy(xi_global)
-    xi = xi_global 
+    if not state.valid_guess("xi", len(yi)):
+        state.xi = P * (yi / Psat)
+        state.xi /= np.sum(state.xi)
+    xi = state.xi
+
+    if meth == "newton":
+        newton_opts = {}
+        for key, value in pressure_opts.items():
+            if key in ["maxiter", "tol", "step", "max_step"]:
+                newton_opts[key] = value
+        logger.debug("Using the method, {}, with the following options:\n{}".format(meth,newton_opts))
+        Pnewton, xi_tmp, flagv, flagl, success = calc_saturation_newton(yi, T, P, xi, eos, feed_phase="vapor", rhodict=rhodict, **newton_opts)
+        if success:
+            state.xi = xi_tmp
+            phiv, rhov, flagv = calc_phiv(Pnewton, T, yi, eos, rhodict={})
+            phil, rhol, flagl = calc_phil(Pnewton, T, state.xi, eos, rhodict={})
+            state.P, state.rhol, state.rhov = Pnewton, rhol, rhov
+            obj = float((np.nansum(yi * phiv / phil) - 1.0))
+            logger.info("Final Output: Obj {}, P {} Pa, flagl {}, xi {}".format(obj,Pnewton,flagl,state.xi))
+            return Pnewton, np.copy(state.xi), flagl, flagv, obj
+        else:
+            logger.warning("Newton solver for the dew point failed, the nested solver with the method, hybr, is used instead")
+            meth = "hybr"
+            pressure_opts = {}
 
     #Prange, Pguess = calc_Prange_yi(T, xi, yi, eos, rhodict, zi_opts=zi_opts)
     #logger.info("Given Pguess: {}, Suggested: {}".format(P, Pguess))
@@ -1991,25 +3067,25 @@ def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
     elif meth in ['hybr_broyden1', 'hybr_broyden2']:
         outer_dict = {'fatol': 1e-5, 'maxiter': 25, 'jac_options': {'reduction_method': 'simple'}}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
-        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts), method="hybr")
-        Pfinal = spo.root(solve_P_yiT, Pfinal.x, args=(yi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts, state), method="hybr")
+        Pfinal = spo.root(solve_P_yiT, Pfinal.x, args=(yi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
     elif meth == 'anderson':
         outer_dict = {'fatol': 1e-5, 'maxiter': 25}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
     elif meth in ['hybr', 'lm', 'linearmixing', 'diagbroyden', 'excitingmixing', 'krylov', 'df-sane']:
         outer_dict = {'xtol': 1e-10}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
 
 #################### Minimization Methods with Boundaries ###################
     elif meth in ["TNC", "L-BFGS-B", "SLSQP"]:
@@ -2018,9 +3094,9 @@ def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
         if len(Prange) == 2:
-            Pfinal = spo.minimize(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts), method=meth, bounds=[tuple(Prange)], options=outer_dict)
+            Pfinal = spo.minimize(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts, state), method=meth, bounds=[tuple(Prange)], options=outer_dict)
         else:
-            Pfinal = spo.minimize(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+            Pfinal = spo.minimize(solve_P_yiT, P, args=(yi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
 
 #################### Root Finding with Boundaries ###################
     elif meth == "brent":
@@ -2029,38 +3105,40 @@ def calc_yT_phase(yi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
             if key in ["xtol","rtol","maxiter","full_output","disp"]:
                 outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        P = spo.brentq(solve_P_yiT, Prange[0], Prange[1], args=(yi, T, eos, rhodict, zi_opts), **outer_dict)
+        P = spo.brentq(solve_P_yiT, Prange[0], Prange[1], args=(yi, T, eos, rhodict, zi_opts, state), **outer_dict)
     elif meth == "least_squares":
         outer_dict = {}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.least_squares(solve_P_xiT, P, bounds=(Prange[0],Prange[1]), args=(xi, T, eos, rhodict, zi_opts), **outer_dict)
+        Pfinal = spo.least_squares(solve_P_yiT, P, bounds=(Prange[0],Prange[1]), args=(yi, T, eos, rhodict, zi_opts, state), **outer_dict)
 
     #Given final P estimate
     if meth != "brent":
         P = Pfinal.x
         logger.info("Optimization terminated successfully: {} {}".format(Pfinal.success,Pfinal.message))
 
-    #find vapor density and fugacity
-    phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict={})
-    phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict={})
     if "tol" in zi_opts:
         if zi_opts["tol"] > 1e-10:
             zi_opts["tol"] = 1e-10
 
-    obj = solve_P_yiT(P, yi, T, eos, rhodict=rhodict, zi_opts=zi_opts)
+    obj = solve_P_yiT(P, yi, T, eos, rhodict=rhodict, zi_opts=zi_opts, state=state)
 
-    logger.info("Final Output: Obj {}, P {} Pa, flagl {}, xi {}".format(obj,P,flagl,xi_global))
+    #find vapor density and fugacity
+    phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict={})
+    phil, rhol, flagl = calc_phil(P, T, state.xi, eos, rhodict={})
+    state.P, state.rhol, state.rhov = P, rhol, rhov
 
-    return P, xi, flagl, flagv, obj
+    logger.info("Final Output: Obj {}, P {} Pa, flagl {}, xi {}".format(obj,P,flagl,state.xi))
+
+    return P, np.copy(state.xi), flagl, flagv, obj
 
 ######################################################################
 #                                                                    #
 #                              Calc xT phase                         #
 #                                                                    #
 ######################################################################
-def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pressure_opts={}):
+def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pressure_opts={}, state=None):
     r"""
     Calculate bubble point mole fraction and pressure given system liquid mole fraction and temperature.
     
@@ -2079,9 +3157,11 @@ def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
     Pguess : float, Optional, default: -1
         Guess the system pressure at the dew point. A negative value will force an estimation based on the saturation pressure of each component.
     meth : str, Optional, default: "broyden1"
-        Choose the method used to solve the dew point calculation
+        Choose the method used to solve the dew point calculation. The option, "newton", solves pressure and composition simultaneously with calc_saturation_newton and falls back to "hybr" if it fails.
     pressure_opts : dict, Optional, default: {}
         Options used in the given method, "meth", to solve the outer loop in the solving algorithm
+    state : PhaseSolverState, Optional, default: None
+        Warm-start values for this calculation, updated in place with the converged result. If None, a new instance is used and the initial guess is estimated from the saturation pressure of each component.
 
     Returns
     -------
@@ -2097,17 +3177,16 @@ def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
 
     logger = logging.getLogger(__name__)
 
-    global yi_global
+    if state is None:
+        state = PhaseSolverState()
 
     Psat = np.zeros_like(xi)
     for i in range(np.size(xi)):
-        xi_tmp = np.zeros_like(xi)
-        xi_tmp[i] = 1.0
-        Psat[i], _, _ = calc_Psat(T, xi_tmp, eos, rhodict)
+        Psat[i], _, _ = calc_pure_Psat(i, T, eos, rhodict)
         if np.isnan(Psat[i]):
-            Psat[i], NaNbead = setPsat(i, eos)
+            Psat[i], NaNbead = setPsat(i, T, eos, rhodict)
             if np.isnan(Psat[i]):
-                logger.error("Component, {}, is beyond it's critical point. Add an exception to setPsat".format(NaNbead))
+                logger.error("Component, {}, is beyond it's critical point, and the critical point could not be found".format(NaNbead))
 
     # Estimate initial pressure
     if Pguess < 0:
@@ -2116,18 +3195,37 @@ def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
         P = Pguess
 
 
-    if ("yi_global" not in globals() or any(np.isnan(yi_global))):
-        yi_global = xi * Psat / P
-        yi_global /= np.nansum(yi_global)
-        yi_global = copy.deepcopy(yi_global)
-        logger.info("Guess yi in calc_xT_phase with Psat: {}".format(yi_global))
-    yi = yi_global
+    if not state.valid_guess("yi", len(xi)):
+        state.yi = xi * Psat / P
+        state.yi /= np.nansum(state.yi)
+        logger.info("Guess yi in calc_xT_phase with Psat: {}".format(state.yi))
+    yi = state.yi
+
+    if meth == "newton":
+        newton_opts = {}
+        for key, value in pressure_opts.items():
+            if key in ["maxiter", "tol", "step", "max_step"]:
+                newton_opts[key] = value
+        logger.debug("Using the method, {}, with the following options:\n{}".format(meth,newton_opts))
+        Pnewton, yi_tmp, flagl, flagv, success = calc_saturation_newton(xi, T, P, yi, eos, feed_phase="liquid", rhodict=rhodict, **newton_opts)
+        if success:
+            state.yi = yi_tmp
+            phil, rhol, flagl = calc_phil(Pnewton, T, xi, eos, rhodict={})
+            phiv, rhov, flagv = calc_phiv(Pnewton, T, state.yi, eos, rhodict={})
+            state.P, state.rhol, state.rhov = Pnewton, rhol, rhov
+            obj = float((np.nansum(xi * phil / phiv) - 1.0))
+            logger.info("Final Output: Obj {}, P {} Pa, flagv {}, yi {}".format(obj,Pnewton,flagv,state.yi))
+            return Pnewton, np.copy(state.yi), flagv, flagl, obj
+        else:
+            logger.warning("Newton solver for the bubble point failed, the nested solver with the method, hybr, is used instead")
+            meth = "hybr"
+            pressure_opts = {}
 
 #    logger.info("Initial: P: {}, yi: {}".format(Pguess,str(yi)))
 #    Pguess, yi = bubblepoint_guess(Pguess, yi, xi, T, phil, eos, rhodict)
 #    logger.info("Updated: P: {}, yi: {}".format(Pguess,str(yi)))
 
-    Prange, Pguess = calc_Prange_xi(T, xi, yi, eos, rhodict, zi_opts=zi_opts)
+    Prange, Pguess = calc_Prange_xi(T, xi, yi, eos, rhodict, zi_opts=zi_opts, state=state)
     logger.info("Given Pguess: {}, Suggested: {}".format(P, Pguess))
     P = Pguess
 
@@ -2140,25 +3238,25 @@ def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
     elif meth in ['hybr_broyden1', 'hybr_broyden2']:
         outer_dict = {'fatol': 1e-5, 'maxiter': 25, 'jac_options': {'reduction_method': 'simple'}}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
-        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts), method="hybr")
-        Pfinal = spo.root(solve_P_xiT, Pfinal.x, args=(xi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts, state), method="hybr")
+        Pfinal = spo.root(solve_P_xiT, Pfinal.x, args=(xi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
     elif meth == 'anderson':
         outer_dict = {'fatol': 1e-5, 'maxiter': 25}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
     elif meth in ['hybr', 'lm', 'linearmixing', 'diagbroyden', 'excitingmixing', 'krylov', 'df-sane']:
         outer_dict = {}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+        Pfinal = spo.root(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
 
 #################### Minimization Methods with Boundaries ###################
     elif meth in ["TNC", "L-BFGS-B", "SLSQP"]:
@@ -2167,9 +3265,9 @@ def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
         if len(Prange) == 2:
-            Pfinal = spo.minimize(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts), method=meth, bounds=[tuple(Prange)], options=outer_dict)
+            Pfinal = spo.minimize(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts, state), method=meth, bounds=[tuple(Prange)], options=outer_dict)
         else:
-            Pfinal = spo.minimize(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts), method=meth, options=outer_dict)
+            Pfinal = spo.minimize(solve_P_xiT, P, args=(xi, T, eos, rhodict, zi_opts, state), method=meth, options=outer_dict)
 
 #################### Root Finding with Boundaries ###################
     elif meth == "brent":
@@ -2178,40 +3276,336 @@ def calc_xT_phase(xi, T, eos, rhodict={}, zi_opts={}, Pguess=-1, meth="hybr", pr
             if key in ["xtol","rtol","maxiter","full_output","disp"]:
                 outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        P = spo.brentq(solve_P_xiT, Prange[0], Prange[1], args=(xi, T, eos, rhodict, zi_opts), **outer_dict)
+        P = spo.brentq(solve_P_xiT, Prange[0], Prange[1], args=(xi, T, eos, rhodict, zi_opts, state), **outer_dict)
     elif meth == "least_squares":
         outer_dict = {}
         for key, value in pressure_opts.items():
             outer_dict[key] = value
         logger.debug("Using the method, {}, with the following options:\n{}".format(meth,outer_dict))
-        Pfinal = spo.least_squares(solve_P_xiT, P, bounds=(Prange[0],Prange[1]), args=(xi, T, eos, rhodict, zi_opts), **outer_dict)
+        Pfinal = spo.least_squares(solve_P_xiT, P, bounds=(Prange[0],Prange[1]), args=(xi, T, eos, rhodict, zi_opts, state), **outer_dict)
 
     #Given final P estimate
     if meth != "brent":
         P = Pfinal.x
         logger.info("Optimization terminated successfully: {} {}".format(Pfinal.success,Pfinal.message))
 
-    #find liquid density and fugacity
-    phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict={})
-    phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict={})
     if "tol" in zi_opts:
         if zi_opts["tol"] > 1e-10:
             zi_opts["tol"] = 1e-10
 
-    obj = solve_P_xiT(P, xi, T, eos, rhodict=rhodict, zi_opts=zi_opts)
+    obj = solve_P_xiT(P, xi, T, eos, rhodict=rhodict, zi_opts=zi_opts, state=state)
+
+    #find liquid density and fugacity
+    phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict={})
+    phiv, rhov, flagv = calc_phiv(P, T, state.yi, eos, rhodict={})
+    state.P, state.rhol, state.rhov = P, rhol, rhov
+
+    logger.info("Final Output: Obj {}, P {} Pa, flagv {}, yi {}".format(obj,P,flagv,state.yi))
+
+    return P, np.copy(state.yi), flagv, flagl, obj
+
+######################################################################
+#                                                                    #
+#                    Batched Bubble Point Solver                     #
+#                                                                    #
+######################################################################
+def calc_bubble_points(xi_list, T, eos, rhodict={}, Pguess=None, yiguess=None, maxiter=100, tol=1e-8):
+    r"""
+    Solve the bubble points of many liquid compositions at the same temperature in lockstep.
+
+    The pressure and vapor mole fractions of all unconverged points are updated together with successive substitution, :math:`y_i = x_i K_i / S` and :math:`P = P S`, where :math:`S=\sum x_i K_i`. Fugacity coefficients of all active points are evaluated in one call of the eos method, fugacity_coefficient_batch. Points are retired once converged, or as failed when a density root isn't of the expected phase or the vapor composition approaches the trivial solution. Failed points may be recomputed with :func:`calc_xT_phase`.
+
+    Parameters
+    ----------
+    xi_list : numpy.ndarray
+        Liquid mole fractions of each point, where each row sums to 1.0
+    T : float
+        Temperature of the system [K]
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    Pguess : numpy.ndarray, Optional, default: None
+        Initial pressure of each point [Pa]. Values that are None or negative are estimated from Raoult's law.
+    yiguess : numpy.ndarray, Optional, default: None
+        Initial vapor mole fractions of each point. Rows that aren't finite are estimated from Raoult's law.
+    maxiter : int, Optional, default: 100
+        Maximum number of iterations
+    tol : float, Optional, default: 1e-8
+        Tolerance in :math:`|S-1|` and in the change of vapor mole fractions
+
+    Returns
+    -------
+    P : numpy.ndarray
+        Bubble point pressure of each point [Pa]
+    yi : numpy.ndarray
+        Vapor mole fractions of each point
+    flagv : numpy.ndarray
+        Flag identifying the fluid type for the vapor mole fractions of each point
+    flagl : numpy.ndarray
+        Flag identifying the fluid type for the liquid mole fractions of each point
+    obj : numpy.ndarray
+        Value of :math:`S-1` for each point
+    success : numpy.ndarray
+        Boolean array that is True for converged points
+    """
+
+    logger = logging.getLogger(__name__)
+
+    xi_list = np.array(xi_list, float)
+    npts, ncomp = xi_list.shape
+
+    Psat = np.zeros(ncomp)
+    for i in range(ncomp):
+        Psat[i], _, _ = calc_pure_Psat(i, T, eos, rhodict)
+        if np.isnan(Psat[i]):
+            Psat[i], _ = setPsat(i, T, eos, rhodict)
+
+    P = 1.0/np.sum(xi_list/Psat, axis=1)
+    if Pguess is not None:
+        for i, Pg in enumerate(Pguess):
+            if Pg is not None and Pg > 0:
+                P[i] = Pg
+    yi = xi_list*Psat/P[:, np.newaxis]
+    yi /= np.sum(yi, axis=1)[:, np.newaxis]
+    if yiguess is not None:
+        for i, yg in enumerate(yiguess):
+            if np.all(np.isfinite(yg)):
+                yi[i] = yg
+
+    flagl, flagv = 3*np.ones(npts, int), 3*np.ones(npts, int)
+    rhol, rhov = np.zeros(npts), np.zeros(npts)
+    obj = np.nan*np.ones(npts)
+    success = np.zeros(npts, bool)
+    active = np.ones(npts, bool)
+    pure = np.count_nonzero(xi_list, axis=1) == 1
+
+    for niter in range(maxiter):
+        ind = np.where(active)[0]
+        if not len(ind):
+            break
+
+        for i in ind:
+            rhol[i], flagl[i] = calc_rhol(P[i], T, xi_list[i], eos, rhodict)
+            rhov[i], flagv[i] = calc_rhov(P[i], T, yi[i], eos, rhodict)
+        valid = np.isin(flagl[ind], [1, 2]) & np.isin(flagv[ind], [0, 2, 4])
+        if not np.all(valid):
+            logger.debug("    Points {} at {} K failed to find a liquid and vapor density".format(ind[~valid], T))
+            active[ind[~valid]] = False
+            ind = ind[valid]
+            if not len(ind):
+                break
+
+        phil = eos.fugacity_coefficient_batch(P[ind], rhol[ind], xi_list[ind], T)
+        phiv = np.ones((len(ind), ncomp))
+        real = flagv[ind] != 4
+        if np.any(real):
+            phiv[real] = eos.fugacity_coefficient_batch(P[ind][real], rhov[ind][real], yi[ind][real], T)
+
+        Kx = xi_list[ind]*phil/phiv
+        S = np.sum(Kx, axis=1)
+        yi_new = Kx/S[:, np.newaxis]
+        obj[ind] = S - 1.0
+
+        converged = (np.abs(S-1.0) < tol) & (np.max(np.abs(yi_new-yi[ind]), axis=1) < tol)
+        trivial = (np.max(np.abs(yi_new-xi_list[ind]), axis=1) < 1e-5) & ~pure[ind]
+        unphysical = ~np.isfinite(S) | (S <= 0.0)
+
+        P[ind] *= np.where(unphysical, 1.0, S)
+        yi[ind] = np.where(unphysical[:, np.newaxis], yi[ind], yi_new)
+
+        success[ind[converged & ~trivial & ~unphysical]] = True
+        active[ind[converged | trivial | unphysical]] = False
+        logger.debug("    Iteration {}: {} of {} points remain active".format(niter, np.count_nonzero(active), npts))
+
+    logger.info("{} of {} bubble points at {} K converged in {} iterations".format(np.count_nonzero(success), npts, T, niter+1))
+
+    return P, yi, flagv, flagl, obj, success
+
+######################################################################
+#                                                                    #
+#                    Phase Envelope Continuation                     #
+#                                                                    #
+######################################################################
+def _predict_saturation_point(history, u):
+    r"""
+    Predict the saturation pressure and incipient phase composition at a new point by extrapolation along the converged branch.
+
+    With one converged point, its values are used. With two or more, the last two points are extrapolated linearly to the projection of the new point onto the line between them.
+    
+    Parameters
+    ----------
+    history : list[tuple]
+        Converged points along the branch, each given as the feed variables (mole fractions followed by the log of temperature), the pressure, and the incipient phase mole fractions
+    u : numpy.ndarray
+        Feed variables of the new point, mole fractions followed by the log of temperature
+
+    Returns
+    -------
+    P : float
+        Predicted pressure [Pa]
+    wi : numpy.ndarray
+        Predicted mole fraction of each component in the incipient phase
+    """
+
+    ub, Pb, wb = history[-1]
+    if len(history) == 1:
+        P, wi = Pb, np.copy(wb)
+    else:
+        ua, Pa, wa = history[-2]
+        du = ub - ua
+        t = np.dot(u - ub, du) / np.dot(du, du) if np.dot(du, du) > 0. else 0.
+        P = np.exp(np.log(Pb) + t*(np.log(Pb) - np.log(Pa)))
+        wi = wb + t*(wb - wa)
+
+    wi = np.maximum(wi, 1e-8)
+    wi /= np.sum(wi)
+
+    return P, wi
+
+def calc_saturation_envelope(zi_list, T_list, eos, feed_phase="liquid", rhodict={}, zi_opts={}, pressure_opts={}, meth="hybr", Pguess=None, max_halving=4, state=None):
+    r"""
+    Trace bubble or dew points along a series of feed compositions and temperatures.
+
+    Points should be ordered along the envelope (e.g. increasing mole fraction of the first component at one temperature). The pressure and incipient phase composition of each point are predicted from the converged branch with :func:`_predict_saturation_point` and solved with :func:`calc_saturation_newton`. If Newton's method fails, the step from the last converged point is halved and the intermediate point is solved first. Near azeotropes and critical points, where the branch is strongly curved, this shortens the extrapolation. If the point still can't be solved, :func:`calc_xT_phase` or :func:`calc_yT_phase` is used without a prediction. Points of a single component are solved with :func:`calc_Psat` and serve as the ends of the branch.
+    
+    Parameters
+    ----------
+    zi_list : numpy.ndarray
+        Mole fractions of the feed phase for each point
+    T_list : numpy.ndarray
+        Temperature of each point [K]
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    feed_phase : str, Optional, default: "liquid"
+        Phase of the feed, "liquid" for bubble points, or "vapor" for dew points.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    zi_opts : dict, Optional, default: {}
+        Options used to solve the inner loop if a point is solved without a prediction
+    pressure_opts : dict, Optional, default: {}
+        Options used in the method, "meth", if a point is solved without a prediction. The keys "maxiter", "tol", "step", and "max_step" are also passed to :func:`calc_saturation_newton`.
+    meth : str, Optional, default: "hybr"
+        Method used if a point is solved without a prediction
+    Pguess : list, Optional, default: None
+        Guess in pressure for each point, only used if a point is solved without a prediction
+    max_halving : int, Optional, default: 4
+        Maximum number of times the step toward one point is halved
+    state : PhaseSolverState, Optional, default: None
+        Warm-start values used and updated by the calculations without a prediction
+
+    Returns
+    -------
+    output : list[tuple]
+        For each point, the pressure [Pa], incipient phase mole fractions, incipient phase flag, feed phase flag, and objective value. The order matches the output of :func:`calc_xT_phase` for bubble points and :func:`calc_yT_phase` for dew points.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    if feed_phase not in ["liquid", "vapor"]:
+        raise ValueError("Feed phase, {}, should be either 'liquid' or 'vapor'".format(feed_phase))
+
+    if state is None:
+        state = PhaseSolverState()
+
+    newton_opts = {}
+    for key, value in pressure_opts.items():
+        if key in ["maxiter", "tol", "step", "max_step"]:
+            newton_opts[key] = value
+
+    history = []
+    output = []
+    nnewton, ncold = 0, 0
+    for i in range(len(T_list)):
+        zi = np.array(zi_list[i], float)
+        T = T_list[i]
+        u_target = np.append(zi, np.log(T))
+        logger.info("T (K), zi: {} {}, Tracing envelope".format(T, zi))
+
+        # Pure components are the ends of the branch
+        if len(zi[zi!=0.]) == 1:
+            P, _, _ = calc_Psat(T, zi, eos, rhodict)
+            if np.isnan(P):
+                output.append((np.nan, np.nan, 3, 3, np.nan))
+            else:
+                if feed_phase == "liquid":
+                    output.append((P, zi, 0, 1, 0.0))
+                else:
+                    output.append((P, zi, 1, 0, 0.0))
+                history.append((u_target, P, zi))
+            continue
+
+        result = None
+        if history:
+            targets = [u_target]
+            nhalf = 0
+            while targets:
+                u = targets[-1]
+                Ppred, wpred = _predict_saturation_point(history, u)
+                zi_u, T_u = u[:-1], np.exp(u[-1])
+                P, wi, flagz, flagw, success = calc_saturation_newton(zi_u, T_u, Ppred, wpred, eos, feed_phase=feed_phase, rhodict=rhodict, **newton_opts)
+                if success:
+                    nnewton += 1
+                    history.append((u, P, wi))
+                    targets.pop()
+                    if not targets:
+                        result = (P, wi, flagw, flagz)
+                elif nhalf < max_halving:
+                    nhalf += 1
+                    targets.append((history[-1][0] + u) / 2.0)
+                    logger.info("Step toward T (K), zi: {} {}, halved {} time(s)".format(T, zi, nhalf))
+                else:
+                    break
+
+        if result is not None:
+            P, wi, flagw, flagz = result
+            if feed_phase == "liquid":
+                phiz, rhoz, flagz = calc_phil(P, T, zi, eos, rhodict={})
+                phiw, rhow, flagw = calc_phiv(P, T, wi, eos, rhodict={})
+                state.yi, state.rhol, state.rhov = wi, rhoz, rhow
+            else:
+                phiz, rhoz, flagz = calc_phiv(P, T, zi, eos, rhodict={})
+                phiw, rhow, flagw = calc_phil(P, T, wi, eos, rhodict={})
+                state.xi, state.rhol, state.rhov = wi, rhow, rhoz
+            state.P = P
+            obj = float(np.nansum(zi * phiz / phiw) - 1.0)
+            output.append((P, wi, flagw, flagz, obj))
+            logger.info("Traced P (Pa), wi: {} {}".format(P, wi))
+            continue
+
+        # Solve without a prediction
+        ncold += 1
+        opts = {"rhodict": rhodict, "zi_opts": zi_opts, "pressure_opts": pressure_opts, "meth": meth, "state": state}
+        if Pguess is not None:
+            opts["Pguess"] = Pguess[i]
+        try:
+            if feed_phase == "liquid":
+                output.append(calc_xT_phase(zi, T, eos, **opts))
+            else:
+                output.append(calc_yT_phase(zi, T, eos, **opts))
+        except Exception:
+            logger.warning("T (K), zi: {} {}, calculation did not produce a valid result.".format(T, zi))
+            logger.debug("Calculation Failed:", exc_info=True)
+            output.append((np.nan, np.nan, 3, 3, np.nan))
+            continue
+        P, wi = output[-1][0], output[-1][1]
+        if not np.any(np.isnan(P)) and not np.any(np.isnan(wi)):
+            history.append((u_target, float(np.squeeze(P)), np.array(wi, float)))
 
-    logger.info("Final Output: Obj {}, P {} Pa, flagv {}, yi {}".format(obj,P,flagv,yi_global))
+    logger.info("Envelope traced with {} Newton solutions and {} points solved without a prediction".format(nnewton, ncold))
 
-    return P, yi_global, flagv, flagl, obj
+    return output
 
 ######################################################################
 #                                                                    #
 #                              Calc xT phase                         #
 #                                                                    #
 ######################################################################
-def hildebrand_solubility(rhol, xi, T, eos, dT=.1, tol=1e-4, rhodict={}):
+def hildebrand_solubility(rhol, xi, T, eos, dT=.1, tol=1e-4, rhodict={}, method="direct"):
     r"""
-    Calculate the solubility parameter based on temperature and composition. This function is based on the method used in Zeng, Z., Y. Xi, and Y. Li "Calculation of Solubility Parameter Using Perturbed-Chain SAFT and Cubic-Plus-Association Equations of State" Ind. Eng. Chem. Res. 2008, 47, 9663–9669.
+    Calculate the solubility parameter based on temperature and composition, :math:`\delta=\sqrt{-U^{res}\rho_l}`.
+
+    By default, the residual internal energy is obtained directly from the temperature derivative of the residual Helmholtz energy at the liquid density, :math:`U^{res}=-RT^2\left(\partial (A^{res}/NkT)/\partial T\right)_{\rho}`, with a central difference. The option, method="integration", instead integrates :math:`(\partial P/\partial T - P/T)/R` from the liquid volume to infinite dilution, using the method in Zeng, Z., Y. Xi, and Y. Li "Calculation of Solubility Parameter Using Perturbed-Chain SAFT and Cubic-Plus-Association Equations of State" Ind. Eng. Chem. Res. 2008, 47, 9663–9669. This slower path is kept to validate the direct result, and the difference between the two is logged.
     
     Parameters
     ----------
@@ -2228,7 +3622,9 @@ def hildebrand_solubility(rhol, xi, T, eos, dT=.1, tol=1e-4, rhodict={}):
     tol : float
         This cutoff value evaluates the extent to which the integrand of the calculation has decayed. If the last value if the array is greater than tol, then the remaining area is estimated as a triangle, where the intercept is estimated from an interpolation of the previous four points.
     rhodict : dict, Optional, default: {}
-        Dictionary of options used in calculating pressure vs. mole
+        Dictionary of options used in calculating pressure vs. mole, only used with method="integration"
+    method : str, Optional, default: "direct"
+        Either "direct" to differentiate the residual Helmholtz energy at the liquid density, or "integration" to integrate over the pressure vs. density curves
 
     Returns
     -------
@@ -2243,6 +3639,23 @@ def hildebrand_solubility(rhol, xi, T, eos, dT=.1, tol=1e-4, rhodict={}):
 
     if type(rhol) in [np.ndarray,list]:
         logger.info("rhol should be a float, not {}".format(rhol))
+        rhol = float(np.squeeze(rhol))
+
+    # Residual internal energy from the temperature derivative of the residual Helmholtz energy
+    Ares_p = eos.residual_helmholtz_energy(np.array([rhol]), T+dT, xi)[0]
+    Ares_m = eos.residual_helmholtz_energy(np.array([rhol]), T-dT, xi)[0]
+    U_res_direct = -R*T**2*(Ares_p-Ares_m)/(2*dT)
+
+    if method == "direct":
+        if U_res_direct > 0.:
+            logger.error("The solubility parameter can not be imaginary")
+            delta = np.nan
+        else:
+            delta = np.sqrt(-U_res_direct*rhol)
+            logger.info("When T={}, xi={}, delta={}".format(T,xi,delta))
+        return delta
+    elif method != "integration":
+        raise ValueError("Solubility parameter method, {}, is not supported. Use 'direct' or 'integration'".format(method))
 
     # Find dZdT
     vlist, Plist1 = PvsRho(T-dT, xi, eos, **rhodict, maxrho=rhol)
@@ -2267,8 +3680,11 @@ def hildebrand_solubility(rhol, xi, T, eos, dT=.1, tol=1e-4, rhodict={}):
         xroot = -yroot/slope
         U_res += -RT*integrand_list[-1]*(xroot-vlist[-1])/2
 
+    logger.info("Residual internal energy from integration, {} J/mol, differs from the direct value by {} J/mol".format(U_res, U_res-U_res_direct))
+
     if (U_res) > 0.:
         logger.error("The solubility parameter can not be imaginary")
+        delta = np.nan
     else:
         delta = np.sqrt(-(U_res)*rhol)
         logger.info("When T={}, xi={}, delta={}".format(T,xi,delta))
@@ -2280,88 +3696,480 @@ def hildebrand_solubility(rhol, xi, T, eos, dT=.1, tol=1e-4, rhodict={}):
 #                              Calc PT phase                         #
 #                                                                    #
 ######################################################################
-def calc_PT_phase(xi, T, eos, rhodict={}):
+def calc_wilson_K(P, T, eos, rhodict={}):
+    r"""
+    Estimate K-values, :math:`K_i=y_i/x_i`, with the Wilson correlation, :math:`\ln(K_i P/P_{C,i}) = 5.373(1+\omega_i)(1-T_{C,i}/T)`.
+
+    The critical point and acentric factor of each component are computed from the eos with :func:`calc_critical_point` and :func:`calc_acentric_factor`.
+    
+    Parameters
+    ----------
+    P : float or numpy.ndarray
+        Pressure of each feed [Pa]
+    T : float or numpy.ndarray
+        Temperature of each feed [K]
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+
+    Returns
+    -------
+    Ki : numpy.ndarray
+        K-value of each component, with one row for each feed if arrays of pressure and temperature are given
+    """
+
+    ncomp = len(eos._nui)
+    Tc, Pc, omega = np.zeros(ncomp), np.zeros(ncomp), np.zeros(ncomp)
+    for i in range(ncomp):
+        xi = np.zeros(ncomp)
+        xi[i] = 1.0
+        Tc[i], Pc[i], _ = calc_critical_point(xi, eos)
+        if np.isnan(Tc[i]):
+            raise ValueError("The critical point of component {} could not be found to estimate K-values".format(i))
+        omega[i] = calc_acentric_factor(xi, eos, rhodict)
+        if np.isnan(omega[i]):
+            omega[i] = 0.0
+
+    P = np.array(P, float)
+    T = np.array(T, float)
+    Ki = Pc / P[..., np.newaxis] * np.exp(5.373 * (1.0 + omega) * (1.0 - Tc / T[..., np.newaxis]))
+
+    return Ki
+
+def calc_rachford_rice(zi, Ki, tol=1e-12, maxiter=100):
+    r"""
+    Solve the Rachford-Rice equation, :math:`\sum_i z_i(K_i-1)/(1+\beta(K_i-1))=0`, for the vapor fraction of one or more feeds.
+
+    Newton's method is used for all feeds at once, with a bisection step whenever a step leaves the bracket between the asymptotes, :math:`1/(1-K_{max}) < \beta < 1/(1-K_{min})`. The solution may be outside of [0, 1] (i.e. a negative flash). If all K-values are above (or below) one, the vapor fraction is one (or zero).
+    
+    Parameters
+    ----------
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed, one row for each feed
+    Ki : numpy.ndarray
+        K-value of each component, the same shape as zi
+    tol : float, Optional, default: 1e-12
+        Tolerance in the Rachford-Rice equation
+    maxiter : int, Optional, default: 100
+        Maximum number of iterations
+
+    Returns
+    -------
+    beta : float or numpy.ndarray
+        Vapor fraction of each feed
+    """
+
+    logger = logging.getLogger(__name__)
+
+    zi = np.atleast_2d(np.array(zi, float))
+    Ki = np.atleast_2d(np.array(Ki, float))
+    Km1 = np.where(zi > 0., Ki - 1.0, 0.0)
+
+    Kmax = np.max(np.where(zi > 0., Ki, -np.inf), axis=1)
+    Kmin = np.min(np.where(zi > 0., Ki, np.inf), axis=1)
+    two_phase = np.logical_and(Kmax > 1.0, Kmin < 1.0)
+
+    beta = np.where(Kmax <= 1.0, 0.0, 1.0)
+    if np.any(two_phase):
+        z2, K2 = zi[two_phase], Km1[two_phase]
+        lo = 1.0 / (1.0 - Kmax[two_phase])
+        hi = 1.0 / (1.0 - Kmin[two_phase])
+        b = np.clip(0.5, lo + 1e-10*np.abs(lo), hi - 1e-10*np.abs(hi))
+        for i in range(maxiter):
+            denom = 1.0 + b[:, np.newaxis] * K2
+            g = np.sum(z2 * K2 / denom, axis=1)
+            if np.all(np.abs(g) < tol):
+                break
+            dg = -np.sum(z2 * K2**2 / denom**2, axis=1)
+            # g decreases monotonically between the asymptotes
+            lo = np.where(g > 0., b, lo)
+            hi = np.where(g < 0., b, hi)
+            b_new = b - g / dg
+            bisect = np.logical_or(b_new <= lo, b_new >= hi)
+            b = np.where(bisect, (lo + hi) / 2.0, b_new)
+        else:
+            logger.warning("Rachford-Rice equation did not converge in {} iterations, max. residual {}".format(maxiter, np.max(np.abs(g))))
+        beta[two_phase] = b
+
+    if len(beta) == 1:
+        beta = beta[0]
+
+    return beta
+
+def _flash_compositions(zi, Ki):
     r"""
-    *Not Complete*
-    Calculate the PT phase diagram given liquid mole fraction and temperature
+    Compute the vapor fraction and normalized phase compositions for a set of K-values.
     
     Parameters
     ----------
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed
+    Ki : numpy.ndarray
+        K-value of each component
+
+    Returns
+    -------
+    beta : float
+        Vapor fraction
     xi : numpy.ndarray
-        Liquid mole fraction of each component, sum(xi) should equal 1.0
+        Liquid mole fraction of each component
+    yi : numpy.ndarray
+        Vapor mole fraction of each component
+    """
+
+    beta = calc_rachford_rice(zi, Ki)
+    xi = zi / (1.0 + beta * (Ki - 1.0))
+    yi = Ki * xi
+
+    return beta, xi / np.sum(xi), yi / np.sum(yi)
+
+def _flash_residual(lnK, P, T, zi, eos, rhodict={}):
+    r"""
+    Residual in the equality of fugacity of a two phase flash, :math:`\ln K_i + \ln\phi^v_i - \ln\phi^l_i`, for components in the feed.
+    
+    Parameters
+    ----------
+    lnK : numpy.ndarray
+        Log of the K-value of each component in the feed
+    P : float
+        Pressure of the system [Pa]
     T : float
         Temperature of the system [K]
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed
     eos : obj
         An instance of the defined EOS class to be used in thermodynamic computations.
     rhodict : dict, Optional, default: {}
-        Dictionary of options used in calculating pressure vs. mole 
+        Dictionary of options used in calculating pressure vs. mole
 
     Returns
     -------
+    residual : numpy.ndarray
+        Residual for each component in the feed
+    values : tuple
+        Vapor fraction, liquid mole fractions, vapor mole fractions, liquid flag, and vapor flag
+    """
+
+    ind = np.where(zi > 0.)[0]
+    Ki = np.ones(len(zi))
+    Ki[ind] = np.exp(lnK)
+
+    beta, xi, yi = _flash_compositions(zi, Ki)
+    phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict=rhodict)
+    phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict=rhodict)
+    residual = lnK + np.log(phiv[ind]) - np.log(phil[ind])
+
+    return residual, (beta, xi, yi, flagl, flagv)
+
+def calc_PT_phase(P, T, zi, eos, rhodict={}, Ki=None, maxiter=100, tol=1e-10, accelerate="dem", accel_freq=5, newton_tol=1e-4, newton_maxiter=20, stability=True, trivial_tol=1e-6):
+    r"""
+    Isothermal flash, compute the vapor fraction and phase compositions of a feed at a given pressure and temperature.
+
+    K-values are initialized with the Wilson correlation unless provided. If the Rachford-Rice equation with these K-values doesn't predict two phases, a tangent plane stability test of the feed, :func:`calc_tangent_plane_distance`, decides whether the feed is stable, or provides the initial K-values. Successive substitution on :math:`\ln K_i` is accelerated with :func:`accelerate_substitution`, and once the change in :math:`\ln K_i` is below "newton_tol", Newton's method with a finite difference Jacobian completes the convergence.
+    
+    Parameters
+    ----------
     P : float
         Pressure of the system [Pa]
+    T : float
+        Temperature of the system [K]
+    zi : numpy.ndarray
+        Mole fraction of each component in the feed, sum(zi) should equal 1.0
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    rhodict : dict, Optional, default: {}
+        Dictionary of options used in calculating pressure vs. mole
+    Ki : numpy.ndarray, Optional, default: None
+        Initial guess in K-values. If None, the Wilson correlation is used.
+    maxiter : int, Optional, default: 100
+        Maximum number of successive substitution iterations
+    tol : float, Optional, default: 1e-10
+        Tolerance in the maximum change of :math:`\ln K_i` or the residual of fugacity equality
+    accelerate : str, Optional, default: "dem"
+        Method used to accelerate successive substitution, "dem", "anderson", or None
+    accel_freq : int, Optional, default: 5
+        Number of iterations between extrapolations with the "dem" method
+    newton_tol : float, Optional, default: 1e-4
+        Change in :math:`\ln K_i` below which Newton's method is used
+    newton_maxiter : int, Optional, default: 20
+        Maximum number of Newton steps
+    stability : bool, Optional, default: True
+        If True, a feed predicted to be a single phase is checked with a tangent plane stability test
+    trivial_tol : float, Optional, default: 1e-6
+        If the maximum difference between the liquid and vapor mole fractions falls below this value, the iterations have approached the trivial solution, and the feed is returned as the single phase with the lower Gibbs energy
+
+    Returns
+    -------
+    xi : numpy.ndarray
+        Liquid mole fraction of each component. If the feed is a stable vapor, NaN values are returned.
     yi : numpy.ndarray
-        Mole fraction of each component, sum(yi) should equal 1.0
+        Vapor mole fraction of each component. If the feed is a stable liquid, NaN values are returned.
+    beta : float
+        Vapor fraction of the feed
+    flagl : int
+        Flag identifying the fluid type of the liquid phase. A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true
+    flagv : int
+        Flag identifying the fluid type of the vapor phase. A value of 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither is true, 4 means ideal gas is assumed
     """
 
     logger = logging.getLogger(__name__)
 
-    logger.error("The function, calc_PT_phase, is not yet available.")
+    zi = np.array(zi, float)
+    zi /= np.sum(zi)
+    ind = np.where(zi > 0.)[0]
+    nan_array = np.nan * np.ones(len(zi))
+
+    def single_phase(beta):
+        if beta <= 0.:
+            phil, rhol, flagl = calc_phil(P, T, zi, eos, rhodict=rhodict)
+            logger.info("Flash: Feed is a stable liquid, flag {}".format(flagl))
+            return zi, nan_array, 0.0, flagl, 3
+        else:
+            phiv, rhov, flagv = calc_phiv(P, T, zi, eos, rhodict=rhodict)
+            logger.info("Flash: Feed is a stable vapor, flag {}".format(flagv))
+            return nan_array, zi, 1.0, 3, flagv
+
+    def trivial_solution():
+        # Of the liquid and vapor roots of the feed, the phase with the lower Gibbs energy, sum(zi*ln(phi_i)), is stable
+        phil, rhol, flagl = calc_phil(P, T, zi, eos, rhodict=rhodict)
+        phiv, rhov, flagv = calc_phiv(P, T, zi, eos, rhodict=rhodict)
+        gl = np.sum(zi[ind] * np.log(phil[ind]))
+        gv = np.sum(zi[ind] * np.log(phiv[ind]))
+        logger.info("Flash: Compositions approach the trivial solution, reduced Gibbs energy of liquid {} and vapor {}".format(gl, gv))
+        return single_phase(0.0 if (np.isnan(gv) or gl <= gv) else 1.0)
+
+    if len(ind) == 1:
+        Psat, _, _ = calc_Psat(T, zi, eos, rhodict)
+        return single_phase(0.0 if (np.isnan(Psat) or P > Psat) else 1.0)
+
+    if Ki is None:
+        Ki = calc_wilson_K(P, T, eos, rhodict)
+    Ki = np.array(Ki, float)
+    beta = calc_rachford_rice(zi, Ki)
+
+    # Stability pre-check
+    if stability and not (0. < beta < 1.):
+        if beta <= 0.:
+            phiz, rhoz, flagz = calc_phil(P, T, zi, eos, rhodict=rhodict)
+        else:
+            phiz, rhoz, flagz = calc_phiv(P, T, zi, eos, rhodict=rhodict)
+
+        Kstab = None
+        for trial_phase in ["vapor", "liquid"]:
+            wi, tm, phiw, flagw = calc_tangent_plane_distance(P, T, zi, phiz, eos, trial_phase=trial_phase, rhodict=rhodict)
+            if tm < -1e-8 and not any(np.isnan(wi)):
+                Kstab = np.ones(len(zi))
+                if trial_phase == "vapor":
+                    Kstab[ind] = wi[ind] / zi[ind]
+                else:
+                    Kstab[ind] = zi[ind] / np.maximum(wi[ind], 1e-300)
+                logger.info("Flash: Feed is unstable to a {} phase, tm {}".format(trial_phase, tm))
+                break
+
+        if Kstab is None:
+            return single_phase(beta)
+        Ki = Kstab
 
-  #  Psat = np.zeros_like(xi)
-  #  for i in range(np.size(xi)):
-  #      xi_tmp = np.zeros_like(xi)
-  #      xi_tmp[i] = 1.0
-  #      Psat[i], rholsat, rhogsat = calc_Psat(T, xi_tmp, eos, rhodict)
-  #      if np.isnan(Psat[i]):
-  #          Psat[i], NaNbead = setPsat(i, eos)
-  #          if np.isnan(Psat[i]):
-  #              logger.error("Component, {}, is beyond it's critical point. Add an exception to setPsat".format(NaNbead))
+    # Accelerated successive substitution
+    lnK = np.log(Ki[ind])
+    ln_hist, lnnew_hist = [], []
+    converged, use_newton = False, False
+    for z in range(maxiter):
+        beta, xi, yi = _flash_compositions(zi, Ki)
+        phil, rhol, flagl = calc_phil(P, T, xi, eos, rhodict=rhodict)
+        phiv, rhov, flagv = calc_phiv(P, T, yi, eos, rhodict=rhodict)
+        if any(np.isnan(phil[ind])) or any(np.isnan(phiv[ind])):
+            logger.warning("Flash: Fugacity coefficients could not be computed, P {} Pa, T {} K, xi {}, yi {}".format(P, T, xi, yi))
+            break
+
+        lnK_new = np.log(phil[ind]) - np.log(phiv[ind])
+        error = np.max(np.abs(lnK_new - lnK))
+        logger.debug("Flash: Iteration {}, beta {}, xi {}, yi {}, error {}".format(z, beta, xi, yi, error))
+
+        if error < tol:
+            converged = True
+            break
+        if error < newton_tol:
+            use_newton = True
+            break
+        if np.max(np.abs(xi[ind] - yi[ind])) < trivial_tol:
+            return trivial_solution()
+
+        ln_hist.append(lnK)
+        lnnew_hist.append(lnK_new)
+        lnK = lnK_new
+        if accelerate is not None and (accelerate != "dem" or (len(lnnew_hist) >= 3 and (z+1) % accel_freq == 0)):
+            lnK, flag_accel = accelerate_substitution(ln_hist, lnnew_hist, method=accelerate)
+            if flag_accel and accelerate == "dem":
+                ln_hist, lnnew_hist = [], []
+        Ki[ind] = np.exp(lnK)
+    else:
+        use_newton = True
+
+    # Newton's method
+    if use_newton:
+        lnK = lnK_new
+        F, values = _flash_residual(lnK, P, T, zi, eos, rhodict=rhodict)
+        norm = np.linalg.norm(F)
+        step = 1e-6
+        for z in range(newton_maxiter):
+            if norm < tol:
+                converged = True
+                break
+            Jac = np.zeros((len(F), len(F)))
+            for j in range(len(ind)):
+                lnK_tmp = np.copy(lnK)
+                lnK_tmp[j] += step
+                Jac[:, j] = (_flash_residual(lnK_tmp, P, T, zi, eos, rhodict=rhodict)[0] - F) / step
+            try:
+                dx = np.linalg.solve(Jac, -F)
+            except np.linalg.LinAlgError:
+                logger.info("Flash: Singular Jacobian")
+                break
+            alpha = 1.0
+            for k in range(6):
+                F_new, values_new = _flash_residual(lnK + alpha*dx, P, T, zi, eos, rhodict=rhodict)
+                norm_new = np.linalg.norm(F_new)
+                if norm_new < norm:
+                    break
+                alpha /= 2.0
+            else:
+                logger.info("Flash: Newton step could not reduce the residual, {}".format(norm))
+                break
+            lnK, F, values, norm = lnK + alpha*dx, F_new, values_new, norm_new
+        else:
+            converged = norm < tol
+        beta, xi, yi, flagl, flagv = values
+        Ki[ind] = np.exp(lnK)
 
-  #  zi = np.array([0.5, 0.5])
+    if not converged:
+        logger.warning("Flash: P {} Pa, T {} K, zi {} did not converge".format(P, T, zi))
+        return nan_array, nan_array, np.nan, 3, 3
 
-  #  #estimate ki
-  #  ki = Psat / P
+    if not (0. < beta < 1.):
+        return single_phase(beta)
+    if np.max(np.abs(xi[ind] - yi[ind])) < trivial_tol:
+        return trivial_solution()
 
-  #  #estimate beta (not thermodynamic) vapor frac
-  #  beta = (1.0 - np.sum(ki * zi)) / np.prod(ki - 1.0)
+    logger.info("Flash: P {} Pa, T {} K, zi {}, beta {}, xi {}, yi {}".format(P, T, zi, beta, xi, yi))
 
+    return xi, yi, beta, flagl, flagv
 
 ######################################################################
 #                                                                    #
-#                              Calc dadT                             #
+#                       Calc Derived Properties                      #
 #                                                                    #
 ######################################################################
-def calc_dadT(rho, T, xi, eos, rhodict={}):
+def calc_derived_properties(rho, T, xi, eos, Cp_ideal=None, massi=None, step=1e-3):
     r"""
-    Calculate the derivative of the Helmholtz energy with respect to temperature, :math:`\frac{dA}{dT}`.
-    
+    Calculate caloric and derivative properties from the residual Helmholtz energy, :math:`a=A^{res}/(N k_B T)`, and its first and second derivatives with respect to temperature and density.
+
+    Derivatives are taken with central differences from a 3x3 stencil in temperature and density. States that share a temperature and composition are evaluated together, so each group requires only three calls to the eos, one for each temperature in the stencil.
+
     Parameters
     ----------
-    rho : numpy.ndarray
-        Density array. Length depends on values in rhodict [mol/:math:`m^3`]
-    T : float
-        Temperature of the system [K]
+    rho : float or numpy.ndarray
+        Molar density of each state [mol/m^3]
+    T : float or numpy.ndarray
+        Temperature of each state [K]
     xi : numpy.ndarray
-        Liquid mole fraction of each component, sum(xi) should equal 1.0
+        Mole fraction of each component, sum(xi) should equal 1.0. Either one composition for all states, or one row for each state.
     eos : obj
         An instance of the defined EOS class to be used in thermodynamic computations.
-    rhodict : dict, Optional, default: {}
-        Dictionary of options used in calculating pressure vs. mole 
+    Cp_ideal : numpy.ndarray, Optional, default: None
+        Ideal gas heat capacity of each component [J/(mol K)]. Needed for the total heat capacities, the speed of sound, and the Joule-Thomson coefficient.
+    massi : numpy.ndarray, Optional, default: None
+        Molar mass of each component [kg/mol], needed for the speed of sound. If not given, the eos attribute ``_massi`` is used when available.
+    step : float, Optional, default: 1e-3
+        Relative step size in temperature and density for the central differences
 
     Returns
     -------
-    dadT : numpy.ndarray
-        Array of derivative values of Helmholtz energy with respect to temperature
+    properties : dict
+        Dictionary of arrays with one value for each state:
+
+        - Ares: Residual Helmholtz energy, :math:`A^{res}/(N k_B T)`
+        - Z: Compressibility factor
+        - Ures: Residual internal energy [J/mol]
+        - Hres: Residual enthalpy [J/mol]
+        - Sres: Residual entropy [J/(mol K)]
+        - Cvres: Residual isochoric heat capacity [J/(mol K)]
+        - Cpres: Residual isobaric heat capacity [J/(mol K)]
+        - dPdrho: :math:`(\partial P/\partial \rho)_T` [Pa m^3/mol]
+        - dPdT: :math:`(\partial P/\partial T)_{\rho}` [Pa/K]
+        - Cv: Isochoric heat capacity [J/(mol K)], NaN without Cp_ideal
+        - Cp: Isobaric heat capacity [J/(mol K)], NaN without Cp_ideal
+        - speed_of_sound: Speed of sound [m/s], NaN without Cp_ideal and molar masses
+        - mu_JT: Joule-Thomson coefficient [K/Pa], NaN without Cp_ideal
     """
 
-    #logger = logging.getLogger(__name__)
+    logger = logging.getLogger(__name__)
 
-    step = np.sqrt(np.finfo(float).eps) * T * 1000.0
+    rho = np.atleast_1d(np.array(rho, float))
+    T = np.atleast_1d(np.array(T, float))
+    xi = np.atleast_2d(np.array(xi, float))
+    npts = max(len(rho), len(T), len(xi))
+    try:
+        rho = np.broadcast_to(rho, (npts,))
+        T = np.broadcast_to(T, (npts,))
+        xi = np.broadcast_to(xi, (npts, xi.shape[1]))
+    except ValueError:
+        raise ValueError("The number of densities, temperatures, and compositions are different")
+
+    # Stencil of residual Helmholtz energy: [temperature, density, state]
+    a = np.zeros((3, 3, npts))
+    groups = {}
+    for i in range(npts):
+        groups.setdefault((T[i], tuple(xi[i])), []).append(i)
+    for (Ti, xt), ind in groups.items():
+        ind = np.array(ind)
+        rho_stencil = np.concatenate([rho[ind]*(1.0-step), rho[ind], rho[ind]*(1.0+step)])
+        for j, Tj in enumerate((Ti*(1.0-step), Ti, Ti*(1.0+step))):
+            a[j][:, ind] = np.reshape(eos.residual_helmholtz_energy(rho_stencil, Tj, np.array(xt)), (3, len(ind)))
+    logger.debug("Residual Helmholtz energy evaluated for {} states in {} groups".format(npts, len(groups)))
+
+    drho = step*rho
+    dT = step*T
+    A0 = a[1, 1]
+    a_rho = (a[1, 2] - a[1, 0])/(2.0*drho)
+    a_rhorho = (a[1, 2] - 2.0*A0 + a[1, 0])/drho**2
+    a_T = (a[2, 1] - a[0, 1])/(2.0*dT)
+    a_TT = (a[2, 1] - 2.0*A0 + a[0, 1])/dT**2
+    a_rhoT = (a[2, 2] - a[2, 0] - a[0, 2] + a[0, 0])/(4.0*drho*dT)
 
-    #computer rho+step and rho-step for better a bit better performance
-    Ap = calchelmholtz.calc_A(np.array([rho]), xi, T + step, eos)
-    Am = calchelmholtz.calc_A(np.array([rho]), xi, T - step, eos)
+    R = constants.Nav * constants.kb
+    Z = 1.0 + rho*a_rho
+    Ures = -R*T**2*a_T
+    Sres = -R*(T*a_T + A0)
+    Hres = Ures + R*T*(Z - 1.0)
+    Cvres = -R*(2.0*T*a_T + T**2*a_TT)
+    dPdrho = R*T*(1.0 + 2.0*rho*a_rho + rho**2*a_rhorho)
+    dPdT = R*rho*Z + R*T*rho**2*a_rhoT
+    Cpres = Cvres + T*dPdT**2/(rho**2*dPdrho) - R
+
+    properties = {"Ares": A0, "Z": Z, "Ures": Ures, "Hres": Hres, "Sres": Sres, "Cvres": Cvres, "Cpres": Cpres, "dPdrho": dPdrho, "dPdT": dPdT}
+
+    nan_array = np.nan*np.ones(npts)
+    if Cp_ideal is not None:
+        Cp_ig = np.sum(xi*np.array(Cp_ideal, float), axis=1)
+        Cv = Cvres + Cp_ig - R
+        Cp = Cpres + Cp_ig
+        properties["Cv"] = Cv
+        properties["Cp"] = Cp
+        properties["mu_JT"] = (T*dPdT/(rho**2*dPdrho) - 1.0/rho)/Cp
+    else:
+        properties["Cv"] = nan_array
+        properties["Cp"] = nan_array
+        properties["mu_JT"] = nan_array
+
+    if massi is None and hasattr(eos, "_massi"):
+        massi = eos._massi
+    if Cp_ideal is not None and massi is not None:
+        M = np.sum(xi*np.array(massi, float), axis=1)
+        properties["speed_of_sound"] = np.sqrt(Cp/Cv*dPdrho/M)
+    else:
+        properties["speed_of_sound"] = nan_array
 
-    return (Ap - Am) / (2.0 * step)
+    return properties
 
@@ -2,6 +2,14 @@
     This thermo module contains a series of wrappers to handle the inputs and outputs of these functions. The `calc` module contains the thermodynamic calculations. Calculation of pressure, chemical potential, and max density are handled by an eos object so that these functions can be used with any EOS.
     
     None of the functions in this folder need to be handled directly, as a function factory is included in our __init__.py file. Add "from thermodynamics import thermo" and use "thermo("calc_type",eos,input_dict)" to get started.
+
+    State points are independent (or passed warm-start values in contiguous series), so they may be distributed over multiple processes with the option "threads" in the input dictionary. A value of -1 uses all available cores.
+
+    Bubble and dew point calculations accept the option "trace", either true or a dictionary of options for :func:`~despasito.thermodynamics.calc.calc_saturation_envelope`. Points are then sorted by temperature and composition, and each is predicted from the previously converged points.
+
+    Bubble and dew point calculations accept initial guesses for each point in pressure, "Pguess", and in the mole fractions of the incipient phase, "yiguess" and "xiguess" respectively, where a row of NaN means no guess.
+
+    Bubble point calculations also accept the option "vectorize", either true or a dictionary of options for :func:`~despasito.thermodynamics.calc.calc_bubble_points`. Points at the same temperature are then solved together, and those that don't converge are computed individually.
     
 """
 
@@ -9,6 +17,7 @@ import numpy as np
 import logging
 
 from . import calc
+from despasito.utils import parallelization
 
 ######################################################################
 #                                                                    #
@@ -65,15 +74,13 @@ def phase_xiT(eos, sys_dict):
     # Process initial guess in pressure
     if 'Pguess' in sys_dict:
         Pguess = np.array(sys_dict['Pguess'],float)
-        if np.size(T_list) != np.size(Pguess):
-            if type(Pguess) not in [list, numpy.ndarray]:
-                opts["Pguess"] = np.ones(len(T_list))*Pguess
-                logger.info("The same pressure, {}, was used for all mole fraction values".format(Pguess))
-            elif len(T_list) == 1:
-                opts["Pguess"] = np.ones(len(T_list))*float(Pguess[0])
-                logger.info("The same pressure, {}, was used for all mole fraction values".format(Pguess))
-            else:
-                raise ValueError("The number of provided pressure and mole fraction sets are different")
+        if np.size(T_list) == np.size(Pguess):
+            opts["Pguess"] = np.reshape(Pguess, len(T_list))
+        elif np.size(Pguess) == 1:
+            opts["Pguess"] = np.ones(len(T_list))*float(np.ravel(Pguess)[0])
+            logger.info("The same pressure, {}, was used for all mole fraction values".format(Pguess))
+        else:
+            raise ValueError("The number of provided pressure and mole fraction sets are different")
         logger.info("Using user defined initial guess has been provided")
     else:
         if 'CriticalProp' in sys_dict:
@@ -88,6 +95,14 @@ def phase_xiT(eos, sys_dict):
                 logger.info("Pguess: ", Pguess)
                 opts["Pguess"] = Pguess
 
+    # Process initial guess in yi mole fractions
+    if 'yiguess' in sys_dict:
+        yiguess = np.array(sys_dict['yiguess'],float)
+        if np.shape(yiguess) != np.shape(xi_list):
+            raise ValueError("The number of provided yi guesses and mole fraction sets are different")
+        opts["yiguess"] = yiguess
+        logger.info("Using user defined initial guess in yi")
+
     # Extract desired method
     if "method" in sys_dict:
         logger.info("Accepted optimization method, {}, for solving pressure".format(sys_dict['method']))
@@ -108,6 +123,37 @@ def phase_xiT(eos, sys_dict):
         logger.info("Accepted options for mole fraction optimization")
         opts["zi_opts"] = sys_dict["mole fraction options"]
 
+    # Extract number of processes
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+    else:
+        threads = 1
+
+    # Trace the phase envelope
+    if "trace" in sys_dict and sys_dict["trace"]:
+        if isinstance(sys_dict["trace"], dict):
+            trace_opts = sys_dict["trace"]
+        else:
+            trace_opts = {}
+        logger.info("Points are solved in order along the phase envelope with the options: {}".format(trace_opts))
+    else:
+        trace_opts = None
+
+    # Solve points at the same temperature together
+    if "vectorize" in sys_dict and sys_dict["vectorize"]:
+        if isinstance(sys_dict["vectorize"], dict):
+            vector_opts = sys_dict["vectorize"]
+        else:
+            vector_opts = {}
+        if trace_opts is not None:
+            logger.warning("Points are traced along the phase envelope, the option vectorize is ignored")
+            vector_opts = None
+        else:
+            logger.info("Points at the same temperature are solved together with the options: {}".format(vector_opts))
+    else:
+        vector_opts = None
+
     ## Calculate P and yi
     l_x, l_c = np.array(xi_list).shape
     T_list = np.array(T_list)
@@ -116,10 +162,95 @@ def phase_xiT(eos, sys_dict):
     flagl_list = np.zeros(l_x)
     yi_list = np.zeros((l_x,l_c))
     obj_list = np.zeros(l_x)
+
+    opts_list = []
     for i in range(l_x):
-        optsi = opts
+        optsi = dict(opts)
         if "Pguess" in opts:
-            optsi["Pguess"] = optsi["Pguess"][i]
+            optsi["Pguess"] = opts["Pguess"][i]
+        if "yiguess" in opts:
+            optsi["yiguess"] = opts["yiguess"][i]
+        opts_list.append(optsi)
+
+    # Points that fail in the batched solver are computed individually
+    remaining = np.arange(l_x)
+    if vector_opts is not None:
+        solved = np.zeros(l_x, bool)
+        for T in np.unique(T_list):
+            ind = np.where(T_list == T)[0]
+            Pguess = opts["Pguess"][ind] if "Pguess" in opts else None
+            yiguess = opts["yiguess"][ind] if "yiguess" in opts else None
+            rhodict = opts["rhodict"] if "rhodict" in opts else {}
+            P, yi, flagv, flagl, obj, success = calc.calc_bubble_points(xi_list[ind], T, eos, rhodict=rhodict, Pguess=Pguess, yiguess=yiguess, **vector_opts)
+            ind, P, yi, flagv, flagl, obj = [x[success] for x in [ind, P, yi, flagv, flagl, obj]]
+            P_list[ind], yi_list[ind], flagv_list[ind], flagl_list[ind], obj_list[ind] = P, yi, flagv, flagl, obj
+            solved[ind] = True
+        remaining = np.where(~solved)[0]
+        logger.info("{} of {} points are solved individually".format(len(remaining), l_x))
+
+    # Each process solves a contiguous series of points, ordered by temperature and then composition when tracing the envelope
+    if trace_opts is not None:
+        order = np.lexsort((xi_list[:,0], T_list))
+    else:
+        order = remaining
+    batches = [order[ind] for ind in parallelization.contiguous_batches(len(order), threads)]
+    inputs = [(T_list[ind], xi_list[ind], [opts_list[i] for i in ind], trace_opts) for ind in batches]
+    output = parallelization.batch_jobs(_phase_xiT_batch, inputs, eos, ncores=threads) if inputs else []
+
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                P_list[i], yi_list[i] = [np.nan, np.nan]
+                flagl_list[i], flagv_list[i], obj_list[i] = [3, 3, np.nan]
+            else:
+                P_list[i], yi_list[i], flagv_list[i], flagl_list[i], obj_list[i] = batch_output[j]
+
+    logger.info("--- Calculation phase_xiT Complete ---")
+
+    return {"T":T_list,"xi":xi_list,"P":P_list,"yi":yi_list,"flagl":flagl_list,"flagv":flagv_list,"obj":obj_list}
+
+
+def _phase_xiT_batch(eos, inputs):
+
+    r"""
+    Calculate the bubble point of a series of state points, where the result of each point is the initial guess for the next.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    inputs : tuple
+        Array of temperatures, array of liquid mole fractions, a list of the keyword arguments of :func:`~despasito.thermodynamics.calc.calc_xT_phase` (and optionally an initial guess, yiguess) for each point, and a dictionary of options for :func:`~despasito.thermodynamics.calc.calc_saturation_envelope`. If the last is None, the envelope isn't traced.
+
+    Returns
+    -------
+    output : list[tuple]
+        Pressure, vapor mole fractions, vapor flag, liquid flag, and objective value for each point
+    """
+
+    logger = logging.getLogger(__name__)
+
+    T_list, xi_list, opts_list, trace_opts = inputs
+
+    # Warm-start values are passed from one point to the next
+    state = calc.PhaseSolverState()
+
+    if trace_opts is not None:
+        opts = {}
+        for key, value in opts_list[0].items():
+            if key in ["rhodict", "zi_opts", "pressure_opts", "meth"]:
+                opts[key] = value
+        Pguess = [optsi["Pguess"] if "Pguess" in optsi else -1 for optsi in opts_list]
+        return calc.calc_saturation_envelope(xi_list, T_list, eos, feed_phase="liquid", Pguess=Pguess, state=state, **opts, **trace_opts)
+
+    output = []
+    for i in range(len(T_list)):
+        optsi = dict(opts_list[i])
+
+        # A guess given for this point replaces the value passed from the previous point
+        yiguess = optsi.pop("yiguess", None)
+        if yiguess is not None and np.all(np.isfinite(yiguess)):
+            state.yi = np.array(yiguess, float)
 
         logger.info("T (K), xi: {} {}, Let's Begin!".format(str(T_list[i]), str(xi_list[i])))
         try:
@@ -128,22 +259,18 @@ def phase_xiT(eos, sys_dict):
                     opt_tmp = {"rhodict": optsi["rhodict"]}
                 else:
                     opt_tmp = {}
-                P_list[i], _, _ = calc.calc_Psat(T_list[i], xi_list[i], eos, **opt_tmp)
-                yi_list[i], flagv_list[i], flagl_list[i], obj_list[i] = xi_list[i], 0, 1, 0.0 
+                P, _, _ = calc.calc_Psat(T_list[i], xi_list[i], eos, **opt_tmp)
+                output.append((P, xi_list[i], 0, 1, 0.0))
             else:
-                P_list[i], yi_list[i], flagv_list[i], flagl_list[i], obj_list[i] = calc.calc_xT_phase(xi_list[i], T_list[i], eos, **optsi)
+                output.append(calc.calc_xT_phase(xi_list[i], T_list[i], eos, state=state, **optsi))
         except:
             logger.warning("T (K), xi: {} {}, calculation did not produce a valid result.".format(T_list[i], xi_list[i]))
             logger.debug("Calculation Failed:", exc_info=True)
-            P_list[i], yi_list[i] = [np.nan, np.nan]
-            flagl_list[i], flagv_list[i], obj_list[i] = [3, 3, np.nan]
+            output.append((np.nan, np.nan, 3, 3, np.nan))
             continue
-        logger.info("P (Pa), yi: {} {}".format(P_list[i], yi_list[i]))
-
-    logger.info("--- Calculation phase_xiT Complete ---")
-
-    return {"T":T_list,"xi":xi_list,"P":P_list,"yi":yi_list,"flagl":flagl_list,"flagv":flagv_list,"obj":obj_list}
+        logger.info("P (Pa), yi: {} {}".format(output[-1][0], output[-1][1]))
 
+    return output
 
 ######################################################################
 #                                                                    #
@@ -198,15 +325,13 @@ def phase_yiT(eos, sys_dict):
     # Process initial guess in pressure
     if 'Pguess' in sys_dict:
         Pguess = np.array(sys_dict['Pguess'],float)
-        if np.size(T_list) != np.size(Pguess):
-            if type(Pguess) not in [list, numpy.ndarray]:
-                opts["Pguess"] = np.ones(len(T_list))*Pguess
-                logger.info("The same pressure, {}, was used for all mole fraction values".format(Pguess))
-            elif len(T_list) == 1:
-                opts["Pguess"] = np.ones(len(T_list))*float(Pguess[0])
-                logger.info("The same pressure, {}, was used for all mole fraction values".format(Pguess))
-            else:
-                raise ValueError("The number of provided pressure and mole fraction sets are different")
+        if np.size(T_list) == np.size(Pguess):
+            opts["Pguess"] = np.reshape(Pguess, len(T_list))
+        elif np.size(Pguess) == 1:
+            opts["Pguess"] = np.ones(len(T_list))*float(np.ravel(Pguess)[0])
+            logger.info("The same pressure, {}, was used for all mole fraction values".format(Pguess))
+        else:
+            raise ValueError("The number of provided pressure and mole fraction sets are different")
         logger.info("Using user defined initial guess has been provided")
     else:
         if 'CriticalProp' in sys_dict:
@@ -221,6 +346,14 @@ def phase_yiT(eos, sys_dict):
                 logger.info("Pguess: {}".format(Pguess))
                 opts["Pguess"] = Pguess
 
+    # Process initial guess in xi mole fractions
+    if 'xiguess' in sys_dict:
+        xiguess = np.array(sys_dict['xiguess'],float)
+        if np.shape(xiguess) != np.shape(yi_list):
+            raise ValueError("The number of provided xi guesses and mole fraction sets are different")
+        opts["xiguess"] = xiguess
+        logger.info("Using user defined initial guess in xi")
+
     # Extract desired method
     if "method" in sys_dict:
         logger.info("Accepted optimization method, {}, for solving pressure".format(sys_dict['method']))
@@ -241,6 +374,23 @@ def phase_yiT(eos, sys_dict):
         logger.info("Accepted options for mole fraction optimization")
         opts["zi_opts"] = sys_dict["mole fraction options"]
 
+    # Extract number of processes
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+    else:
+        threads = 1
+
+    # Trace the phase envelope
+    if "trace" in sys_dict and sys_dict["trace"]:
+        if isinstance(sys_dict["trace"], dict):
+            trace_opts = sys_dict["trace"]
+        else:
+            trace_opts = {}
+        logger.info("Points are solved in order along the phase envelope with the options: {}".format(trace_opts))
+    else:
+        trace_opts = None
+
     ## Calculate P and xi
     l_x, l_c = np.array(yi_list).shape
     T_list = np.array(T_list)
@@ -249,10 +399,79 @@ def phase_yiT(eos, sys_dict):
     flagl_list = np.zeros(l_x)
     xi_list = np.zeros((l_x,l_c))
     obj_list = np.zeros(l_x)
+
+    opts_list = []
     for i in range(l_x):
-        optsi = opts
+        optsi = dict(opts)
         if "Pguess" in opts:
-            optsi["Pguess"] = optsi["Pguess"][i]
+            optsi["Pguess"] = opts["Pguess"][i]
+        if "xiguess" in opts:
+            optsi["xiguess"] = opts["xiguess"][i]
+        opts_list.append(optsi)
+
+    # Each process solves a contiguous series of points, ordered by temperature and then composition when tracing the envelope
+    if trace_opts is not None:
+        order = np.lexsort((yi_list[:,0], T_list))
+    else:
+        order = np.arange(l_x)
+    batches = [order[ind] for ind in parallelization.contiguous_batches(l_x, threads)]
+    inputs = [(T_list[ind], yi_list[ind], [opts_list[i] for i in ind], trace_opts) for ind in batches]
+    output = parallelization.batch_jobs(_phase_yiT_batch, inputs, eos, ncores=threads)
+
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                P_list[i], xi_list[i] = [np.nan, np.nan]
+                flagl_list[i], flagv_list[i], obj_list[i] = [3, 3, np.nan]
+            else:
+                P_list[i], xi_list[i], flagl_list[i], flagv_list[i], obj_list[i] = batch_output[j]
+
+    logger.info("--- Calculation phase_yiT Complete ---")
+
+    return {"T":T_list,"yi":yi_list,"P":P_list,"xi":xi_list,"flagl":flagl_list,"flagv":flagv_list, "obj":obj_list}
+
+def _phase_yiT_batch(eos, inputs):
+
+    r"""
+    Calculate the dew point of a series of state points, where the result of each point is the initial guess for the next.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    inputs : tuple
+        Array of temperatures, array of vapor mole fractions, a list of the keyword arguments of :func:`~despasito.thermodynamics.calc.calc_yT_phase` (and optionally an initial guess, xiguess) for each point, and a dictionary of options for :func:`~despasito.thermodynamics.calc.calc_saturation_envelope`. If the last is None, the envelope isn't traced.
+
+    Returns
+    -------
+    output : list[tuple]
+        Pressure, liquid mole fractions, liquid flag, vapor flag, and objective value for each point
+    """
+
+    logger = logging.getLogger(__name__)
+
+    T_list, yi_list, opts_list, trace_opts = inputs
+
+    # Warm-start values are passed from one point to the next
+    state = calc.PhaseSolverState()
+
+    if trace_opts is not None:
+        opts = {}
+        for key, value in opts_list[0].items():
+            if key in ["rhodict", "zi_opts", "pressure_opts", "meth"]:
+                opts[key] = value
+        Pguess = [optsi["Pguess"] if "Pguess" in optsi else -1 for optsi in opts_list]
+        return calc.calc_saturation_envelope(yi_list, T_list, eos, feed_phase="vapor", Pguess=Pguess, state=state, **opts, **trace_opts)
+
+    output = []
+    for i in range(len(T_list)):
+        optsi = dict(opts_list[i])
+
+        # A guess given for this point replaces the value passed from the previous point
+        xiguess = optsi.pop("xiguess", None)
+        if xiguess is not None and np.all(np.isfinite(xiguess)):
+            state.xi = np.array(xiguess, float)
+
         logger.info("T (K), yi: {} {}, Let's Begin!".format(str(T_list[i]), str(yi_list[i])))
         try:
             if len(yi_list[i][yi_list[i]!=0.])==1:
@@ -260,21 +479,179 @@ def phase_yiT(eos, sys_dict):
                     opt_tmp = {"rhodict": optsi["rhodict"]}
                 else:
                     opt_tmp = {}
-                P_list[i], _, _ = calc.calc_Psat(T_list[i], yi_list[i], eos, **opt_tmp)
-                xi_list[i], flagv_list[i], flagl_list[i], obj_list[i] = yi_list[i], 0, 1, 0.0
+                P, _, _ = calc.calc_Psat(T_list[i], yi_list[i], eos, **opt_tmp)
+                output.append((P, yi_list[i], 1, 0, 0.0))
             else:
-                P_list[i], xi_list[i], flagl_list[i], flagv_list[i], obj_list[i]  = calc.calc_yT_phase(yi_list[i], T_list[i], eos, **optsi)
+                output.append(calc.calc_yT_phase(yi_list[i], T_list[i], eos, state=state, **optsi))
         except:
             logger.warning("T (K), yi: {} {}, calculation did not produce a valid result.".format(str(T_list[i]), str(yi_list[i])))
             logger.debug("Calculation Failed:", exc_info=True)
-            P_list[i], xi_list[i] = [np.nan, np.nan]
-            flagl_list[i], flagv_list[i], obj_list[i] = [3, 3, np.nan]
+            output.append((np.nan, np.nan, 3, 3, np.nan))
             continue
-        logger.info("P (Pa), xi: {} {}".format(str(P_list[i]), str(xi_list[i])))
+        logger.info("P (Pa), xi: {} {}".format(str(output[-1][0]), str(output[-1][1])))
 
-    logger.info("--- Calculation phase_yiT Complete ---")
+    return output
 
-    return {"T":T_list,"yi":yi_list,"P":P_list,"xi":xi_list,"flagl":flagl_list,"flagv":flagv_list, "obj":obj_list}
+######################################################################
+#                                                                    #
+#                Isothermal Flash given zi, T, and P                 #
+#                                                                    #
+######################################################################
+def flash(eos, sys_dict):
+
+    r"""
+    Isothermal flash calculation of feeds given temperature, pressure, and feed mole fractions.
+
+    Input and system information is assessed first. Wilson K-values and the Rachford-Rice equation are evaluated for all feeds at once, before each feed is flashed with :func:`~despasito.thermodynamics.calc.calc_PT_phase`. An output file is generated with T, P, zi, and the corresponding vapor fraction, xi, and yi.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    sys_dict: dict
+        A dictionary of all information given in the input .json file that wasn't used to create the EOS object (e.g. options for density array :func:`~despasito.thermodynamics.calc.PvsRho`).
+
+    Returns
+    -------
+    output_dict : dict
+        Output of dictionary containing given and calculated values
+    """
+
+    logger = logging.getLogger(__name__)
+
+    ## Extract and check input data
+    if 'Tlist' in sys_dict:
+        T_list = np.array(sys_dict['Tlist'],float)
+        logger.info("Using Tlist")
+    else:
+        raise ValueError('Tlist is not specified')
+
+    if 'Plist' in sys_dict:
+        P_list = np.array(sys_dict['Plist'],float)
+        logger.info("Using Plist")
+    else:
+        raise ValueError('Plist is not specified')
+
+    if 'zilist' in sys_dict:
+        zi_list = np.array(sys_dict['zilist'],float)
+        logger.info("Using zilist")
+    else:
+        raise ValueError('zilist is not specified')
+
+    l_x = len(zi_list)
+    if len(T_list) != l_x:
+        if len(T_list) == 1:
+            T_list = np.ones(l_x)*T_list[0]
+            logger.info("The same temperature, {}, was used for all mole fraction values".format(T_list[0]))
+        else:
+            raise ValueError("The number of provided temperatures and mole fraction sets are different")
+    if len(P_list) != l_x:
+        if len(P_list) == 1:
+            P_list = np.ones(l_x)*P_list[0]
+            logger.info("The same pressure, {}, was used for all mole fraction values".format(P_list[0]))
+        else:
+            raise ValueError("The number of provided pressures and mole fraction sets are different")
+
+    ## Optional values
+    opts = {}
+
+    # Extract rho dict
+    if "rhodict" in sys_dict:
+        logger.info("Accepted options for P vs. density curve")
+        opts["rhodict"] = sys_dict["rhodict"]
+
+    # Extract flash options
+    if "flash options" in sys_dict:
+        logger.info("Accepted options for flash calculation")
+        opts.update(sys_dict["flash options"])
+
+    # Extract number of processes
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+    else:
+        threads = 1
+
+    ## Initial K-values and vapor fractions for all feeds
+    if "rhodict" in opts:
+        Ki_list = calc.calc_wilson_K(P_list, T_list, eos, rhodict=opts["rhodict"])
+    else:
+        Ki_list = calc.calc_wilson_K(P_list, T_list, eos)
+    beta0 = np.atleast_1d(calc.calc_rachford_rice(zi_list, Ki_list))
+    logger.info("Wilson K-values predict {} of {} feeds to have two phases".format(np.sum(np.logical_and(beta0 > 0., beta0 < 1.)), l_x))
+
+    ## Flash
+    l_c = zi_list.shape[1]
+    xi_list = np.zeros((l_x,l_c))
+    yi_list = np.zeros((l_x,l_c))
+    beta_list = np.zeros(l_x)
+    flagl_list = np.zeros(l_x)
+    flagv_list = np.zeros(l_x)
+
+    batches = parallelization.contiguous_batches(l_x, threads)
+    inputs = [(P_list[ind], T_list[ind], zi_list[ind], Ki_list[ind], opts) for ind in batches]
+    output = parallelization.batch_jobs(_flash_batch, inputs, eos, ncores=threads)
+
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                xi_list[i], yi_list[i], beta_list[i] = np.nan, np.nan, np.nan
+                flagl_list[i], flagv_list[i] = 3, 3
+            else:
+                xi_list[i], yi_list[i], beta_list[i], flagl_list[i], flagv_list[i] = batch_output[j]
+
+    logger.info("--- Calculation flash Complete ---")
+
+    return {"T":T_list,"P":P_list,"zi":zi_list,"beta":beta_list,"xi":xi_list,"yi":yi_list,"flagl":flagl_list,"flagv":flagv_list}
+
+def _flash_batch(eos, inputs):
+
+    r"""
+    Flash a series of feeds. If a feed has two phases, its K-values are the initial guess for the next feed.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    inputs : tuple
+        Arrays of pressures, temperatures, feed mole fractions, and Wilson K-values, and a dictionary of keyword arguments for :func:`~despasito.thermodynamics.calc.calc_PT_phase`
+
+    Returns
+    -------
+    output : list[tuple]
+        Liquid mole fractions, vapor mole fractions, vapor fraction, liquid flag, and vapor flag for each feed
+    """
+
+    logger = logging.getLogger(__name__)
+
+    P_list, T_list, zi_list, Ki_list, opts = inputs
+
+    output = []
+    Ki_prev = None
+    for i in range(len(T_list)):
+        logger.info("P (Pa), T (K), zi: {} {} {}, Let's Begin!".format(P_list[i], T_list[i], zi_list[i]))
+        # Start from the previous two phase solution, unless Wilson K-values predict a single phase
+        beta = calc.calc_rachford_rice(zi_list[i], Ki_list[i])
+        if Ki_prev is not None and 0. < beta < 1.:
+            Ki = Ki_prev
+        else:
+            Ki = Ki_list[i]
+        try:
+            output.append(calc.calc_PT_phase(P_list[i], T_list[i], zi_list[i], eos, Ki=np.copy(Ki), **opts))
+        except:
+            logger.warning("P (Pa), T (K), zi: {} {} {}, calculation did not produce a valid result.".format(P_list[i], T_list[i], zi_list[i]))
+            logger.debug("Calculation Failed:", exc_info=True)
+            output.append((np.nan, np.nan, np.nan, 3, 3))
+            Ki_prev = None
+            continue
+
+        xi, yi, beta = output[-1][:3]
+        if 0. < beta < 1.:
+            Ki_prev = np.where(xi > 0., yi / np.where(xi > 0., xi, 1.0), 1.0)
+        else:
+            Ki_prev = None
+
+    return output
 
 ######################################################################
 #                                                                    #
@@ -342,6 +719,13 @@ def sat_props(eos, sys_dict):
         logger.info("Accepted options for P vs. density curve")
         opts["rhodict"] = sys_dict["rhodict"]
 
+    # Extract number of processes
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+    else:
+        threads = 1
+
     ## Calculate saturation properties
     l_x = len(T_list)
     T_list = np.array(T_list)
@@ -349,22 +733,64 @@ def sat_props(eos, sys_dict):
     rholsat = np.zeros(l_x)
     rhovsat = np.zeros(l_x)
 
-    for i in range(l_x):
+    batches = parallelization.contiguous_batches(l_x, threads)
+    inputs = [(T_list[ind], xi_list[ind], opts) for ind in batches]
+    output = parallelization.batch_jobs(_sat_props_batch, inputs, eos, ncores=threads)
 
-        logger.info("T (K), xi: {} {}, Let's Begin!".format(str(T_list[i]), str(xi_list[i])))
-        Psat[i], rholsat[i], rhovsat[i] = calc.calc_Psat(T_list[i], xi_list[i], eos, **opts)
-        if np.isnan(Psat[i]):
-            logger.warning("T (K), xi: {} {}, calculation did not produce a valid result.".format(str(T_list[i]), str(xi_list[i])))
-            logger.debug("Calculation Failed:", exc_info=True)
-            Psat[i], rholsat[i], rhovsat[i] = [np.nan, np.nan, np.nan]
-            continue
-        logger.info("Psat {} Pa, rhol {}, rhov {}".format(Psat[i],rholsat[i],rhovsat[i]))
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                Psat[i], rholsat[i], rhovsat[i] = [np.nan, np.nan, np.nan]
+            else:
+                Psat[i], rholsat[i], rhovsat[i] = batch_output[j]
 
     logger.info("--- Calculation sat_props Complete ---")
 
     return {"T":T_list,"Psat":Psat,"rhol":rholsat,"rhov":rhovsat}
 
 
+def _sat_props_batch(eos, inputs):
+
+    r"""
+    Computes the saturated pressure, liquid, and gas density of a series of state points.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    inputs : tuple
+        Array of temperatures, array of mole fractions, and a dictionary of keyword arguments for :func:`~despasito.thermodynamics.calc.calc_Psat`
+
+    Returns
+    -------
+    output : list[tuple]
+        Saturation pressure, liquid density, and vapor density for each point
+    """
+
+    logger = logging.getLogger(__name__)
+
+    T_list, xi_list, opts = inputs
+
+    output = []
+    for i in range(len(T_list)):
+
+        logger.info("T (K), xi: {} {}, Let's Begin!".format(str(T_list[i]), str(xi_list[i])))
+        try:
+            Psat, rholsat, rhovsat = calc.calc_Psat(T_list[i], xi_list[i], eos, **opts)
+        except:
+            logger.warning("T (K), xi: {} {}, calculation did not produce a valid result.".format(str(T_list[i]), str(xi_list[i])))
+            logger.debug("Calculation Failed:", exc_info=True)
+            output.append((np.nan, np.nan, np.nan))
+            continue
+        if np.isnan(Psat):
+            logger.warning("T (K), xi: {} {}, calculation did not produce a valid result.".format(str(T_list[i]), str(xi_list[i])))
+            output.append((np.nan, np.nan, np.nan))
+            continue
+        logger.info("Psat {} Pa, rhol {}, rhov {}".format(Psat,rholsat,rhovsat))
+        output.append((Psat, rholsat, rhovsat))
+
+    return output
+
 ######################################################################
 #                                                                    #
 #                Liquid density given xi, T, and P                   #
@@ -434,21 +860,31 @@ def liquid_properties(eos, sys_dict):
         logger.info("Accepted options for P vs. density curve")
         opts["rhodict"] = sys_dict["rhodict"]
 
+    # Extract number of processes
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+    else:
+        threads = 1
+
     ## Calculate liquid density
     l_x = len(T_list)
     T_list = np.array(T_list)
     rhol = np.zeros(l_x)
     phil = []
-    for i in range(l_x):
-        rhol[i], flagl = calc.calc_rhol(P_list[i], T_list[i], xi_list[i], eos, **opts)
 
-        if np.isnan(rhol[i]):
-            logger.warning('Failed to calculate rhol at {}'.format(T_list[i]))
-            phil[i] = np.nan
-        else:
-            phil_tmp = eos.fugacity_coefficient(P_list[i], np.array([rhol[i]]), xi_list[i], T_list[i])
-            phil.append(phil_tmp)
-            logger.info("P {} Pa, T {} K, xi {}, rhol {}, phil {}".format(P_list[i],T_list[i],xi_list[i],rhol[i],phil_tmp))
+    batches = parallelization.contiguous_batches(l_x, threads)
+    inputs = [(P_list[ind], T_list[ind], xi_list[ind], "liquid", opts) for ind in batches]
+    output = parallelization.batch_jobs(_fluid_properties_batch, inputs, eos, ncores=threads)
+
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                rhol[i] = np.nan
+                phil.append(np.nan)
+            else:
+                rhol[i] = batch_output[j][0]
+                phil.append(batch_output[j][1])
 
     logger.info("--- Calculation liquid_properties Complete ---")
 
@@ -523,25 +959,83 @@ def vapor_properties(eos, sys_dict):
         logger.info("Accepted options for P vs. density curve")
         opts["rhodict"] = sys_dict["rhodict"]
 
+    # Extract number of processes
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+    else:
+        threads = 1
+
     ## Calculate vapor density
     l_x = len(T_list)
     T_list = np.array(T_list)
     rhov = np.zeros(l_x)
     phiv = []
-    for i in range(l_x):
-        rhov[i], flagv = calc.calc_rhov(P_list[i], T_list[i], yi_list[i], eos, **opts)
-        if np.isnan(rhov[i]):
-            logger.warning('Failed to calculate rhov at {}'.format(T_list[i]))
-            phiv[i] = np.nan
-        else:
-            phiv_tmp = eos.fugacity_coefficient(P_list[i], np.array([rhov[i]]), yi_list[i], T_list[i])
-            phiv.append(phiv_tmp)
-            logger.info("P {} Pa, T {} K, yi {}, rhov {}, phiv {}".format(P_list[i],T_list[i],yi_list[i],rhov[i],phiv_tmp))
+
+    batches = parallelization.contiguous_batches(l_x, threads)
+    inputs = [(P_list[ind], T_list[ind], yi_list[ind], "vapor", opts) for ind in batches]
+    output = parallelization.batch_jobs(_fluid_properties_batch, inputs, eos, ncores=threads)
+
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                rhov[i] = np.nan
+                phiv.append(np.nan)
+            else:
+                rhov[i] = batch_output[j][0]
+                phiv.append(batch_output[j][1])
 
     logger.info("--- Calculation vapor_properties Complete ---")
 
     return {"P":P_list,"T":T_list,"yi":yi_list,"rhov":rhov,"phiv":phiv}
 
+def _fluid_properties_batch(eos, inputs):
+
+    r"""
+    Computes the density and fugacity coefficients of a series of state points for either the liquid or vapor phase.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    inputs : tuple
+        Array of pressures, array of temperatures, array of mole fractions, the phase ("liquid" or "vapor"), and a dictionary of keyword arguments for :func:`~despasito.thermodynamics.calc.calc_rhol` or :func:`~despasito.thermodynamics.calc.calc_rhov`
+
+    Returns
+    -------
+    output : list[tuple]
+        Density and fugacity coefficients for each point
+    """
+
+    logger = logging.getLogger(__name__)
+
+    P_list, T_list, zi_list, phase, opts = inputs
+
+    if phase == "liquid":
+        calc_rho = calc.calc_rhol
+    else:
+        calc_rho = calc.calc_rhov
+
+    output = []
+    for i in range(len(T_list)):
+        try:
+            rho, flag = calc_rho(P_list[i], T_list[i], zi_list[i], eos, **opts)
+            if not np.isnan(rho):
+                phi = eos.fugacity_coefficient(P_list[i], np.array([rho]), zi_list[i], T_list[i])
+        except:
+            logger.warning('Failed to calculate {} density at {}'.format(phase,T_list[i]))
+            logger.debug("Calculation Failed:", exc_info=True)
+            output.append((np.nan, np.nan))
+            continue
+        if np.isnan(rho):
+            logger.warning('Failed to calculate {} density at {}'.format(phase,T_list[i]))
+            output.append((np.nan, np.nan))
+        else:
+            output.append((rho, phi))
+            logger.info("P {} Pa, T {} K, zi {}, {} density {}, phi {}".format(P_list[i],T_list[i],zi_list[i],phase,rho,phi))
+
+    return output
+
 ######################################################################
 #                                                                    #
 #               Solubility Parameter given xi and T                  #
@@ -621,10 +1115,17 @@ def solubility_parameter(eos, sys_dict):
     else:
         rhodict = {}
 
+    if "threads" in sys_dict:
+        threads = sys_dict["threads"]
+        logger.info("Using {} processes to compute state points".format(threads))
+        del sys_dict['threads']
+    else:
+        threads = 1
+
     ## Optional values
     opts = {}
-    for key, val in sys_dict.items():
-        if key in ['dT', 'tol']:
+    for key, val in list(sys_dict.items()):
+        if key in ['dT', 'tol', 'method']:
             opts[key] = val
             del sys_dict[key]
 
@@ -634,24 +1135,64 @@ def solubility_parameter(eos, sys_dict):
     l_x = len(T_list)
     rhol = np.zeros(l_x)
     delta = np.zeros(l_x)
-    for i in range(l_x):
-        # Find rhol
-        if (i==0 or ([P_list[i], T_list[i]] != [P_list[i-1], T_list[i-1]])):
-            rhol[i], flag = calc.calc_rhol(P_list[i], T_list[i], xi_list[i], eos, rhodict=rhodict)
-        else:
-            rhol[i] = rhol[i-1]
 
-        if flag not in [1,2]:
-            logger.error('Failed to calculate rhov at {}, flag {}'.format(T_list[i],flag))
-            delta[i] = np.nan
-        else:
-            delta[i] = calc.hildebrand_solubility(rhol[i], xi_list[i], T_list[i], eos, **opts)
-            logger.info("P {} Pa, T {} K, xi {}, rhol {}, delta {}".format(P_list[i],T_list[i],xi_list[i],rhol[i],delta[i]))
+    batches = parallelization.contiguous_batches(l_x, threads)
+    inputs = [(P_list[ind], T_list[ind], xi_list[ind], rhodict, opts) for ind in batches]
+    output = parallelization.batch_jobs(_solubility_parameter_batch, inputs, eos, ncores=threads)
+
+    for ind, batch_output in zip(batches, output):
+        for j, i in enumerate(ind):
+            if batch_output is None:
+                rhol[i], delta[i] = np.nan, np.nan
+            else:
+                rhol[i], delta[i] = batch_output[j]
 
     logger.info("--- Calculation solubility_parameter Complete ---")
 
     return {"P":P_list,"T":T_list,"xi":xi_list,"rhol":rhol,"delta":delta}
 
+def _solubility_parameter_batch(eos, inputs):
 
+    r"""
+    Calculate the Hildebrand solubility parameter of a series of state points. The liquid density is reused if the pressure and temperature are the same as the previous point.
+    
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    inputs : tuple
+        Array of pressures, array of temperatures, array of mole fractions, dictionary of options for :func:`~despasito.thermodynamics.calc.PvsRho`, and dictionary of keyword arguments for :func:`~despasito.thermodynamics.calc.hildebrand_solubility`
+
+    Returns
+    -------
+    output : list[tuple]
+        Liquid density and solubility parameter for each point
+    """
 
+    logger = logging.getLogger(__name__)
+
+    P_list, T_list, xi_list, rhodict, opts = inputs
+
+    output = []
+    for i in range(len(T_list)):
+        try:
+            # Find rhol, unless it was found for the same pressure and temperature at the previous point
+            if (i==0 or np.isnan(rhol) or ([P_list[i], T_list[i]] != [P_list[i-1], T_list[i-1]])):
+                rhol, flag = np.nan, 3
+                rhol, flag = calc.calc_rhol(P_list[i], T_list[i], xi_list[i], eos, rhodict=rhodict)
+
+            if flag not in [1,2]:
+                logger.error('Failed to calculate rhol at {}, flag {}'.format(T_list[i],flag))
+                output.append((rhol, np.nan))
+                continue
+            delta = calc.hildebrand_solubility(rhol, xi_list[i], T_list[i], eos, rhodict=rhodict, **opts)
+        except:
+            logger.warning("P (Pa), T (K), xi: {} {} {}, calculation did not produce a valid result.".format(P_list[i], T_list[i], xi_list[i]))
+            logger.debug("Calculation Failed:", exc_info=True)
+            output.append((rhol, np.nan))
+            continue
+        else:
+            output.append((rhol, delta))
+            logger.info("P {} Pa, T {} K, xi {}, rhol {}, delta {}".format(P_list[i],T_list[i],xi_list[i],rhol,delta))
 
+    return output
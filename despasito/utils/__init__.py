@@ -0,0 +1,6 @@
+"""
+Utilities
+
+Tools shared by the thermodynamics and parameter fitting modules that aren't specific to a calculation, such as distributing independent calculations over multiple processes.
+
+"""
@@ -0,0 +1,219 @@
+"""
+This module contains tools to distribute independent calculations over multiple processes. Each worker process holds its own copy of the eos object, so that values stored within it (e.g. critical points) are kept between the calculations assigned to that worker.
+    
+"""
+
+import multiprocessing
+import traceback
+import logging
+import numpy as np
+
+# EOS object held by each worker process
+_worker_eos = None
+
+def _initialize_worker(eos):
+    r"""
+    Store a copy of the eos object in the worker process.
+
+    Parameters
+    ----------
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    """
+
+    global _worker_eos
+    _worker_eos = eos
+
+def _worker_job(args):
+    r"""
+    Evaluate a function with the eos object of this worker process. Any exception is caught so that the other jobs are unaffected.
+
+    Parameters
+    ----------
+    args : tuple
+        The function, with arguments (eos, inputs), and its inputs
+
+    Returns
+    -------
+    success : bool
+        True if the function was evaluated without an exception
+    output : obj
+        Output of the function, or the traceback if it failed
+    """
+
+    func, inputs = args
+    try:
+        return True, func(_worker_eos, inputs)
+    except Exception:
+        return False, traceback.format_exc()
+
+class MultiprocessingJob(object):
+    r"""
+    Pool of worker processes, each with their own copy of an eos object.
+    
+    """
+
+    def __init__(self, eos, ncores=-1):
+        r"""
+            
+        Parameters
+        ----------
+        eos : obj
+            An instance of the defined EOS class to be used in thermodynamic computations.
+        ncores : int, Optional, default: -1
+            Number of processes used. A value of -1 uses all available cores.
+
+        Attributes
+        ----------
+        ncores : int
+            Number of processes used
+        pool : obj
+            multiprocessing.Pool object
+            
+        """
+
+        logger = logging.getLogger(__name__)
+
+        if ncores == -1:
+            ncores = multiprocessing.cpu_count()
+        self.ncores = ncores
+        self.pool = multiprocessing.Pool(self.ncores, initializer=_initialize_worker, initargs=(eos,))
+        logger.info("Started pool of {} processes".format(self.ncores))
+
+    def pool_job(self, func, inputs):
+        r"""
+        Evaluate a function for each set of inputs with the pool of workers.
+
+        Parameters
+        ----------
+        func : function
+            Module level function with the arguments (eos, inputs)
+        inputs : list
+            List of inputs for each job
+
+        Returns
+        -------
+        output : list
+            Output of each job in the order of the given inputs. A job that raised an exception returns None.
+        """
+
+        logger = logging.getLogger(__name__)
+
+        results = self.pool.map(_worker_job, [(func, x) for x in inputs])
+
+        output = []
+        for i, (success, value) in enumerate(results):
+            if success:
+                output.append(value)
+            else:
+                logger.warning("Job {} of {} failed:\n{}".format(i, func.__name__, value))
+                output.append(None)
+
+        return output
+
+    @staticmethod
+    def serial_job(func, inputs, eos):
+        r"""
+        Evaluate a function for each set of inputs in the current process.
+
+        Parameters
+        ----------
+        func : function
+            Function with the arguments (eos, inputs)
+        inputs : list
+            List of inputs for each job
+        eos : obj
+            An instance of the defined EOS class to be used in thermodynamic computations.
+
+        Returns
+        -------
+        output : list
+            Output of each job in the order of the given inputs. A job that raised an exception returns None.
+        """
+
+        logger = logging.getLogger(__name__)
+
+        output = []
+        for i, x in enumerate(inputs):
+            try:
+                output.append(func(eos, x))
+            except Exception:
+                logger.warning("Job {} of {} failed:\n{}".format(i, func.__name__, traceback.format_exc()))
+                output.append(None)
+
+        return output
+
+    def end_pool(self):
+        r"""
+        Close the pool and wait for the worker processes to exit.
+        """
+
+        self.pool.close()
+        self.pool.join()
+
+def batch_jobs(func, inputs, eos, ncores=1):
+    r"""
+    Evaluate a function for each set of inputs, in parallel if more than one core is requested.
+
+    A pool is only started if there is more than one job, and is never started from within a worker process, where the jobs are evaluated serially.
+
+    Parameters
+    ----------
+    func : function
+        Module level function with the arguments (eos, inputs)
+    inputs : list
+        List of inputs for each job
+    eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    ncores : int, Optional, default: 1
+        Number of processes used. A value of -1 uses all available cores.
+
+    Returns
+    -------
+    output : list
+        Output of each job in the order of the given inputs. A job that raised an exception returns None.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    if ncores == -1:
+        ncores = multiprocessing.cpu_count()
+    ncores = min(ncores, len(inputs))
+
+    if ncores > 1 and multiprocessing.current_process().daemon:
+        logger.debug("Jobs within a worker process are evaluated serially")
+        ncores = 1
+
+    if ncores > 1:
+        job = MultiprocessingJob(eos, ncores=ncores)
+        try:
+            output = job.pool_job(func, inputs)
+        finally:
+            job.end_pool()
+    else:
+        output = MultiprocessingJob.serial_job(func, inputs, eos)
+
+    return output
+
+def contiguous_batches(npoints, ncores=1):
+    r"""
+    Split a series of points into contiguous batches, one for each process.
+
+    Parameters
+    ----------
+    npoints : int
+        Number of points
+    ncores : int, Optional, default: 1
+        Number of processes used. A value of -1 uses all available cores.
+
+    Returns
+    -------
+    batches : list[numpy.ndarray]
+        Indices of the points in each batch
+    """
+
+    if ncores == -1:
+        ncores = multiprocessing.cpu_count()
+    nbatches = max(1, min(ncores, npoints))
+
+    return [x for x in np.array_split(np.arange(npoints), nbatches) if len(x)]
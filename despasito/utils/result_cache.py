@@ -0,0 +1,183 @@
+"""
+This module contains a persistent store of thermodynamic results for individual state points. Each result is saved in a local SQLite database under a hash of the EOS definition, calculation type, calculation options, and state of the point, so that repeated calculations with the same input files are read instead of recomputed.
+
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import contextlib
+import numpy as np
+
+def _json_default(obj):
+    r"""
+    Convert numpy objects so that they may be written with json.
+
+    Parameters
+    ----------
+    obj : obj
+        Object that json couldn't serialize
+
+    Returns
+    -------
+    new_obj : obj
+        List or float equivalent of a numpy object
+    """
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    else:
+        raise TypeError("Object of type {} cannot be written to the result cache".format(type(obj).__name__))
+
+class ResultCache(object):
+    r"""
+    Size bounded store of results for individual state points. When the number of entries exceeds the maximum, those that were least recently used are removed.
+
+    """
+
+    default_path = os.path.join(os.path.expanduser("~"), ".cache", "despasito", "results.sqlite")
+
+    def __init__(self, path=None, max_entries=100000):
+        r"""
+
+        Parameters
+        ----------
+        path : str, Optional, default: None
+            Database file. If None, ~/.cache/despasito/results.sqlite is used.
+        max_entries : int, Optional, default: 100000
+            Maximum number of stored state points
+
+        Attributes
+        ----------
+        path : str
+            Database file
+        max_entries : int
+            Maximum number of stored state points
+
+        """
+
+        logger = logging.getLogger(__name__)
+
+        if path is None:
+            path = self.default_path
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self.max_entries = max_entries
+
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT, accessed REAL)")
+        logger.info("Using result cache: {}".format(self.path))
+
+    @contextlib.contextmanager
+    def _connect(self):
+        r"""
+        Open a connection to the database for one transaction, which is committed if no exception is raised.
+
+        Returns
+        -------
+        connection : obj
+            sqlite3.Connection object
+        """
+
+        connection = sqlite3.connect(self.path, timeout=60.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def key(eos_inputs, calctype, options, state):
+        r"""
+        Hash the information that determines the result of a state point.
+
+        Parameters
+        ----------
+        eos_inputs : dict
+            EOS type and the dictionary used to create the eos object
+        calctype : str
+            Calculation type from :mod:`~despasito.thermodynamics.calc_types`
+        options : dict
+            Options of the calculation shared by all state points
+        state : dict
+            Input values of this state point (e.g. temperature and composition)
+
+        Returns
+        -------
+        key : str
+            Hexadecimal SHA-256 digest
+        """
+
+        import despasito
+
+        content = {"version": despasito.__version__, "eos": eos_inputs, "calculation_type": calctype, "options": options, "state": state}
+        string = json.dumps(content, sort_keys=True, default=_json_default)
+
+        return hashlib.sha256(string.encode("utf-8")).hexdigest()
+
+    def get(self, keys):
+        r"""
+        Read stored results.
+
+        Parameters
+        ----------
+        keys : list[str]
+            Keys of state points
+
+        Returns
+        -------
+        values : list
+            Dictionary of results for each key, or None if it isn't stored
+        """
+
+        values = [None for x in keys]
+        index = {key: i for i, key in enumerate(keys)}
+        with self._connect() as connection:
+            for i in range(0, len(keys), 500):
+                subset = keys[i:i+500]
+                rows = connection.execute("SELECT key, value FROM results WHERE key IN ({})".format(",".join("?"*len(subset))), subset).fetchall()
+                for key, value in rows:
+                    values[index[key]] = json.loads(value)
+                connection.execute("UPDATE results SET accessed = ? WHERE key IN ({})".format(",".join("?"*len(subset))), [time.time()] + subset)
+
+        return values
+
+    def set(self, keys, values):
+        r"""
+        Store results and remove the least recently used entries beyond the maximum number of entries.
+
+        Parameters
+        ----------
+        keys : list[str]
+            Keys of state points
+        values : list[dict]
+            Dictionary of results for each key
+        """
+
+        logger = logging.getLogger(__name__)
+
+        now = time.time()
+        rows = [(key, json.dumps(value, default=_json_default), now) for key, value in zip(keys, values)]
+        with self._connect() as connection:
+            connection.executemany("INSERT OR REPLACE INTO results (key, value, accessed) VALUES (?, ?, ?)", rows)
+            nentries = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if nentries > self.max_entries:
+                connection.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed ASC LIMIT ?)", (nentries - self.max_entries,))
+                logger.info("Removed {} least recently used entries from the result cache".format(nentries - self.max_entries))
+
+    def clear(self):
+        r"""
+        Remove all stored results.
+        """
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+